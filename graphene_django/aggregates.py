@@ -0,0 +1,110 @@
+from collections import OrderedDict
+from functools import partial
+
+from django.db import models
+from django.db.models.query import QuerySet
+from graphene import Date, DateTime, Field, Float, Int, ObjectType, Time
+from graphene.utils.str_converters import to_camel_case
+
+from .utils import get_selections
+
+AGGREGATES = OrderedDict(
+    [
+        ("sum", models.Sum),
+        ("avg", models.Avg),
+        ("min", models.Min),
+        ("max", models.Max),
+    ]
+)
+
+# The aggregates that can be computed for each kind of model field,
+# and the GraphQL type of min, max and sum
+NUMERIC_AGGREGATES = ("sum", "avg", "min", "max")
+ORDERED_AGGREGATES = ("min", "max")
+
+AGGREGATE_FIELD_TYPES = (
+    (models.DateTimeField, DateTime, ORDERED_AGGREGATES),
+    (models.DateField, Date, ORDERED_AGGREGATES),
+    (models.TimeField, Time, ORDERED_AGGREGATES),
+    (models.DecimalField, Float, NUMERIC_AGGREGATES),
+    (models.FloatField, Float, NUMERIC_AGGREGATES),
+    (models.IntegerField, Int, NUMERIC_AGGREGATES),
+    (models.AutoField, Int, NUMERIC_AGGREGATES),
+)
+
+
+def get_aggregate_field_type(model, name):
+    """ The GraphQL type and the possible aggregates of a model field """
+    field = model._meta.get_field(name)
+    for field_class, graphql_type, aggregates in AGGREGATE_FIELD_TYPES:
+        if isinstance(field, field_class):
+            return graphql_type, aggregates
+    raise AssertionError(
+        "Can't aggregate the field {} of {}, only numbers and dates.".format(
+            name, model.__name__
+        )
+    )
+
+
+def get_aggregates(model, aggregate_fields):
+    """ Return an OrderedDict with the name and the (GraphQL type, Django
+        aggregate) of each aggregate declared in aggregate_fields, that
+        is either a list of fields (with all their aggregates) or a dict of
+        field name to list of aggregates, as filter_fields.
+    """
+    if not isinstance(aggregate_fields, dict):
+        aggregate_fields = OrderedDict((name, None) for name in aggregate_fields)
+
+    aggregates = OrderedDict()
+    for name, field_aggregates in aggregate_fields.items():
+        graphql_type, possible_aggregates = get_aggregate_field_type(model, name)
+        for aggregate in field_aggregates or possible_aggregates:
+            assert aggregate in possible_aggregates, (
+                "Can't compute the {} of the field {} of {}."
+            ).format(aggregate, name, model.__name__)
+            aggregate_type = Float if aggregate == "avg" else graphql_type
+            aggregates["{}_{}".format(name, aggregate)] = (
+                aggregate_type,
+                AGGREGATES[aggregate](name),
+            )
+    return aggregates
+
+
+def resolve_aggregates(aggregates, connection, info):
+    """ Compute the selected aggregates on the queryset of the connection
+        (with its filters but without pagination), in a single query.
+    """
+    values = {"count": connection.length}
+    expressions = {}
+    for selected in get_selections(info):
+        # The field names are camel cased unless the schema doesn't auto
+        # camel case them
+        for name, (_, expression) in aggregates.items():
+            if selected in (name, to_camel_case(name)):
+                expressions[name] = expression
+
+    if expressions:
+        iterable = connection.iterable
+        if isinstance(iterable, QuerySet):
+            values.update(iterable.order_by().aggregate(**expressions))
+    return values
+
+
+def get_aggregates_field(node_type_name, model, aggregate_fields):
+    """ The field with the aggregates of a connection """
+    aggregates = get_aggregates(model, aggregate_fields)
+    attrs = OrderedDict(
+        [("count", Int(required=True, description="Number of nodes"))]
+    )
+    for name, (aggregate_type, _) in aggregates.items():
+        attrs[name] = aggregate_type()
+
+    aggregates_type = type(
+        str("{}Aggregates".format(node_type_name)), (ObjectType,), attrs
+    )
+    return Field(
+        aggregates_type,
+        resolver=partial(resolve_aggregates, aggregates),
+        required=True,
+        description="Aggregates of all the nodes, regardless of the pagination",
+    )
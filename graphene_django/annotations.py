@@ -0,0 +1,138 @@
+from collections import OrderedDict
+from functools import partial
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from graphene import Field, Int
+from graphene.utils.str_converters import to_camel_case
+
+from .utils import get_selections
+
+
+def get_count_queryset(model, name):
+    """ The rows related to each object of the model through the given
+        reverse foreign key or many to many relation, and the name of the
+        column pointing to the object
+    """
+    field = model._meta.get_field(name)
+    assert field.one_to_many or field.many_to_many, (
+        "Can only count the reverse foreign keys and many to many relations "
+        "of {}, received {}."
+    ).format(model.__name__, name)
+
+    if field.many_to_many:
+        # Count the rows of the through table, without joining the other model
+        if field.auto_created:
+            through = field.through
+            column = field.field.m2m_reverse_field_name()
+        else:
+            through = field.remote_field.through
+            column = field.m2m_field_name()
+        return through._default_manager.all(), column
+    return field.related_model._default_manager.all(), field.field.name
+
+
+def get_count_expression(model, name):
+    """ A correlated subquery with the number of related rows, that doesn't
+        join the relation in the query of the model (so it isn't affected by
+        its filters nor multiplies its rows)
+    """
+    queryset, column = get_count_queryset(model, name)
+    counts = (
+        queryset.filter(**{column: OuterRef("pk")})
+        .order_by()
+        .values(column)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def get_accessor_name(model, name):
+    field = model._meta.get_field(name)
+    if field.auto_created and not field.concrete:
+        return field.get_accessor_name()
+    return field.name
+
+
+def resolve_annotation(name, fallback, root, info):
+    """ The annotated value, or the fallback if the object comes from a
+        queryset without the annotation (as the ones of get_node)
+    """
+    if name in root.__dict__:
+        return root.__dict__[name]
+    return fallback(root)
+
+
+def annotate_object(name, expression, root):
+    """ Compute the expression for an object loaded without it """
+    return (
+        type(root)
+        ._default_manager.filter(pk=root.pk)
+        .annotate(**{name: expression})
+        .values_list(name, flat=True)
+        .get()
+    )
+
+
+def count_related(accessor, root):
+    return getattr(root, accessor).count()
+
+
+def get_count_fields(model, count_fields):
+    """ Return an OrderedDict with the name and the (field, expression)
+        of the count field of each relation of count_fields
+    """
+    fields = OrderedDict()
+    for relation in count_fields:
+        name = "{}_count".format(relation)
+        fallback = partial(count_related, get_accessor_name(model, relation))
+        field = Field(
+            Int,
+            required=True,
+            resolver=partial(resolve_annotation, name, fallback),
+            description="Number of {}".format(relation),
+        )
+        fields[name] = (field, get_count_expression(model, relation))
+    return fields
+
+
+def get_annotated_fields(cls):
+    """ Return an OrderedDict with the name and the (field, expression) of
+        the AnnotatedFields declared in the type or its bases
+    """
+    from .fields import AnnotatedField
+
+    fields = OrderedDict()
+    for base in reversed(cls.__mro__):
+        for name, field in base.__dict__.items():
+            if isinstance(field, AnnotatedField):
+                has_resolver = getattr(cls, "resolve_{}".format(name), None)
+                if field.resolver is None and not has_resolver:
+                    field.resolver = partial(
+                        resolve_annotation,
+                        name,
+                        partial(annotate_object, name, field.expression),
+                    )
+                fields[name] = (field, field.expression)
+    return fields
+
+
+def get_node_selections(info):
+    """ The fields selected in the nodes of the connection being resolved """
+    edges = get_selections(info).get("edges")
+    nodes = edges and get_selections(info, edges).get("node")
+    return get_selections(info, nodes) if nodes else OrderedDict()
+
+
+def annotate_queryset(queryset, node_type, selections):
+    """ Add the annotations of the selected fields of the node type """
+    annotations = OrderedDict()
+    for name, expression in node_type._meta.annotations.items():
+        # The field names are camel cased unless the schema doesn't auto
+        # camel case them
+        if name in selections or to_camel_case(name) in selections:
+            annotations[name] = expression
+    if not annotations:
+        return queryset
+    return queryset.annotate(**annotations)
@@ -2,14 +2,14 @@ from functools import wraps
 from django.core.exceptions import PermissionDenied
 from ..fields import DjangoConnectionField
 
-from .utils import has_perm
+from .utils import field_has_perm
 
 
 def node_require_permission(permissions):
     def require_permission_decorator(func):
         @wraps(func)
         def func_wrapper(cls, info, id):
-            if has_perm(permissions=permissions, context=info.context):
+            if field_has_perm(permissions, info):
                 return func(cls, info, id)
             raise PermissionDenied('Permission Denied')
         return func_wrapper
@@ -20,7 +20,7 @@ def mutation_require_permission(permissions):
     def require_permission_decorator(func):
         @wraps(func)
         def func_wrapper(cls, root, info, **input):
-            if has_perm(permissions=permissions, context=info.context):
+            if field_has_perm(permissions, info):
                 return func(cls, root, info, **input)
             return cls(errors=PermissionDenied('Permission Denied'))
         return func_wrapper
@@ -33,7 +33,7 @@ def connection_require_permission(permissions):
         def func_wrapper(
                 cls, resolver, connection, default_manager, max_limit,
                 enforce_first_or_last, root, info, **args):
-            if has_perm(permissions=permissions, context=info.context):
+            if field_has_perm(permissions, info):
                 return func(
                     cls, resolver, connection, default_manager, max_limit,
                     enforce_first_or_last, root, info, **args)
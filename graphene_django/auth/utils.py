@@ -3,6 +3,9 @@ Auth utils module.
 
 Define some functios to authorize user to user mutations or nodes.
 """
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
 
 
 def is_related_to_user(object_instance, user, field):
@@ -15,13 +18,85 @@ def is_related_to_user(object_instance, user, field):
 
 
 def is_authorized_to_mutate_object(model, user, id, field):
-    """Return True when the when the user is unauthorized."""
-    object_instance = model.objects.get(pk=id)
-    if is_related_to_user(object_instance, user, field):
-        return True
+    """Return True when the object is related to the user, checked in the query."""
+    if user is None or getattr(user, 'pk', None) is None:
+        return False
+    return model.objects.filter(pk=id, **{field: user}).exists()
+
+
+def lookup_spans_many(model, lookup):
+    """Return True when the lookup follows a relation to many objects."""
+    for name in lookup.split(LOOKUP_SEP):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        if field.one_to_many or field.many_to_many:
+            return True
+        if not field.is_relation:
+            return False
+        model = field.related_model
     return False
 
 
+def filter_owned(queryset, owner_fields, context):
+    """
+    Return the objects of the queryset related to the user of the context by
+    any of the owner_fields (lookups to the user), filtered in the query.
+    """
+    user = getattr(context, 'user', None)
+    if user is None or not is_authenticated(user):
+        return queryset.none()
+
+    condition = Q()
+    for lookup in owner_fields:
+        condition |= Q(**{lookup: user})
+    model = queryset.model
+    if any(lookup_spans_many(model, lookup) for lookup in owner_fields):
+        # A subquery, so the joins don't return the same object many times
+        return queryset.filter(pk__in=model._base_manager.filter(condition).values('pk'))
+    return queryset.filter(condition)
+
+
+def is_authenticated(user):
+    """Return True when the user is authenticated (also in old Django versions)."""
+    authenticated = user.is_authenticated
+    if callable(authenticated):
+        authenticated = authenticated()
+    return bool(authenticated)
+
+
+def get_auth_cache(context, user):
+    """
+    Return the permissions and the checks of the user, kept in the context
+    for the rest of the request (or a new cache if the context can't keep it).
+    """
+    cache = getattr(context, '_graphene_auth_cache', None)
+    if not isinstance(cache, dict) or cache['user'] is not user:
+        cache = {'user': user, 'all_permissions': None, 'permissions': {}, 'checks': {}}
+        try:
+            context._graphene_auth_cache = cache
+        except AttributeError:
+            pass
+    return cache
+
+
+def user_has_perm(user, permission, cache):
+    """
+    Return True when the user has the permission, loading all the
+    permissions of the user once.
+    """
+    if permission not in cache['permissions']:
+        if cache['all_permissions'] is None:
+            get_all_permissions = getattr(user, 'get_all_permissions', None)
+            cache['all_permissions'] = set(get_all_permissions() if get_all_permissions else ())
+        # Backends that don't list all the permissions are asked for each one
+        cache['permissions'][permission] = (
+            permission in cache['all_permissions'] or user.has_perm(permission)
+        )
+    return cache['permissions'][permission]
+
+
 def has_perm(permissions, context):
     """
     Validates if the user in the context has the permission required.
@@ -30,10 +105,28 @@ def has_perm(permissions, context):
     if context is None:
         return False
     user = context.user
-    if user.is_authenticated() is False:
+    if not is_authenticated(user):
         return False
 
+    cache = get_auth_cache(context, user)
     for permission in permissions:
-        if not user.has_perm(permission):
+        if not user_has_perm(user, permission, cache):
             return False
     return True
+
+
+def field_has_perm(permissions, info):
+    """
+    Validates if the user has the permissions required by the field being
+    resolved, checking them once for each field of the operation (instead
+    of once for each object the field is resolved for).
+    """
+    context = info.context
+    if context is None:
+        return has_perm(permissions, context)
+    user = getattr(context, 'user', None)
+    checks = get_auth_cache(context, user)['checks']
+    key = (info.operation, info.parent_type, info.field_name, tuple(permissions))
+    if key not in checks:
+        checks[key] = has_perm(permissions, context)
+    return checks[key]
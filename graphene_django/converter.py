@@ -21,8 +21,7 @@ from graphene.types.json import JSONString
 from graphene.utils.str_converters import to_camel_case, to_const
 from graphql import assert_valid_name
 
-from .compat import ArrayField, HStoreField, JSONField, RangeField
-from .fields import DjangoListField, DjangoConnectionField
+from .settings import graphene_settings
 from .utils import import_single_dispatch
 
 singledispatch = import_single_dispatch()
@@ -52,6 +51,79 @@ def get_choices(choices):
             yield name, value, description
 
 
+def convert_choices_to_named_enum_with_descriptions(name, choices):
+    choices = list(get_choices(choices))
+    named_choices = [(c[0], c[1]) for c in choices]
+    named_choices_descriptions = {c[0]: c[2] for c in choices}
+
+    class EnumWithDescriptionsType(object):
+        @property
+        def description(self):
+            return named_choices_descriptions[self.name]
+
+    return Enum(name, list(named_choices), type=EnumWithDescriptionsType)
+
+
+def get_choices_key(choices):
+    """
+    Return a hashable key identifying the content of the given choices,
+    or None if the choices can't be hashed.
+    """
+    key = tuple(
+        (name, value, force_text(description))
+        for name, value, description in get_choices(choices)
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def generate_enum_name(django_model_meta, field):
+    custom_name = graphene_settings.DJANGO_CHOICE_FIELD_ENUM_CUSTOM_NAME
+    if custom_name:
+        name = custom_name(field)
+        if name:
+            return name
+    return to_camel_case("{}_{}".format(django_model_meta.object_name, field.name))
+
+
+def convert_choice_field_to_enum(field, registry=None):
+    name = generate_enum_name(field.model._meta, field)
+    choices = field.choices
+
+    # Enums can be shared between fields either by giving them the same
+    # custom name, or (when DJANGO_CHOICE_FIELD_ENUM_SHARED is set) by
+    # having exactly the same choices.
+    # The key of the choices is only computed when enums can be shared.
+    shared_key = None
+    choices_key = None
+    if registry is not None:
+        if graphene_settings.DJANGO_CHOICE_FIELD_ENUM_CUSTOM_NAME:
+            choices_key = get_choices_key(choices)
+            shared_key = ("name", name)
+        elif graphene_settings.DJANGO_CHOICE_FIELD_ENUM_SHARED:
+            choices_key = get_choices_key(choices)
+            if choices_key:
+                shared_key = ("choices", choices_key)
+
+    if shared_key is not None:
+        shared = registry.get_choices_enum(shared_key)
+        if shared:
+            shared_choices_key, enum = shared
+            assert shared_choices_key == choices_key, (
+                'The enum "{}" is already defined with different choices '
+                'than the ones in the field "{}".'
+            ).format(name, field)
+            return enum
+
+    enum = convert_choices_to_named_enum_with_descriptions(name, choices)
+    if shared_key is not None:
+        registry.register_choices_enum(shared_key, (choices_key, enum))
+    return enum
+
+
 def convert_django_field_with_choices(field, registry=None):
     if registry is not None:
         converted = registry.get_converted_field(field)
@@ -59,18 +131,7 @@ def convert_django_field_with_choices(field, registry=None):
             return converted
     choices = getattr(field, "choices", None)
     if choices:
-        meta = field.model._meta
-        name = to_camel_case("{}_{}".format(meta.object_name, field.name))
-        choices = list(get_choices(choices))
-        named_choices = [(c[0], c[1]) for c in choices]
-        named_choices_descriptions = {c[0]: c[2] for c in choices}
-
-        class EnumWithDescriptionsType(object):
-            @property
-            def description(self):
-                return named_choices_descriptions[self.name]
-
-        enum = Enum(name, list(named_choices), type=EnumWithDescriptionsType)
+        enum = convert_choice_field_to_enum(field, registry)
         converted = enum(description=field.help_text, required=not field.null)
     else:
         converted = convert_django_field(field, registry)
@@ -81,6 +142,11 @@ def convert_django_field_with_choices(field, registry=None):
 
 @singledispatch
 def convert_django_field(field, registry=None):
+    # The postgres converters are registered on first use, so that
+    # django.contrib.postgres (and psycopg2) are only imported by
+    # projects that actually have such fields.
+    if register_postgres_converters():
+        return convert_django_field(field, registry)
     raise Exception(
         "Don't know how to convert the Django field %s (%s)" % (field, field.__class__)
     )
@@ -177,6 +243,8 @@ def convert_field_to_list_or_connection(field, registry=None):
         if not _type:
             return
 
+        from .fields import DjangoListField, DjangoConnectionField
+
         # If there is a connection, we should transform the field
         # into a DjangoConnectionField
         if _type._meta.connection:
@@ -209,7 +277,6 @@ def convert_field_to_djangomodel(field, registry=None):
     return Dynamic(dynamic_type)
 
 
-@convert_django_field.register(ArrayField)
 def convert_postgres_array_to_list(field, registry=None):
     base_type = convert_django_field(field.base_field)
     if not isinstance(base_type, (List, NonNull)):
@@ -217,15 +284,40 @@ def convert_postgres_array_to_list(field, registry=None):
     return List(base_type, description=field.help_text, required=not field.null)
 
 
-@convert_django_field.register(HStoreField)
-@convert_django_field.register(JSONField)
 def convert_posgres_field_to_string(field, registry=None):
     return JSONString(description=field.help_text, required=not field.null)
 
 
-@convert_django_field.register(RangeField)
 def convert_posgres_range_to_string(field, registry=None):
     inner_type = convert_django_field(field.base_field)
     if not isinstance(inner_type, (List, NonNull)):
         inner_type = type(inner_type)
     return List(inner_type, description=field.help_text, required=not field.null)
+
+
+_postgres_converters_registered = False
+
+
+def register_postgres_converters():
+    """
+    Register the converters for the postgres specific fields.
+    Returns True if they were registered by this call.
+    """
+    global _postgres_converters_registered
+    if _postgres_converters_registered:
+        return False
+    _postgres_converters_registered = True
+
+    from .compat import ArrayField, HStoreField, JSONField, RangeField
+
+    converters = [
+        (ArrayField, convert_postgres_array_to_list),
+        (HStoreField, convert_posgres_field_to_string),
+        (JSONField, convert_posgres_field_to_string),
+        (RangeField, convert_posgres_range_to_string),
+    ]
+    for field_class, converter in converters:
+        # Keep the converters the project already registered
+        if field_class not in convert_django_field.registry:
+            convert_django_field.register(field_class, converter)
+    return True
@@ -1,3 +1,5 @@
+import random
+
 from django.db import connections
 
 from promise import Promise
@@ -10,6 +12,9 @@ class DjangoDebugContext(object):
     def __init__(self):
         self.debug_promise = None
         self.promises = []
+        # Path of the last field that started resolving, so the
+        # executed SQL queries can be related to it
+        self.current_path = None
         self.enable_instrumentation()
         self.object = DjangoDebug(sql=[])
 
@@ -36,23 +41,66 @@ class DjangoDebugContext(object):
             unwrap_cursor(connection)
 
 
+def get_header_key(header):
+    """ The key of the given HTTP header in request.META """
+    return "HTTP_" + header.upper().replace("-", "_")
+
+
 class DjangoDebugMiddleware(object):
+    """
+    Records the SQL queries of the operations in the DjangoDebug field.
+
+    Only a sample_rate fraction of the operations (and the ones that send
+    the sample_header) are instrumented. The decision is taken once per
+    context, and the fields of the other operations are resolved directly,
+    with their DjangoDebug field as null.
+    """
+
+    def __init__(self, sample_rate=None, sample_header=None):
+        from ..settings import graphene_settings
+
+        if sample_rate is None:
+            sample_rate = graphene_settings.DEBUG_SAMPLE_RATE
+        if sample_header is None:
+            sample_header = graphene_settings.DEBUG_SAMPLE_HEADER
+        self.sample_rate = sample_rate
+        self.sample_header = sample_header
+
+    def should_sample(self, context):
+        meta = getattr(context, "META", None)
+        if self.sample_header and meta is not None:
+            value = meta.get(get_header_key(self.sample_header))
+            if value is not None:
+                return value.lower() not in ("", "0", "false")
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def start(self, context):
+        if context is None:
+            raise Exception("DjangoDebug cannot be executed in None contexts")
+        # False marks the contexts that aren't sampled
+        django_debug = DjangoDebugContext() if self.should_sample(context) else False
+        try:
+            context.django_debug = django_debug
+        except Exception:
+            if django_debug:
+                django_debug.disable_instrumentation()
+            raise Exception(
+                "DjangoDebug need the context to be writable, context received: {}.".format(
+                    context.__class__.__name__
+                )
+            )
+        return django_debug
+
     def resolve(self, next, root, info, **args):
         context = info.context
         django_debug = getattr(context, "django_debug", None)
-        if not django_debug:
-            if context is None:
-                raise Exception("DjangoDebug cannot be executed in None contexts")
-            try:
-                context.django_debug = DjangoDebugContext()
-            except Exception:
-                raise Exception(
-                    "DjangoDebug need the context to be writable, context received: {}.".format(
-                        context.__class__.__name__
-                    )
-                )
+        if django_debug is None:
+            django_debug = self.start(context)
+        if django_debug is False:
+            return next(root, info, **args)
         if info.schema.get_type("DjangoDebug") == info.return_type:
-            return context.django_debug.get_debug_promise()
+            return django_debug.get_debug_promise()
+        django_debug.current_path = info.path
         promise = next(root, info, **args)
-        context.django_debug.add_promise(promise)
+        django_debug.add_promise(promise)
         return promise
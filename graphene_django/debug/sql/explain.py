@@ -0,0 +1,117 @@
+from __future__ import absolute_import, unicode_literals
+
+import re
+
+from django.utils.encoding import force_text
+
+# sqlite: "SCAN TABLE app_model" (< 3.36) or "SCAN app_model", a full
+# table scan unless it goes through an index
+SQLITE_SCAN_RE = re.compile(r"\bSCAN (?:TABLE )?(\w+)(.*)")
+SQLITE_TEMP_BTREE_RE = re.compile(r"USE TEMP B-TREE FOR (.+)")
+
+# postgresql: "Seq Scan on app_model  (cost=...)"
+POSTGRES_SEQ_SCAN_RE = re.compile(r"Seq Scan on (\w+)")
+POSTGRES_FILTER_RE = re.compile(r"^\s*Filter: (.+)$")
+
+WHERE_RE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+
+
+def get_explain_sql(vendor, sql):
+    if vendor == "sqlite":
+        return "EXPLAIN QUERY PLAN " + sql
+    return "EXPLAIN " + sql
+
+
+def explain_query(connection, sql, params):
+    """
+    Run EXPLAIN (EXPLAIN QUERY PLAN on sqlite) for the given query and
+    return the plan as a list of lines.
+    """
+    vendor = connection.vendor
+    # Use the cursor without the debug wrapper, if any, so the EXPLAIN
+    # queries are not recorded.
+    get_cursor = getattr(connection, "_graphene_cursor", connection.cursor)
+    with get_cursor() as cursor:
+        cursor.execute(get_explain_sql(vendor, sql), params)
+        rows = cursor.fetchall()
+        columns = [column[0] for column in cursor.description or ()]
+
+    if vendor == "sqlite":
+        # (id, parent, notused, detail)
+        return [force_text(row[-1]) for row in rows]
+    if vendor == "mysql":
+        return [
+            ", ".join(
+                "{}={}".format(column, force_text(value))
+                for column, value in zip(columns, row)
+            )
+            for row in rows
+        ]
+    return [force_text(row[0]) for row in rows]
+
+
+def analyze_plan(vendor, sql, plan):
+    """
+    Look for sequential scans in the plan of a query, and for the ones
+    that are probably caused by a missing index.
+    Returns a tuple with both lists.
+    """
+    sequential_scans = []
+    missing_indexes = []
+    has_where = bool(WHERE_RE.search(sql))
+
+    if vendor == "sqlite":
+        for line in plan:
+            match = SQLITE_SCAN_RE.search(line)
+            if match and "USING" not in match.group(2):
+                table = match.group(1)
+                sequential_scans.append(table)
+                if has_where:
+                    missing_indexes.append(
+                        "{}: rows are filtered without an index".format(table)
+                    )
+            match = SQLITE_TEMP_BTREE_RE.search(line)
+            if match:
+                missing_indexes.append("{} without an index".format(match.group(1)))
+
+    elif vendor == "postgresql":
+        table = None
+        for line in plan:
+            match = POSTGRES_SEQ_SCAN_RE.search(line)
+            if match:
+                table = match.group(1)
+                sequential_scans.append(table)
+                continue
+            match = POSTGRES_FILTER_RE.search(line)
+            if match and table:
+                missing_indexes.append("{}: {}".format(table, match.group(1)))
+                table = None
+
+    elif vendor == "mysql":
+        for line in plan:
+            values = dict(
+                value.split("=", 1) for value in line.split(", ") if "=" in value
+            )
+            if values.get("type") == "ALL":
+                table = values.get("table")
+                sequential_scans.append(table)
+                if values.get("possible_keys") in (None, "None", "NULL"):
+                    missing_indexes.append(
+                        "{}: no index can be used".format(table)
+                    )
+
+    return sequential_scans, missing_indexes
+
+
+def explain_recorded_query(connection, sql, params):
+    """
+    Explain and analyze a recorded query, returning a dict with its
+    plan, sequential scans and probably missing indexes.
+    """
+    plan = explain_query(connection, sql, params)
+    sequential_scans, missing_indexes = analyze_plan(connection.vendor, sql, plan)
+    return {
+        "plan": plan,
+        "sequential_scans": sequential_scans,
+        "missing_indexes": missing_indexes,
+    }
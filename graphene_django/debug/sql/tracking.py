@@ -108,6 +108,9 @@ class NormalCursorWrapper(object):
             except Exception:
                 pass  # object not JSON serializable
 
+            raw_params = params
+            path = getattr(self.logger, "current_path", None)
+
             alias = getattr(self.db, "alias", "default")
             conn = self.db.connection
             vendor = getattr(conn, "vendor", "unknown")
@@ -125,6 +128,7 @@ class NormalCursorWrapper(object):
                 "stop_time": stop_time,
                 "is_slow": duration > 10,
                 "is_select": sql.lower().strip().startswith("select"),
+                "path": ".".join(map(str, path)) if path else None,
             }
 
             if vendor == "postgresql":
@@ -145,6 +149,8 @@ class NormalCursorWrapper(object):
                 )
 
             _sql = DjangoDebugSQL(**params)
+            # Kept to be able to explain the query
+            _sql.raw_params = raw_params
             # We keep `sql` to maintain backwards compatibility
             self.logger.object.sql.append(_sql)
 
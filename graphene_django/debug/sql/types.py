@@ -1,4 +1,23 @@
-from graphene import Boolean, Float, ObjectType, String
+from django.db import connections
+
+from graphene import Boolean, Field, Float, List, ObjectType, String
+
+from .explain import explain_recorded_query
+
+
+class DjangoDebugSQLExplain(ObjectType):
+    class Meta:
+        description = "The query plan of a database query."
+
+    plan = List(String, description="The query plan, as returned by EXPLAIN.")
+    sequential_scans = List(
+        String, description="Tables that are scanned sequentially in the plan."
+    )
+    missing_indexes = List(
+        String,
+        description="Filters and orderings on sequentially scanned tables, "
+        "that could probably use an index.",
+    )
 
 
 class DjangoDebugSQL(ObjectType):
@@ -46,9 +65,26 @@ class DjangoDebugSQL(ObjectType):
         required=True,
         description="Whether this database query was a SELECT.",
     )
+    path = String(
+        description="Path of the GraphQL field that was being resolved "
+        "when this database query was made."
+    )
+    explain = Field(
+        DjangoDebugSQLExplain,
+        description="The query plan of this database query (only for SELECTs). "
+        "Notice that it runs an EXPLAIN query for every SQL query.",
+    )
 
     # Postgres
     trans_id = String(description="Postgres transaction ID if available.")
     trans_status = String(description="Postgres transaction status if available.")
     iso_level = String(description="Postgres isolation level if available.")
     encoding = String(description="Postgres connection encoding if available.")
+
+    def resolve_explain(self, info):
+        raw_params = getattr(self, "raw_params", None)
+        if not self.is_select or raw_params is None:
+            return None
+        return DjangoDebugSQLExplain(
+            **explain_recorded_query(connections[self.alias], self.raw_sql, raw_params)
+        )
@@ -197,3 +197,143 @@ def test_should_query_connectionfilter():
     assert "COUNT" in result.data["__debug"]["sql"][0]["rawSql"]
     query = str(Reporter.objects.all()[:1].query)
     assert result.data["__debug"]["sql"][1]["rawSql"] == query
+
+
+def test_should_query_sql_path_and_explain():
+    r1 = Reporter(last_name="ABA")
+    r1.save()
+
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+
+    class Query(graphene.ObjectType):
+        all_reporters = graphene.List(ReporterType)
+        debug = graphene.Field(DjangoDebug, name="__debug")
+
+        def resolve_all_reporters(self, info, **args):
+            return Reporter.objects.filter(last_name="ABA")
+
+    query = """
+        query ReporterQuery {
+          allReporters {
+            lastName
+          }
+          __debug {
+            sql {
+              path
+              explain {
+                plan
+                sequentialScans
+                missingIndexes
+              }
+            }
+          }
+        }
+    """
+    schema = graphene.Schema(query=Query)
+    result = schema.execute(
+        query, context_value=context(), middleware=[DjangoDebugMiddleware()]
+    )
+    assert not result.errors
+    sql = result.data["__debug"]["sql"]
+    assert len(sql) == 1
+    assert sql[0]["path"] == "allReporters"
+    explain = sql[0]["explain"]
+    assert explain["plan"]
+    assert explain["sequentialScans"] == ["tests_reporter"]
+    assert explain["missingIndexes"] == [
+        "tests_reporter: rows are filtered without an index"
+    ]
+
+
+def get_sampling_schema():
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+
+    class Query(graphene.ObjectType):
+        all_reporters = graphene.List(ReporterType)
+        debug = graphene.Field(DjangoDebug, name="__debug")
+
+        def resolve_all_reporters(self, info, **args):
+            return Reporter.objects.all()
+
+    return graphene.Schema(query=Query)
+
+
+sampling_query = """
+    query ReporterQuery {
+      allReporters {
+        lastName
+      }
+      __debug {
+        sql {
+          rawSql
+        }
+      }
+    }
+"""
+
+
+def test_should_not_record_unsampled_operations():
+    Reporter.objects.create(last_name="ABA")
+    schema = get_sampling_schema()
+    request_context = context()
+    result = schema.execute(
+        sampling_query,
+        context_value=request_context,
+        middleware=[DjangoDebugMiddleware(sample_rate=0)],
+    )
+    assert not result.errors
+    assert result.data == {"allReporters": [{"lastName": "ABA"}], "__debug": None}
+    assert request_context.django_debug is False
+
+
+def test_should_record_operations_with_the_sample_header():
+    Reporter.objects.create(last_name="ABA")
+    schema = get_sampling_schema()
+    middleware = DjangoDebugMiddleware(sample_rate=0, sample_header="X-GraphQL-Debug")
+
+    request_context = context()
+    request_context.META = {"HTTP_X_GRAPHQL_DEBUG": "1"}
+    result = schema.execute(
+        sampling_query, context_value=request_context, middleware=[middleware]
+    )
+    assert not result.errors
+    assert len(result.data["__debug"]["sql"]) == 1
+
+    request_context = context()
+    request_context.META = {"HTTP_X_GRAPHQL_DEBUG": "0"}
+    result = schema.execute(
+        sampling_query,
+        context_value=request_context,
+        middleware=[
+            DjangoDebugMiddleware(sample_rate=1, sample_header="X-GraphQL-Debug")
+        ],
+    )
+    assert not result.errors
+    assert result.data["__debug"] is None
+
+
+def test_should_take_the_sample_rate_from_the_settings(settings):
+    settings.GRAPHENE = {"DEBUG_SAMPLE_RATE": 0}
+    assert DjangoDebugMiddleware().sample_rate == 0
+    settings.GRAPHENE = {}
+    assert DjangoDebugMiddleware().sample_rate == 1
+
+
+def test_should_ignore_the_sample_header_by_default():
+    Reporter.objects.create(last_name="ABA")
+    schema = get_sampling_schema()
+    request_context = context()
+    request_context.META = {"HTTP_X_GRAPHQL_DEBUG": "1"}
+    result = schema.execute(
+        sampling_query,
+        context_value=request_context,
+        middleware=[DjangoDebugMiddleware(sample_rate=0)],
+    )
+    assert not result.errors
+    assert result.data["__debug"] is None
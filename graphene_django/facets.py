@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from functools import partial
+
+from django.db.models import Count
+from django.db.models.query import QuerySet
+from graphene import Field, Int, List, NonNull, ObjectType, String
+from graphql_relay import to_global_id
+
+
+class FacetCount(ObjectType):
+    """ The number of nodes with a value of a facet """
+
+    value = String(
+        description="The value, as it can be used to filter by it (the ID of "
+        "the related node for relations)"
+    )
+    count = Int(required=True)
+
+
+def get_facet_value(model_field, registry, value):
+    if value is None:
+        return None
+    related_model = model_field.related_model
+    if related_model is not None:
+        from graphene.relay import Node
+
+        related_type = registry.get_type_for_model(related_model)
+        if related_type and any(
+            issubclass(interface, Node) for interface in related_type._meta.interfaces
+        ):
+            return to_global_id(related_type.__name__, value)
+    return str(value)
+
+
+def resolve_facet(name, model_field, registry, connection, info):
+    """ Count the nodes of the connection for each value of the facet, with
+        a GROUP BY query. Filter connections don't apply the filters of the
+        facet field (see DjangoFilterConnectionField.get_facet_queryset).
+    """
+    get_facet_queryset = getattr(connection, "get_facet_queryset", None)
+    queryset = get_facet_queryset(name) if get_facet_queryset else connection.iterable
+    if not isinstance(queryset, QuerySet):
+        return []
+
+    counts = (
+        queryset.order_by()
+        .values(name)
+        .annotate(count=Count("pk", distinct=queryset.query.distinct))
+        .order_by("-count", name)
+    )
+    return [
+        FacetCount(
+            value=get_facet_value(model_field, registry, facet[name]),
+            count=facet["count"],
+        )
+        for facet in counts
+    ]
+
+
+def get_facets_field(node_type_name, model, registry, facet_fields):
+    """ The field with the facets of a connection """
+    attrs = OrderedDict()
+    for name in facet_fields:
+        model_field = model._meta.get_field(name)
+        attrs[name] = List(
+            NonNull(FacetCount),
+            required=True,
+            resolver=partial(resolve_facet, name, model_field, registry),
+        )
+
+    facets_type = type(str("{}Facets".format(node_type_name)), (ObjectType,), attrs)
+    return Field(
+        facets_type,
+        resolver=lambda connection, info: connection,
+        required=True,
+        description="Number of nodes for each value of the facets, "
+        "regardless of the pagination and the filters of each facet",
+    )
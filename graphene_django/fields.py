@@ -8,8 +8,50 @@ from graphene.types import Field, List
 from graphene.relay import ConnectionField, PageInfo
 from graphql_relay.connection.arrayconnection import connection_from_list_slice
 
+from .annotations import annotate_queryset, get_node_selections
 from .settings import graphene_settings
-from .utils import maybe_queryset
+from .utils import get_selections, maybe_queryset
+
+
+def joins_multiply_rows(query):
+    """ Whether the query joins a table with many rows for each one of the
+        model (a reverse foreign key or a many to many relation), so the
+        same object can be returned more than once
+    """
+    if query.extra_tables:
+        return True
+    for alias, table in query.alias_map.items():
+        join_field = getattr(table, "join_field", None)
+        if join_field is None or not query.alias_refcount[alias]:
+            continue
+        if join_field.one_to_many or join_field.many_to_many:
+            return True
+    return False
+
+
+def set_distinct(queryset, distinct):
+    """ A copy of the queryset with or without DISTINCT, even if sliced """
+    if queryset.query.distinct == distinct or queryset.query.distinct_fields:
+        return queryset
+    queryset = queryset.all()
+    queryset.query.distinct = distinct
+    return queryset
+
+
+def get_type_queryset(node_type, queryset, info):
+    """ The queryset restricted by the get_queryset of the type, that is
+        applied before the slice of the queryset (if any)
+    """
+    low = queryset.query.low_mark
+    high = queryset.query.high_mark
+    if low or high:
+        queryset = queryset.all()
+        queryset.query.clear_limits()
+    queryset = node_type.get_queryset(queryset, info)
+    if low or high:
+        queryset = queryset.all()
+        queryset.query.set_limits(low, high)
+    return queryset
 
 
 class DjangoListField(Field):
@@ -20,12 +62,34 @@ class DjangoListField(Field):
     def model(self):
         return self.type.of_type._meta.node._meta.model
 
+    @property
+    def node_type(self):
+        return self.type.of_type
+
     @staticmethod
-    def list_resolver(resolver, root, info, **args):
-        return maybe_queryset(resolver(root, info, **args))
+    def list_resolver(node_type, resolver, root, info, **args):
+        iterable = maybe_queryset(resolver(root, info, **args))
+        if not isinstance(iterable, QuerySet):
+            return iterable
+        if hasattr(node_type, "get_queryset"):
+            iterable = get_type_queryset(node_type, iterable, info)
+        if getattr(node_type._meta, "annotations", None):
+            iterable = annotate_queryset(iterable, node_type, get_selections(info))
+        return iterable
 
     def get_resolver(self, parent_resolver):
-        return partial(self.list_resolver, parent_resolver)
+        return partial(self.list_resolver, self.node_type, parent_resolver)
+
+
+class AnnotatedField(Field):
+    """ A field computed by the database with an ORM expression (as F,
+        Sum, Subquery or Case), that is annotated to the queryset of the
+        connection and list fields of the type when it's selected
+    """
+
+    def __init__(self, _type, expression, *args, **kwargs):
+        self.expression = expression
+        super(AnnotatedField, self).__init__(_type, *args, **kwargs)
 
 
 class DjangoConnectionField(ConnectionField):
@@ -69,26 +133,64 @@ class DjangoConnectionField(ConnectionField):
 
     @classmethod
     def merge_querysets(cls, default_queryset, queryset):
-        if default_queryset.query.distinct and not queryset.query.distinct:
-            queryset = queryset.distinct()
-        elif queryset.query.distinct and not default_queryset.query.distinct:
-            default_queryset = default_queryset.distinct()
-        return queryset & default_queryset
+        """ Add the conditions of the default queryset (from the manager of
+            the field) to the queryset returned by the resolver.
+
+            The result is DISTINCT only when any of them is and its joins
+            can multiply the rows.
+        """
+        if queryset is default_queryset:
+            return queryset
+        distinct = default_queryset.query.distinct or queryset.query.distinct
+        if default_queryset.query.distinct_fields or queryset.query.distinct_fields:
+            # DISTINCT ON must be the same in both
+            if distinct and not default_queryset.query.distinct:
+                default_queryset = default_queryset.distinct()
+            elif distinct and not queryset.query.distinct:
+                queryset = queryset.distinct()
+            return queryset & default_queryset
+
+        assert not (
+            default_queryset.query.low_mark or default_queryset.query.high_mark
+        ), "Received a sliced default queryset in the connection, please slice only the one of the resolver."
+        low = queryset.query.low_mark
+        high = queryset.query.high_mark
+        queryset = set_distinct(queryset, False).all()
+        queryset.query.clear_limits()
+        queryset = queryset & set_distinct(default_queryset, False)
+        queryset.query.set_limits(low, high)
+
+        return set_distinct(
+            queryset, bool(distinct and joins_multiply_rows(queryset.query))
+        )
 
     @classmethod
-    def resolve_connection(cls, connection, default_manager, args, iterable):
+    def resolve_connection(cls, connection, default_manager, args, iterable, info=None):
         if iterable is None:
             iterable = default_manager
         iterable = maybe_queryset(iterable)
+        nodes = iterable
         if isinstance(iterable, QuerySet):
             if iterable is not default_manager:
                 default_queryset = maybe_queryset(default_manager)
                 iterable = cls.merge_querysets(default_queryset, iterable)
+            node_type = connection._meta.node
+            if info is not None:
+                # Applied to the queryset that is returned, whatever the
+                # resolver filtered
+                iterable = get_type_queryset(node_type, iterable, info)
             _len = iterable.count()
+            # The annotations are only needed for the page of nodes
+            if info is not None and node_type._meta.annotations:
+                nodes = annotate_queryset(
+                    iterable, node_type, get_node_selections(info)
+                )
+            else:
+                nodes = iterable
         else:
             _len = len(iterable)
         connection = connection_from_list_slice(
-            iterable,
+            nodes,
             args,
             slice_start=0,
             list_length=_len,
@@ -113,6 +215,20 @@ class DjangoConnectionField(ConnectionField):
         info,
         **args
     ):
+        cls.limit_pagination_args(info, max_limit, enforce_first_or_last, args)
+
+        iterable = resolver(root, info, **args)
+        on_resolve = partial(
+            cls.resolve_connection, connection, default_manager, args, info=info
+        )
+
+        if Promise.is_thenable(iterable):
+            return Promise.resolve(iterable).then(on_resolve)
+
+        return on_resolve(iterable)
+
+    @staticmethod
+    def limit_pagination_args(info, max_limit, enforce_first_or_last, args):
         first = args.get("first")
         last = args.get("last")
 
@@ -134,14 +250,6 @@ class DjangoConnectionField(ConnectionField):
                 ).format(last, info.field_name, max_limit)
                 args["last"] = min(last, max_limit)
 
-        iterable = resolver(root, info, **args)
-        on_resolve = partial(cls.resolve_connection, connection, default_manager, args)
-
-        if Promise.is_thenable(iterable):
-            return Promise.resolve(iterable).then(on_resolve)
-
-        return on_resolve(iterable)
-
     def get_resolver(self, parent_resolver):
         return partial(
             self.connection_resolver,
@@ -10,9 +10,11 @@ if not DJANGO_FILTER_INSTALLED:
 else:
     from .fields import DjangoFilterConnectionField
     from .filterset import GlobalIDFilter, GlobalIDMultipleChoiceFilter
+    from .search import SearchFilter
 
     __all__ = [
         "DjangoFilterConnectionField",
         "GlobalIDFilter",
         "GlobalIDMultipleChoiceFilter",
+        "SearchFilter",
     ]
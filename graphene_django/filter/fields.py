@@ -1,9 +1,18 @@
 from collections import OrderedDict
 from functools import partial
 
+from django.db.models.query import QuerySet
+
 from graphene.types.argument import to_arguments
-from ..fields import DjangoConnectionField
-from .utils import get_filtering_args_from_filterset, get_filterset_class
+from promise import Promise
+
+from ..fields import DjangoConnectionField, get_type_queryset
+from ..utils import maybe_queryset
+from .utils import (
+    filter_queryset,
+    get_filtering_args_from_filterset,
+    get_filterset_class,
+)
 
 
 class DjangoFilterConnectionField(DjangoConnectionField):
@@ -20,6 +29,7 @@ class DjangoFilterConnectionField(DjangoConnectionField):
         self._fields = fields
         self._provided_filterset_class = filterset_class
         self._filterset_class = None
+        self._filtering_args = None
         self._extra_filter_meta = extra_filter_meta
         self._base_args = None
         super(DjangoFilterConnectionField, self).__init__(type, *args, **kwargs)
@@ -37,6 +47,9 @@ class DjangoFilterConnectionField(DjangoConnectionField):
         if not self._filterset_class:
             fields = self._fields or self.node_type._meta.filter_fields
             meta = dict(model=self.model, fields=fields)
+            search_fields = self.node_type._meta.search_fields
+            if search_fields:
+                meta["search_fields"] = search_fields
             if self._extra_filter_meta:
                 meta.update(self._extra_filter_meta)
 
@@ -48,31 +61,105 @@ class DjangoFilterConnectionField(DjangoConnectionField):
 
     @property
     def filtering_args(self):
-        return get_filtering_args_from_filterset(self.filterset_class, self.node_type)
+        if self._filtering_args is None:
+            self._filtering_args = get_filtering_args_from_filterset(
+                self.filterset_class, self.node_type
+            )
+        return self._filtering_args
 
     @classmethod
-    def merge_querysets(cls, default_queryset, queryset):
-        # There could be the case where the default queryset (returned from the filterclass)
-        # and the resolver queryset have some limits on it.
-        # We only would be able to apply one of those, but not both
-        # at the same time.
+    def filter_iterable(
+        cls, filterset_class, filter_kwargs, default_manager, request, iterable
+    ):
+        """ Apply the filters to the queryset returned by the resolver, or
+            the one of the manager, before the pagination
+        """
+        if iterable is None:
+            iterable = default_manager
+        queryset = maybe_queryset(iterable)
+        if not isinstance(queryset, QuerySet):
+            return iterable
 
+        # The resolver and the filters can slice the queryset, but not both.
         # See related PR: https://github.com/graphql-python/graphene-django/pull/126
+        low = queryset.query.low_mark
+        high = queryset.query.high_mark
+        if low or high:
+            queryset = queryset.all()
+            queryset.query.clear_limits()
+        queryset = filter_queryset(filterset_class, queryset, filter_kwargs, request)
+        if low or high:
+            assert not (
+                low and queryset.query.low_mark
+            ), "Received two sliced querysets (low mark) in the connection, please slice only in one."
+            assert not (
+                high and queryset.query.high_mark
+            ), "Received two sliced querysets (high mark) in the connection, please slice only in one."
+            queryset = queryset.all()
+            queryset.query.set_limits(low, high)
+        return queryset
 
-        assert not (
-            default_queryset.query.low_mark and queryset.query.low_mark
-        ), "Received two sliced querysets (low mark) in the connection, please slice only in one."
-        assert not (
-            default_queryset.query.high_mark and queryset.query.high_mark
-        ), "Received two sliced querysets (high mark) in the connection, please slice only in one."
-        low = default_queryset.query.low_mark or queryset.query.low_mark
-        high = default_queryset.query.high_mark or queryset.query.high_mark
-        default_queryset.query.clear_limits()
-        queryset = super(DjangoFilterConnectionField, cls).merge_querysets(
-            default_queryset, queryset
+    @classmethod
+    def get_facet_queryset(
+        cls,
+        node_type,
+        filterset_class,
+        filter_kwargs,
+        default_manager,
+        info,
+        iterable,
+        field_name,
+    ):
+        """ The queryset of the connection without the filters of the given
+            field, so a facet counts the values that can be selected
+        """
+        filter_kwargs = {
+            name: value
+            for name, value in filter_kwargs.items()
+            if filterset_class.base_filters[name].field_name != field_name
+        }
+        queryset = cls.filter_iterable(
+            filterset_class, filter_kwargs, default_manager, info.context, iterable
         )
-        queryset.query.set_limits(low, high)
-        return queryset
+        if not isinstance(queryset, QuerySet):
+            return queryset
+        if iterable is not None:
+            queryset = cls.merge_querysets(maybe_queryset(default_manager), queryset)
+        return get_type_queryset(node_type, queryset, info)
+
+    @classmethod
+    def resolve_filtered_connection(
+        cls,
+        connection,
+        default_manager,
+        args,
+        filterset_class,
+        filter_kwargs,
+        info,
+        iterable,
+    ):
+        node_type = connection._meta.node
+        queryset = cls.filter_iterable(
+            filterset_class, filter_kwargs, default_manager, info.context, iterable
+        )
+        connection = cls.resolve_connection(
+            connection,
+            # The filtered queryset of the manager already has its conditions
+            queryset if iterable is None else default_manager,
+            args,
+            queryset,
+            info=info,
+        )
+        connection.get_facet_queryset = partial(
+            cls.get_facet_queryset,
+            node_type,
+            filterset_class,
+            filter_kwargs,
+            default_manager,
+            info,
+            iterable,
+        )
+        return connection
 
     @classmethod
     def connection_resolver(
@@ -88,24 +175,25 @@ class DjangoFilterConnectionField(DjangoConnectionField):
         info,
         **args
     ):
+        cls.limit_pagination_args(info, max_limit, enforce_first_or_last, args)
         filter_kwargs = {k: v for k, v in args.items() if k in filtering_args}
-        qs = filterset_class(
-            data=filter_kwargs,
-            queryset=default_manager.get_queryset(),
-            request=info.context,
-        ).qs
-
-        return super(DjangoFilterConnectionField, cls).connection_resolver(
-            resolver,
+
+        iterable = resolver(root, info, **args)
+        on_resolve = partial(
+            cls.resolve_filtered_connection,
             connection,
-            qs,
-            max_limit,
-            enforce_first_or_last,
-            root,
+            default_manager,
+            args,
+            filterset_class,
+            filter_kwargs,
             info,
-            **args
         )
 
+        if Promise.is_thenable(iterable):
+            return Promise.resolve(iterable).then(on_resolve)
+
+        return on_resolve(iterable)
+
     def get_resolver(self, parent_resolver):
         return partial(
             self.connection_resolver,
@@ -1,6 +1,12 @@
 import itertools
-
-from django.db import models
+import json
+
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db import DatabaseError, models
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.lookups import In
+from django.utils import six
+from django.utils.datastructures import OrderedSet
 from django_filters import Filter, MultipleChoiceFilter, VERSION
 from django_filters.filterset import BaseFilterSet, FilterSet
 from django_filters.filterset import FILTER_FOR_DBFIELD_DEFAULTS
@@ -8,6 +14,7 @@ from django_filters.filterset import FILTER_FOR_DBFIELD_DEFAULTS
 from graphql_relay.node.node import from_global_id
 
 from ..forms import GlobalIDFormField, GlobalIDMultipleChoiceField
+from .search import SearchFilter
 
 
 class GlobalIDFilter(Filter):
@@ -21,12 +28,114 @@ class GlobalIDFilter(Filter):
         return super(GlobalIDFilter, self).filter(qs, _id)
 
 
+def has_json_each(connection):
+    """ Whether the SQLite database has the json_each function of JSON1 """
+    supported = getattr(connection, "graphene_json_each", None)
+    if supported is None:
+        connection.ensure_connection()
+        try:
+            connection.connection.execute("SELECT value FROM json_each('[]')")
+            supported = True
+        except DatabaseError:
+            supported = False
+        connection.graphene_json_each = supported
+    return supported
+
+
+class ArrayIn(In):
+    """ An IN lookup that sends all the values as a single parameter
+        (an array in PostgreSQL, a JSON array in SQLite with JSON1), so the
+        SQL is the same for any number of values and doesn't hit the limit
+        of query parameters. Other databases use the regular IN lookup.
+
+        It is only registered on the fields GlobalIDMultipleChoiceFilter
+        filters, with register_array_in.
+    """
+
+    lookup_name = "graphene_in"
+
+    def get_db_values(self, connection):
+        field = self.lhs.output_field
+        values = [
+            field.get_db_prep_value(value, connection, prepared=False)
+            for value in OrderedSet(self.rhs)
+            if value is not None
+        ]
+        if not values:
+            raise EmptyResultSet
+        return values
+
+    def as_postgresql(self, compiler, connection):
+        if not self.rhs_is_direct_value():
+            return self.as_sql(compiler, connection)
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        params = list(lhs_params) + [self.get_db_values(connection)]
+        return "%s = ANY(%%s)" % lhs, params
+
+    def as_sqlite(self, compiler, connection):
+        if not self.rhs_is_direct_value() or not has_json_each(connection):
+            return self.as_sql(compiler, connection)
+        values = self.get_db_values(connection)
+        # The values compare as the column only when JSON has their type
+        if not all(
+            isinstance(value, six.integer_types + six.string_types)
+            for value in values
+        ):
+            return self.as_sql(compiler, connection)
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        params = list(lhs_params) + [json.dumps(values)]
+        return "%s IN (SELECT value FROM json_each(%%s))" % lhs, params
+
+
+def register_array_in(field):
+    """ Register the graphene_in lookup on the class of the field """
+    if field.get_lookup(ArrayIn.lookup_name) is None:
+        type(field).register_lookup(ArrayIn)
+
+
+def get_filter_target(model, field_name):
+    """ Return the lookup path to the primary key (or the field) the
+        filter is on, and its model field
+    """
+    opts = model._meta
+    field = None
+    for name in field_name.split(LOOKUP_SEP):
+        field = opts.pk if name == "pk" else opts.get_field(name)
+        if field.is_relation:
+            if not field.related_model:
+                raise FieldDoesNotExist(
+                    "{} is a generic relation".format(field_name)
+                )
+            opts = field.related_model._meta
+    if field.is_relation:
+        return LOOKUP_SEP.join([field_name, "pk"]), opts.pk
+    return field_name, field
+
+
 class GlobalIDMultipleChoiceFilter(MultipleChoiceFilter):
     field_class = GlobalIDMultipleChoiceField
 
     def filter(self, qs, value):
-        gids = [from_global_id(v)[1] for v in value]
-        return super(GlobalIDMultipleChoiceFilter, self).filter(qs, gids)
+        if not value:
+            return qs
+
+        try:
+            path, target_field = get_filter_target(qs.model, self.field_name)
+        except FieldDoesNotExist:
+            target_field = None
+        if self.conjoined or self.lookup_expr != "exact" or target_field is None:
+            gids = [from_global_id(v)[1] for v in value]
+            return super(GlobalIDMultipleChoiceFilter, self).filter(qs, gids)
+
+        # Decode and convert all the ids in one pass, and look them up
+        # with a single parameter
+        to_python = target_field.to_python
+        ids = [to_python(from_global_id(v)[1]) for v in value]
+        register_array_in(target_field)
+        qs = self.get_method(qs)(
+            **{LOOKUP_SEP.join([path, ArrayIn.lookup_name]): ids}
+        )
+        return qs.distinct() if self.distinct else qs
 
 
 GRAPHENE_FILTER_SET_OVERRIDES = {
@@ -92,14 +201,19 @@ def setup_filterset(filterset_class):
     )
 
 
-def custom_filterset_factory(model, filterset_base_class=FilterSet, **meta):
+def custom_filterset_factory(
+    model, filterset_base_class=FilterSet, search_fields=None, **meta
+):
     """ Create a filterset for the given model using the provided meta data
     """
     meta.update({"model": model})
     meta_class = type(str("Meta"), (object,), meta)
+    attrs = {"Meta": meta_class}
+    if search_fields:
+        attrs["search"] = SearchFilter(fields=search_fields)
     filterset = type(
         str("%sFilterSet" % model._meta.object_name),
         (filterset_base_class, GrapheneFilterSetMixin),
-        {"Meta": meta_class},
+        attrs,
     )
     return filterset
@@ -0,0 +1,314 @@
+import re
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.utils import truncate_name
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+from django.db.models.sql import Query
+from django_filters import CharFilter
+
+from ..settings import graphene_settings
+
+SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+SEARCH_CONFIG_RE = re.compile(r"^[\w.]+$")
+
+
+def get_search_columns(model, fields):
+    """ The database columns of the given fields, that must be local fields
+        of the model
+    """
+    columns = []
+    for name in fields:
+        field = model._meta.get_field(name)
+        assert field.concrete and not field.is_relation, (
+            "Can only search in the columns of {}, received {}."
+        ).format(model.__name__, name)
+        columns.append(field.column)
+    return columns
+
+
+def get_search_config(config):
+    config = config or graphene_settings.SEARCH_CONFIG
+    # It's used in the index definition, so it can't be a query parameter
+    assert SEARCH_CONFIG_RE.match(config), "Invalid search config {}".format(config)
+    return config
+
+
+def get_fts_table(model):
+    """ The SQLite FTS5 table with the searchable columns of the model """
+    return "{}_fts".format(model._meta.db_table)
+
+
+def get_fts_query(value, columns):
+    """ An FTS5 query matching all the words of the value in the columns """
+    tokens = SEARCH_TOKEN_RE.findall(value)
+    if not tokens:
+        return ""
+    return "{{{}}} : ({})".format(
+        " ".join('"{}"'.format(column) for column in columns),
+        " ".join('"{}"'.format(token) for token in tokens),
+    )
+
+
+def has_fts_table(model, connection):
+    """ Whether the FTS5 table of the model was created, checked once for
+        each connection
+    """
+    fts_tables = getattr(connection, "graphene_fts_tables", None)
+    if fts_tables is None:
+        fts_tables = connection.graphene_fts_tables = {}
+    fts_table = get_fts_table(model)
+    if fts_table not in fts_tables:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [fts_table],
+            )
+            fts_tables[fts_table] = cursor.fetchone() is not None
+    return fts_tables[fts_table]
+
+
+def forget_fts_table(model, connection):
+    """ Check again if the FTS5 table of the model exists in the next search """
+    getattr(connection, "graphene_fts_tables", {}).pop(get_fts_table(model), None)
+
+
+def get_search_vector(fields, config):
+    from django.contrib.postgres.search import SearchVector
+
+    return SearchVector(*fields, config=config)
+
+
+def search_postgresql(qs, value, fields, config, rank, name):
+    from django.contrib.postgres.search import SearchQuery, SearchRank
+
+    vector_name = "{}_vector".format(name)
+    query = SearchQuery(value, config=config)
+    qs = qs.annotate(**{vector_name: get_search_vector(fields, config)}).filter(
+        **{vector_name: query}
+    )
+    if rank:
+        rank_name = "{}_rank".format(name)
+        qs = qs.annotate(**{rank_name: SearchRank(F(vector_name), query)}).order_by(
+            "-{}".format(rank_name)
+        )
+    return qs
+
+
+def search_icontains(qs, value, fields):
+    query = Q()
+    for field in fields:
+        query |= Q(**{"{}__icontains".format(field): value})
+    return qs.filter(query)
+
+
+def search_sqlite(qs, value, fields, rank, name):
+    connection = connections[qs.db]
+    if not has_fts_table(qs.model, connection):
+        return search_icontains(qs, value, fields)
+    fts_query = get_fts_query(value, get_search_columns(qs.model, fields))
+    if not fts_query:
+        return qs.none()
+
+    quote_name = connection.ops.quote_name
+    names = {
+        "fts_table": quote_name(get_fts_table(qs.model)),
+        "table": quote_name(qs.model._meta.db_table),
+        "pk": quote_name(qs.model._meta.pk.column),
+    }
+    match_sql = (
+        "{table}.{pk} IN (SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s)"
+    ).format(**names)
+    qs = qs.extra(where=[match_sql], params=[fts_query])
+    if rank:
+        # bm25() is lower for better matches
+        rank_sql = (
+            "SELECT -rank FROM {fts_table} WHERE {fts_table} MATCH %s "
+            "AND rowid = {table}.{pk}"
+        ).format(**names)
+        rank_name = "{}_rank".format(name)
+        qs = qs.annotate(**{rank_name: RawSQL(rank_sql, [fts_query])}).order_by(
+            "-{}".format(rank_name)
+        )
+    return qs
+
+
+class SearchFilter(CharFilter):
+    """ Filter with a full-text search in the given fields, that uses the
+        index created with the graphql_search_index management command.
+
+        In PostgreSQL this is a GIN index of the search vector of the fields,
+        and in SQLite an FTS5 table (whose columns must include the fields).
+        Other databases, and SQLite without the FTS5 table, search the fields
+        with icontains.
+    """
+
+    def __init__(self, fields=None, config=None, rank=False, *args, **kwargs):
+        assert fields, "SearchFilter needs the fields to search in"
+        self.search_fields = tuple(fields)
+        self.search_config = config
+        self.rank = rank
+        super(SearchFilter, self).__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if not value or not value.strip():
+            return qs
+
+        vendor = connections[qs.db].vendor
+        if vendor == "postgresql":
+            qs = search_postgresql(
+                qs,
+                value,
+                self.search_fields,
+                get_search_config(self.search_config),
+                self.rank,
+                self.field_name,
+            )
+        elif vendor == "sqlite":
+            qs = search_sqlite(qs, value, self.search_fields, self.rank, self.field_name)
+        else:
+            qs = search_icontains(qs, value, self.search_fields)
+        return qs.distinct() if self.distinct else qs
+
+
+def quote_value(value):
+    return "'{}'".format(value.replace("'", "''"))
+
+
+def get_search_index_name(model, connection):
+    return truncate_name(
+        "{}_search".format(model._meta.db_table), connection.ops.max_name_length()
+    )
+
+
+def get_search_index_expression(model, fields, config, connection):
+    """ The expression of the PostgreSQL GIN index, that must be the same
+        as the search vector used by SearchFilter
+    """
+    query = Query(model)
+    vector = get_search_vector(fields, config).resolve_expression(query)
+    sql, params = vector.as_sql(query.get_compiler(connection=connection), connection)
+    sql = sql % tuple(quote_value(param) for param in params)
+    # The columns can't be qualified in the index definition
+    return sql.replace("{}.".format(connection.ops.quote_name(model._meta.db_table)), "")
+
+
+def get_sqlite_triggers(model, columns, connection):
+    quote_name = connection.ops.quote_name
+    fts_table = quote_name(get_fts_table(model))
+    table = quote_name(model._meta.db_table)
+    names = ", ".join(quote_name(column) for column in columns)
+
+    def values(row):
+        return ", ".join(
+            "{}.{}".format(row, quote_name(column))
+            for column in [model._meta.pk.column] + columns
+        )
+
+    insert = "INSERT INTO {fts_table}(rowid, {names}) VALUES ({new});"
+    delete = (
+        "INSERT INTO {fts_table}({fts_table}, rowid, {names}) "
+        "VALUES ('delete', {old});"
+    )
+    triggers = [
+        ("ai", "AFTER INSERT", insert),
+        ("ad", "AFTER DELETE", delete),
+        ("au", "AFTER UPDATE", delete + " " + insert),
+    ]
+    return [
+        (
+            "CREATE TRIGGER IF NOT EXISTS {trigger} {event} ON {table} "
+            "BEGIN " + statements + " END"
+        ).format(
+            trigger=quote_name("{}_{}".format(get_fts_table(model), suffix)),
+            event=event,
+            table=table,
+            fts_table=fts_table,
+            names=names,
+            new=values("new"),
+            old=values("old"),
+        )
+        for suffix, event, statements in triggers
+    ]
+
+
+def create_search_index(model, fields, config=None, using=DEFAULT_DB_ALIAS):
+    """ Create the full-text index for the fields of the model, if it
+        doesn't exist, and fill it
+    """
+    connection = connections[using]
+    columns = get_search_columns(model, fields)
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            expression = get_search_index_expression(
+                model, fields, get_search_config(config), connection
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS {} ON {} USING GIN ({})".format(
+                    quote_name(get_search_index_name(model, connection)),
+                    quote_name(model._meta.db_table),
+                    expression,
+                )
+            )
+        elif connection.vendor == "sqlite":
+            cursor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5({}, "
+                "content={}, content_rowid={})".format(
+                    quote_name(get_fts_table(model)),
+                    ", ".join(quote_name(column) for column in columns),
+                    quote_value(model._meta.db_table),
+                    quote_value(model._meta.pk.column),
+                )
+            )
+            for trigger in get_sqlite_triggers(model, columns, connection):
+                cursor.execute(trigger)
+            forget_fts_table(model, connection)
+        else:
+            return False
+    refresh_search_index(model, using)
+    return True
+
+
+def refresh_search_index(model, using=DEFAULT_DB_ALIAS):
+    """ Rebuild the contents of the full-text index of the model """
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "REINDEX INDEX {}".format(
+                    quote_name(get_search_index_name(model, connection))
+                )
+            )
+        elif connection.vendor == "sqlite":
+            fts_table = quote_name(get_fts_table(model))
+            cursor.execute(
+                "INSERT INTO {table}({table}) VALUES ('rebuild')".format(
+                    table=fts_table
+                )
+            )
+
+
+def drop_search_index(model, using=DEFAULT_DB_ALIAS):
+    """ Remove the full-text index of the model """
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "DROP INDEX IF EXISTS {}".format(
+                    quote_name(get_search_index_name(model, connection))
+                )
+            )
+        elif connection.vendor == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                cursor.execute(
+                    "DROP TRIGGER IF EXISTS {}".format(
+                        quote_name("{}_{}".format(get_fts_table(model), suffix))
+                    )
+                )
+            cursor.execute(
+                "DROP TABLE IF EXISTS {}".format(quote_name(get_fts_table(model)))
+            )
+            forget_fts_table(model, connection)
@@ -135,6 +135,28 @@ def test_filter_shortcut_filterset_extra_meta():
     assert "headline" not in field.filterset_class.get_fields()
 
 
+def test_filter_fields_share_filterset_class_and_arguments():
+    field = DjangoFilterConnectionField(ArticleNode, fields=["pub_date", "reporter"])
+    same_field = DjangoFilterConnectionField(
+        ArticleNode, fields=["pub_date", "reporter"]
+    )
+    other_field = DjangoFilterConnectionField(ArticleNode, fields=["pub_date"])
+
+    assert field.filterset_class is same_field.filterset_class
+    assert field.filtering_args is same_field.filtering_args
+    assert field.filterset_class is not other_field.filterset_class
+    assert_arguments(other_field, "pub_date")
+
+
+def test_filter_explicit_filterset_shares_filterset_class():
+    field = DjangoFilterConnectionField(ArticleNode, filterset_class=ArticleFilter)
+    same_field = DjangoFilterConnectionField(
+        ArticleNode, filterset_class=ArticleFilter
+    )
+    assert field.filterset_class is same_field.filterset_class
+    assert issubclass(field.filterset_class, ArticleFilter)
+
+
 def test_filter_shortcut_filterset_context():
     class ArticleContextFilter(django_filters.FilterSet):
         class Meta:
@@ -697,3 +719,327 @@ def test_annotation_is_perserved():
 
     assert not result.errors
     assert result.data == expected
+
+
+def test_filter_pipeline_filters_as_filterset():
+    from graphql_relay import to_global_id
+    from mock import patch
+
+    from ..utils import filter_queryset, get_filter_pipeline, get_filterset_class
+
+    class ArticlePipelineFilter(FilterSet):
+        class Meta:
+            model = Article
+            fields = {
+                "headline": ["exact", "icontains"],
+                "pub_date": ["gt"],
+                "reporter": ["exact"],
+            }
+
+        headline_starts = django_filters.CharFilter(method="filter_headline_starts")
+
+        def filter_headline_starts(self, qs, name, value):
+            return qs.filter(headline__startswith=value)
+
+    filterset_class = get_filterset_class(ArticlePipelineFilter)
+    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
+    r2 = Reporter.objects.create(first_name="r2", last_name="r2", email="r2@test.com")
+    for i, reporter in enumerate([r1, r1, r2]):
+        Article.objects.create(
+            headline="a{}".format(i),
+            pub_date=datetime(2019, 1, i + 1),
+            pub_date_time=datetime.now(),
+            reporter=reporter,
+            editor=reporter,
+        )
+
+    pipeline = get_filter_pipeline(filterset_class)
+    assert pipeline["headline"] is not None
+    assert pipeline["reporter"] is not None
+    assert pipeline["headline_starts"] is None
+
+    def filtered_by_pipeline(data):
+        with patch.object(filterset_class, "__init__", side_effect=AssertionError):
+            qs = filter_queryset(filterset_class, Article.objects.all(), data)
+        return sorted(qs.values_list("headline", flat=True))
+
+    def filtered(data):
+        qs = filter_queryset(filterset_class, Article.objects.all(), data)
+        assert set(qs) == set(filterset_class(data=data).qs)
+        return sorted(qs.values_list("headline", flat=True))
+
+    assert filtered_by_pipeline({"headline": "a1"}) == ["a1"]
+    assert filtered_by_pipeline({"headline": None}) == ["a0", "a1", "a2"]
+    assert filtered_by_pipeline({"headline__icontains": " A "}) == ["a0", "a1", "a2"]
+    assert filtered_by_pipeline({"pub_date__gt": datetime(2019, 1, 2).date()}) == [
+        "a2"
+    ]
+    reporter_id = to_global_id("ReporterNode", r1.pk)
+    assert filtered_by_pipeline({"reporter": reporter_id}) == ["a0", "a1"]
+
+    # The FilterSet is used for the filters with a method and invalid values
+    assert filtered({"headline_starts": "a", "reporter": reporter_id}) == ["a0", "a1"]
+    assert filtered({"reporter": "invalid"}) == ["a0", "a1", "a2"]
+
+
+def test_filter_pipeline_not_used_with_custom_filterset():
+    from ..utils import get_filter_pipeline, get_filterset_class
+
+    class ArticleQuerySetFilter(FilterSet):
+        class Meta:
+            model = Article
+            fields = ["headline"]
+
+        @property
+        def qs(self):
+            return super(ArticleQuerySetFilter, self).qs.distinct()
+
+    assert get_filter_pipeline(get_filterset_class(ArticleQuerySetFilter)) is None
+
+
+def test_global_id_multiple_filter_binds_ids_as_one_parameter():
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from graphql_relay import to_global_id
+
+    class ArticleFilterNode(DjangoObjectType):
+        class Meta:
+            model = Article
+            interfaces = (Node,)
+
+    class ReporterFilterNode(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+            filter_fields = ["articles"]
+
+    class Query(ObjectType):
+        all_reporters = DjangoFilterConnectionField(ReporterFilterNode)
+
+    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
+    r2 = Reporter.objects.create(first_name="r2", last_name="r2", email="r2@test.com")
+    article = Article.objects.create(
+        headline="a1",
+        pub_date=datetime.now(),
+        pub_date_time=datetime.now(),
+        reporter=r1,
+        editor=r2,
+    )
+
+    # More IDs than SQLite allows as parameters of a query
+    article_ids = [to_global_id("ArticleFilterNode", article.pk)] + [
+        to_global_id("ArticleFilterNode", pk) for pk in range(1000, 3000)
+    ]
+    query = """
+    query ($articles: [ID]) {
+        allReporters(articles: $articles) {
+            edges {
+                node {
+                    firstName
+                }
+            }
+        }
+    }
+    """
+    schema = Schema(query=Query)
+    with CaptureQueriesContext(connection) as captured:
+        result = schema.execute(query, variables={"articles": article_ids})
+    assert not result.errors
+    assert result.data["allReporters"]["edges"] == [{"node": {"firstName": "r1"}}]
+    sql = "\n".join(query["sql"] for query in captured.captured_queries)
+    assert "json_each" in sql
+
+
+def get_postgresql_connection():
+    """ A PostgreSQL connection to compile the queries, without a server """
+    pytest.importorskip("psycopg2")
+    from django.db.backends.postgresql.base import DatabaseWrapper
+
+    return DatabaseWrapper(
+        {
+            "NAME": "test",
+            "USER": "",
+            "PASSWORD": "",
+            "HOST": "",
+            "PORT": "",
+            "OPTIONS": {},
+            "TIME_ZONE": None,
+            "CONN_MAX_AGE": 0,
+            "AUTOCOMMIT": True,
+            "ATOMIC_REQUESTS": False,
+        },
+        alias="postgresql",
+    )
+
+
+def test_global_id_multiple_filter_uses_any_on_postgresql():
+    from ..filterset import register_array_in
+
+    connection = get_postgresql_connection()
+    register_array_in(Article._meta.pk)
+    qs = Reporter.objects.filter(articles__pk__graphene_in=[1, "2", 2, None])
+    sql, params = qs.query.get_compiler(connection=connection).as_sql()
+    assert sql.endswith('WHERE "tests_article"."id" = ANY(%s)')
+    assert params == ([1, 2],)
+
+
+def test_array_in_lookup_converts_values_and_falls_back_to_in():
+    from django.db import connection
+    from django.db import models
+
+    from ..filterset import ArrayIn, register_array_in
+
+    # Only registered on the fields the filter uses
+    assert models.TextField().get_lookup(ArrayIn.lookup_name) is None
+
+    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
+    article = Article.objects.create(
+        headline="a1",
+        pub_date=datetime(2020, 1, 2).date(),
+        pub_date_time=datetime.now(),
+        reporter=r1,
+        editor=r1,
+    )
+    register_array_in(Article._meta.get_field("pub_date"))
+    try:
+        # The values are converted as the ones of the column
+        qs = Article.objects.filter(pub_date__graphene_in=[article.pub_date])
+        assert list(qs) == [article]
+    finally:
+        models.DateField._unregister_lookup(ArrayIn)
+
+    # SQLite without JSON1
+    register_array_in(Article._meta.pk)
+    supported = getattr(connection, "graphene_json_each", None)
+    connection.graphene_json_each = False
+    try:
+        qs = Article.objects.filter(pk__graphene_in=[article.pk])
+        assert "json_each" not in str(qs.query)
+        assert list(qs) == [article]
+    finally:
+        connection.graphene_json_each = supported
+
+
+def test_filter_connection_facets(django_assert_num_queries):
+    from graphql_relay import to_global_id
+
+    from ...registry import Registry
+
+    facet_registry = Registry()
+
+    class ReporterFacetNode(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+            registry = facet_registry
+
+    class ArticleFacetNode(DjangoObjectType):
+        class Meta:
+            model = Article
+            interfaces = (Node,)
+            registry = facet_registry
+            filter_fields = {"lang": ["exact", "in"], "reporter": ["exact"]}
+            facet_fields = ("lang", "reporter")
+
+    class Query(ObjectType):
+        articles = DjangoFilterConnectionField(ArticleFacetNode)
+
+    r1 = Reporter.objects.create(first_name="r1", last_name="r1", email="r1@test.com")
+    r2 = Reporter.objects.create(first_name="r2", last_name="r2", email="r2@test.com")
+    for reporter, lang in [(r1, "es"), (r1, "es"), (r1, "en"), (r2, "es")]:
+        Article.objects.create(
+            headline="a",
+            pub_date=datetime.now(),
+            pub_date_time=datetime.now(),
+            reporter=reporter,
+            editor=reporter,
+            lang=lang,
+        )
+
+    query = """
+        query {
+            articles(first: 1, lang: "es", reporter: "%s") {
+                edges { node { lang } }
+                facets {
+                    lang { value count }
+                    reporter { value count }
+                }
+            }
+        }
+    """ % to_global_id(
+        "ReporterFacetNode", r1.pk
+    )
+
+    schema = Schema(query=Query)
+    # The count, the page and a GROUP BY query for each facet
+    with django_assert_num_queries(4):
+        result = schema.execute(query)
+    assert not result.errors
+    assert result.data["articles"]["edges"] == [{"node": {"lang": "ES"}}]
+    # Every facet is filtered by the other filters, but not by its own
+    assert result.data["articles"]["facets"] == {
+        "lang": [{"value": "es", "count": 2}, {"value": "en", "count": 1}],
+        "reporter": [
+            {"value": to_global_id("ReporterFacetNode", r1.pk), "count": 2},
+            {"value": to_global_id("ReporterFacetNode", r2.pk), "count": 1},
+        ],
+    }
+
+    # Only the selected facets are computed
+    with django_assert_num_queries(3):
+        result = schema.execute(
+            "query { articles(lang: \"en\") { facets { lang { value count } } } }"
+        )
+    assert not result.errors
+    assert result.data["articles"]["facets"]["lang"] == [
+        {"value": "es", "count": 3},
+        {"value": "en", "count": 1},
+    ]
+
+
+def test_filter_connection_queryset_sql_on_postgresql():
+    from ..utils import get_filterset_class
+
+    connection = get_postgresql_connection()
+
+    class ReporterFilter(FilterSet):
+        headline = django_filters.CharFilter(
+            field_name="articles__headline", distinct=True
+        )
+
+        class Meta:
+            model = Reporter
+            fields = ["first_name"]
+
+    filterset_class = get_filterset_class(ReporterFilter)
+    field = DjangoFilterConnectionField
+
+    def get_sql(filter_kwargs, iterable):
+        queryset = field.filter_iterable(
+            filterset_class, filter_kwargs, Reporter.doe_objects, None, iterable
+        )
+        if iterable is not None:
+            queryset = field.merge_querysets(
+                Reporter.doe_objects.get_queryset(), queryset
+            )
+        sql, params = queryset.query.get_compiler(connection=connection).as_sql()
+        return sql % tuple(params)
+
+    # The filters are applied once, and the manager conditions are always
+    # added to the resolver queryset, without subqueries nor DISTINCT
+    sql = get_sql({"first_name": "John"}, Reporter.doe_objects.order_by("pk")[:5])
+    assert sql.startswith('SELECT "tests_reporter"."id"')
+    assert sql.count("SELECT") == 1
+    assert '"tests_reporter"."last_name" = Doe' in sql
+    assert sql.count('"tests_reporter"."first_name" = John') == 1
+    assert sql.endswith("LIMIT 5")
+
+    sql = get_sql({"first_name": "John"}, Reporter.objects.filter(a_choice=1))
+    assert sql.count('"tests_reporter"."last_name" = Doe') == 1
+    assert sql.count('"tests_reporter"."a_choice" = 1') == 1
+
+    # Filtering by a reverse relation can repeat the reporters
+    sql = get_sql({"headline": "Hi"}, None)
+    assert sql.startswith('SELECT DISTINCT "tests_reporter"."id"')
+    assert sql.count("INNER JOIN") == 1
+    assert sql.count('"tests_reporter"."last_name" = Doe') == 1
@@ -0,0 +1,162 @@
+import pytest
+from django.core import management
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from six import StringIO
+
+from graphene import ObjectType, Schema
+from graphene.relay import Node
+from graphene_django import DjangoObjectType
+from graphene_django.tests.models import Reporter
+from graphene_django.utils import DJANGO_FILTER_INSTALLED
+
+pytestmark = []
+
+if DJANGO_FILTER_INSTALLED:
+    from django_filters import FilterSet
+
+    from graphene_django.filter import DjangoFilterConnectionField, SearchFilter
+    from graphene_django.filter.search import (
+        get_search_index_expression,
+        search_postgresql,
+    )
+else:
+    pytestmark.append(
+        pytest.mark.skipif(
+            True, reason="django_filters not installed or not compatible"
+        )
+    )
+
+pytestmark.append(pytest.mark.django_db)
+
+
+if DJANGO_FILTER_INSTALLED:
+
+    class ReporterSearchNode(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+            filter_fields = ("a_choice",)
+            search_fields = ("first_name", "last_name", "email")
+
+    class ReporterRankFilter(FilterSet):
+        class Meta:
+            model = Reporter
+            fields = ()
+
+        search = SearchFilter(fields=("first_name", "last_name"), rank=True)
+
+    class Query(ObjectType):
+        reporters = DjangoFilterConnectionField(ReporterSearchNode)
+        ranked_reporters = DjangoFilterConnectionField(
+            ReporterSearchNode, filterset_class=ReporterRankFilter
+        )
+
+    schema = Schema(query=Query)
+
+
+def search(field, text):
+    query = """
+    query ($text: String) {
+        %s(search: $text) {
+            edges {
+                node {
+                    firstName
+                }
+            }
+        }
+    }
+    """ % field
+    result = schema.execute(query, variables={"text": text})
+    assert not result.errors
+    return [edge["node"]["firstName"] for edge in result.data[field]["edges"]]
+
+
+def test_search_in_sqlite_fts_index():
+    Reporter.objects.create(first_name="John", last_name="Doe", email="jd@test.com")
+    Reporter.objects.create(first_name="Jane", last_name="Roe", email="jane@doe.com")
+
+    out = StringIO()
+    management.call_command(
+        "graphql_search_index",
+        "graphene_django.filter.tests.test_search.ReporterSearchNode",
+        stdout=out,
+    )
+    assert "Created the search index of ReporterSearchNode" in out.getvalue()
+
+    assert search("reporters", "doe") == ["John", "Jane"]
+    assert search("reporters", "john doe") == ["John"]
+    assert search("reporters", "(nobody)") == []
+    assert search("reporters", "") == ["John", "Jane"]
+
+    # The index is kept up to date
+    Reporter.objects.create(first_name="Doe", last_name="Doe", email="doe@doe.com")
+    Reporter.objects.filter(first_name="John").update(last_name="Smith")
+    assert search("reporters", "doe") == ["Jane", "Doe"]
+    # The ranked search is only in the names, not the email
+    Reporter.objects.create(first_name="Jim", last_name="Doe", email="jim@test.com")
+    assert search("rankedReporters", "doe") == ["Doe", "Jim"]
+
+    out = StringIO()
+    management.call_command(
+        "graphql_search_index", "ReporterSearchNode", schema=schema, refresh=True,
+        stdout=out,
+    )
+    assert "Refreshed the search index of ReporterSearchNode" in out.getvalue()
+    assert search("reporters", "smith") == ["John"]
+
+    management.call_command(
+        "graphql_search_index", "ReporterSearchNode", schema=schema, drop=True,
+        stdout=out,
+    )
+
+    # Without the index the fields are searched with icontains
+    assert search("rankedReporters", "jo") == ["John"]
+
+
+def test_search_in_sqlite_checks_fts_table_once():
+    Reporter.objects.create(first_name="John", last_name="Doe", email="jd@test.com")
+    connection = connections["default"]
+    connection.graphene_fts_tables = {}
+
+    with CaptureQueriesContext(connection) as queries:
+        assert search("reporters", "jo") == ["John"]
+        assert search("reporters", "doe") == ["John"]
+    checks = [query for query in queries if "sqlite_master" in query["sql"]]
+    assert len(checks) == 1
+
+
+def test_search_index_matches_postgresql_search():
+    pytest.importorskip("psycopg2")
+    from django.db.backends.postgresql.base import DatabaseWrapper
+
+    connection = DatabaseWrapper(
+        {
+            "NAME": "test",
+            "USER": "",
+            "PASSWORD": "",
+            "HOST": "",
+            "PORT": "",
+            "OPTIONS": {},
+            "TIME_ZONE": None,
+            "CONN_MAX_AGE": 0,
+            "AUTOCOMMIT": True,
+            "ATOMIC_REQUESTS": False,
+        },
+        alias="postgresql",
+    )
+    fields = ("first_name", "last_name")
+    expression = get_search_index_expression(Reporter, fields, "english", connection)
+    assert expression == (
+        "to_tsvector('english'::regconfig, "
+        "COALESCE(\"first_name\", '') || ' ' || COALESCE(\"last_name\", ''))"
+    )
+
+    qs = search_postgresql(
+        Reporter.objects.all(), "doe", fields, "english", True, "search"
+    )
+    sql, params = qs.query.get_compiler(connection=connection).as_sql()
+    sql = sql % tuple("'{}'".format(param) for param in params)
+    assert expression in sql.replace('"tests_reporter".', "")
+    assert "plainto_tsquery('english'::regconfig, 'doe')" in sql
+    assert sql.endswith('ORDER BY "search_rank" DESC')
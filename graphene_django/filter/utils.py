@@ -1,6 +1,61 @@
+from collections import OrderedDict
+
+import django_filters
 import six
+from django import forms
+from django.core.exceptions import ValidationError
+from django.forms.widgets import Widget
+from django_filters.filterset import BaseFilterSet
+
+from .filterset import (
+    GlobalIDFilter,
+    GlobalIDMultipleChoiceFilter,
+    custom_filterset_factory,
+    setup_filterset,
+)
+from .search import SearchFilter
+
+# The FilterSet classes and the filtering arguments are shared by all the
+# fields with the same filter definition, see get_filterset_class
+_filterset_class_cache = {}
+_filtering_args_cache = {}
+_filter_pipeline_cache = {}
+
+# Filters that only use their own attributes to filter (not the FilterSet
+# they belong to), so they can be applied without instantiating it
+PIPELINE_FILTERS = (
+    django_filters.Filter,
+    django_filters.CharFilter,
+    django_filters.BooleanFilter,
+    django_filters.ChoiceFilter,
+    django_filters.TypedChoiceFilter,
+    django_filters.MultipleChoiceFilter,
+    django_filters.TypedMultipleChoiceFilter,
+    django_filters.DateFilter,
+    django_filters.DateTimeFilter,
+    django_filters.IsoDateTimeFilter,
+    django_filters.TimeFilter,
+    django_filters.DurationFilter,
+    django_filters.NumberFilter,
+    django_filters.UUIDFilter,
+    GlobalIDFilter,
+    GlobalIDMultipleChoiceFilter,
+    SearchFilter,
+)
+
+# Form fields that clean the values GraphQL already coerced (when they don't
+# have validators) to the same values
+COERCED_FORM_FIELDS = (
+    forms.IntegerField,
+    forms.FloatField,
+    forms.DateField,
+    forms.TimeField,
+    forms.UUIDField,
+    forms.NullBooleanField,
+)
 
-from .filterset import custom_filterset_factory, setup_filterset
+# The FilterSet methods that make it use the form (or the filters) differently
+FILTERSET_METHODS = ("__init__", "form", "get_form_class", "filter_queryset", "qs")
 
 
 def get_filtering_args_from_filterset(filterset_class, type):
@@ -8,6 +63,11 @@ def get_filtering_args_from_filterset(filterset_class, type):
         a Graphene Field. These arguments will be available to
         filter against in the GraphQL
     """
+    cache_key = (filterset_class, type)
+    args = _filtering_args_cache.get(cache_key)
+    if args is not None:
+        return args
+
     from ..forms.converter import convert_form_field
 
     args = {}
@@ -16,13 +76,139 @@ def get_filtering_args_from_filterset(filterset_class, type):
         field_type.description = filter_field.label
         args[name] = field_type
 
+    _filtering_args_cache[cache_key] = args
     return args
 
 
+def make_hashable(value):
+    """ Turn the lists and dicts of a FilterSet Meta option into tuples """
+    if isinstance(value, dict):
+        return tuple((key, make_hashable(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return tuple(make_hashable(val) for val in value)
+    return value
+
+
+def get_filterset_cache_key(filterset_class, meta):
+    """ The key of the FilterSet class for the given definition, or None
+        if it can't be cached
+    """
+    if filterset_class:
+        cache_key = (filterset_class,)
+    else:
+        cache_key = tuple(
+            (key, make_hashable(meta[key])) for key in sorted(meta)
+        )
+    try:
+        hash(cache_key)
+    except TypeError:
+        return None
+    return cache_key
+
+
 def get_filterset_class(filterset_class, **meta):
     """Get the class to be used as the FilterSet"""
+    cache_key = get_filterset_cache_key(filterset_class, meta)
+    if cache_key is not None and cache_key in _filterset_class_cache:
+        return _filterset_class_cache[cache_key]
+
     if filterset_class:
         # If were given a FilterSet class, then set it up and
         # return it
-        return setup_filterset(filterset_class)
-    return custom_filterset_factory(**meta)
+        graphene_filterset_class = setup_filterset(filterset_class)
+    else:
+        graphene_filterset_class = custom_filterset_factory(**meta)
+
+    if cache_key is not None:
+        _filterset_class_cache[cache_key] = graphene_filterset_class
+    return graphene_filterset_class
+
+
+def is_default_filterset(filterset_class):
+    """ Check if the FilterSet filters its queryset as BaseFilterSet does """
+    if filterset_class._meta.form is not forms.Form:
+        return False
+    for name in FILTERSET_METHODS:
+        method = getattr(filterset_class, name)
+        base_method = getattr(BaseFilterSet, name)
+        # Unbound methods in Python 2
+        if getattr(method, "__func__", method) is not getattr(
+            base_method, "__func__", base_method
+        ):
+            return False
+    return True
+
+
+def get_filter_step(filter_field):
+    """ The (filter, read value, clean value) step to apply a filter
+        without its FilterSet, or None if it needs the FilterSet
+    """
+    if type(filter_field) not in PIPELINE_FILTERS or filter_field.method:
+        return None
+
+    field = filter_field.field
+    if field.disabled:
+        return None
+
+    read_value = None
+    if type(field.widget).value_from_datadict is not Widget.value_from_datadict:
+        read_value = field.widget.value_from_datadict
+
+    clean_value = field.clean
+    if type(field) in COERCED_FORM_FIELDS and not field.validators:
+        clean_value = None
+
+    return filter_field, read_value, clean_value
+
+
+def get_filter_pipeline(filterset_class):
+    """ Compile the steps to apply each filter of the FilterSet straight to
+        a queryset, with the filters that need the FilterSet (like the ones
+        with a method) mapped to None.
+        Returns None if the FilterSet always has to be used.
+    """
+    if filterset_class in _filter_pipeline_cache:
+        return _filter_pipeline_cache[filterset_class]
+
+    pipeline = None
+    if is_default_filterset(filterset_class):
+        pipeline = OrderedDict(
+            (name, get_filter_step(filter_field))
+            for name, filter_field in six.iteritems(filterset_class.base_filters)
+        )
+
+    _filter_pipeline_cache[filterset_class] = pipeline
+    return pipeline
+
+
+def filter_queryset(filterset_class, queryset, data, request=None):
+    """ Filter the queryset with the given (GraphQL coerced) arguments.
+
+        The arguments are cleaned by the form field of each filter and applied
+        in order, as the FilterSet would do, but without building the FilterSet
+        and its form. The FilterSet is still used if any of the given filters
+        need it, or if any value is invalid.
+    """
+    pipeline = get_filter_pipeline(filterset_class)
+    steps = None
+    if pipeline is not None:
+        steps = [(name, step) for name, step in six.iteritems(pipeline) if name in data]
+        if any(step is None for _, step in steps):
+            steps = None
+
+    if steps is not None:
+        try:
+            qs = queryset.all()
+            for name, (filter_field, read_value, clean_value) in steps:
+                value = data[name]
+                if read_value:
+                    value = read_value(data, {}, name)
+                if clean_value:
+                    value = clean_value(value)
+                qs = filter_field.filter(qs, value)
+            return qs
+        except ValidationError:
+            # Invalid values are handled by the FilterSet as usual
+            pass
+
+    return filterset_class(data=data, queryset=queryset, request=request).qs
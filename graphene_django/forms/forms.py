@@ -38,3 +38,19 @@ class GlobalIDMultipleChoiceField(MultipleChoiceField):
         # Clean will raise a validation error if there is a problem
         GlobalIDFormField().clean(value)
         return True
+
+    def validate(self, value):
+        if self.required and not value:
+            raise ValidationError(self.error_messages["required"], code="required")
+        # Decode every ID once, instead of cleaning it with a new form field
+        for val in value:
+            try:
+                _type, _id = from_global_id(val)
+            except (TypeError, ValueError, UnicodeDecodeError, binascii.Error):
+                _type = _id = None
+            if not (_type and _type.strip() and _id and _id.strip()):
+                raise ValidationError(
+                    self.error_messages["invalid_choice"],
+                    code="invalid_choice",
+                    params={"value": val},
+                )
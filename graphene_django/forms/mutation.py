@@ -1,9 +1,11 @@
 # from django import forms
 from collections import OrderedDict
 
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import router, transaction
+
 import graphene
 from graphene import Field, InputField
-from graphene.relay.mutation import ClientIDMutation
 from graphene.types.mutation import MutationOptions
 
 # from graphene.types.inputobjecttype import (
@@ -11,7 +13,10 @@ from graphene.types.mutation import MutationOptions
 #     InputObjectType,
 # )
 from graphene.types.utils import yank_fields_from_attrs
+from graphene_django.idempotency import IdempotentMutation
+from graphene_django.optimization import reload_payload_objects
 from graphene_django.registry import get_global_registry
+from graphene_django.utils import bulk_save, get_model_queryset
 
 from .converter import convert_form_field
 from .types import ErrorType
@@ -34,7 +39,7 @@ def fields_for_form(form, only_fields, exclude_fields):
     return fields
 
 
-class BaseDjangoFormMutation(ClientIDMutation):
+class BaseDjangoFormMutation(IdempotentMutation):
     class Meta:
         abstract = True
 
@@ -63,7 +68,7 @@ class BaseDjangoFormMutation(ClientIDMutation):
 
         pk = input.pop("id", None)
         if pk:
-            instance = cls._meta.model._default_manager.get(pk=pk)
+            instance = get_model_queryset(cls._meta.model, info).get(pk=pk)
             kwargs["instance"] = instance
 
         return kwargs
@@ -188,5 +193,195 @@ class DjangoModelFormMutation(BaseDjangoFormMutation):
     @classmethod
     def perform_mutate(cls, form, info):
         obj = form.save()
+        # Load the relations selected in the payload with the object
+        (obj,) = reload_payload_objects(
+            cls._meta.model, [obj], info, cls._meta.return_field_name
+        )
         kwargs = {cls._meta.return_field_name: obj}
         return cls(errors=[], **kwargs)
+
+
+def get_update_fields(model, form):
+    """ The model fields that the form can change, to update them in bulk """
+    names = []
+    for name in form.fields:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if field.concrete and not field.many_to_many and not field.primary_key:
+            names.append(field.name)
+    return names
+
+
+class DjangoModelFormBulkMutation(IdempotentMutation):
+    """ Create or update many objects with a ModelForm each, given a list
+        of items with the inputs of the form (and the id of the object to
+        update). The objects are only saved if all the forms are valid.
+    """
+
+    class Meta:
+        abstract = True
+
+    errors = graphene.List(ErrorType)
+
+    @classmethod
+    def __init_subclass_with_meta__(
+        cls,
+        form_class=None,
+        model=None,
+        return_field_name=None,
+        only_fields=(),
+        exclude_fields=(),
+        **options
+    ):
+
+        if not form_class:
+            raise Exception("form_class is required for DjangoModelFormBulkMutation")
+
+        if not model:
+            model = form_class._meta.model
+
+        if not model:
+            raise Exception("model is required for DjangoModelFormBulkMutation")
+
+        form = form_class()
+        item_fields = fields_for_form(form, only_fields, exclude_fields)
+        if "id" not in exclude_fields:
+            item_fields["id"] = graphene.ID()
+        item_type = type(
+            str("{}Item".format(cls.__name__)),
+            (graphene.InputObjectType,),
+            yank_fields_from_attrs(item_fields, _as=InputField),
+        )
+
+        registry = get_global_registry()
+        model_type = registry.get_type_for_model(model)
+        if not return_field_name:
+            model_name = model.__name__
+            return_field_name = model_name[:1].lower() + model_name[1:] + "s"
+
+        output_fields = OrderedDict()
+        output_fields[return_field_name] = graphene.List(model_type)
+
+        _meta = DjangoModelDjangoFormMutationOptions(cls)
+        _meta.form_class = form_class
+        _meta.model = model
+        _meta.return_field_name = return_field_name
+        _meta.fields = yank_fields_from_attrs(output_fields, _as=Field)
+
+        input_fields = OrderedDict(
+            [("items", graphene.List(graphene.NonNull(item_type), required=True))]
+        )
+        input_fields = yank_fields_from_attrs(input_fields, _as=InputField)
+        super(DjangoModelFormBulkMutation, cls).__init_subclass_with_meta__(
+            _meta=_meta, input_fields=input_fields, **options
+        )
+
+    @classmethod
+    def mutate_and_get_payload(cls, root, info, items, **input):
+        forms, id_errors = cls.get_forms(root, info, items)
+
+        errors = []
+        for index, form in enumerate(forms):
+            if index in id_errors:
+                errors.append(
+                    ErrorType(
+                        field="items.{}.id".format(index), messages=id_errors[index]
+                    )
+                )
+            elif not form.is_valid():
+                errors.extend(
+                    ErrorType(field="items.{}.{}".format(index, key), messages=value)
+                    for key, value in form.errors.items()
+                )
+
+        if errors:
+            return cls(errors=errors)
+        return cls.perform_mutate(forms, info)
+
+    @classmethod
+    def get_item_pks(cls, items):
+        """ The primary key of each item with an id, and the errors of the
+            items whose id is invalid or repeated
+        """
+        pk_field = cls._meta.model._meta.pk
+        pks = OrderedDict()
+        seen = set()
+        errors = {}
+        for index, item in enumerate(items):
+            if not item.get("id"):
+                continue
+            try:
+                pk = pk_field.to_python(item["id"])
+            except ValidationError as e:
+                errors[index] = list(e.messages)
+                continue
+            if pk in seen:
+                errors[index] = ["The id is repeated in the items."]
+                continue
+            seen.add(pk)
+            pks[index] = pk
+        return pks, errors
+
+    @classmethod
+    def get_forms(cls, root, info, items):
+        """ The form of each item, with the existing objects loaded in one
+            query, and the errors of the ids of the items by their index
+            (whose form is None)
+        """
+        model = cls._meta.model
+        pks, errors = cls.get_item_pks(items)
+        instances = (
+            get_model_queryset(model, info).in_bulk(list(pks.values())) if pks else {}
+        )
+
+        forms = []
+        for index, item in enumerate(items):
+            data = dict(item)
+            data.pop("id", None)
+            instance = None
+            if index in pks:
+                instance = instances.get(pks[index])
+                if instance is None:
+                    errors[index] = [
+                        "{} matching query does not exist.".format(
+                            model._meta.object_name
+                        )
+                    ]
+            if index in errors:
+                forms.append(None)
+                continue
+            form_kwargs = cls.get_form_kwargs(root, info, data, instance)
+            forms.append(cls._meta.form_class(**form_kwargs))
+        return forms, errors
+
+    @classmethod
+    def get_form_kwargs(cls, root, info, data, instance):
+        kwargs = {"data": data}
+        if instance is not None:
+            kwargs["instance"] = instance
+        return kwargs
+
+    @classmethod
+    def perform_mutate(cls, forms, info):
+        using = router.db_for_write(cls._meta.model)
+        with transaction.atomic(using=using):
+            objs = cls.save_forms(forms, using)
+        objs = reload_payload_objects(
+            cls._meta.model, objs, info, cls._meta.return_field_name
+        )
+        kwargs = {cls._meta.return_field_name: objs}
+        return cls(errors=[], **kwargs)
+
+    @classmethod
+    def save_forms(cls, forms, using):
+        """ Save the objects of the valid forms, in bulk when possible """
+        model = cls._meta.model
+        objs = [form.save(commit=False) for form in forms]
+        update_fields = get_update_fields(model, forms[0]) if forms else []
+        bulk_save(model, objs, update_fields, using)
+
+        for form in forms:
+            form.save_m2m()
+        return objs
@@ -2,8 +2,15 @@ from django import forms
 from django.test import TestCase
 from py.test import raises
 
-from graphene_django.tests.models import Pet, Film, FilmDetails
-from ..mutation import DjangoFormMutation, DjangoModelFormMutation
+from graphene import Field, ObjectType, Schema
+from graphene_django import DjangoObjectType
+from graphene_django.registry import Registry
+from graphene_django.tests.models import Pet, Film, FilmDetails, Reporter
+from ..mutation import (
+    DjangoFormMutation,
+    DjangoModelFormBulkMutation,
+    DjangoModelFormMutation,
+)
 
 
 class MyForm(forms.Form):
@@ -139,3 +146,212 @@ class ModelFormMutationTests(TestCase):
         self.assertEqual(result.errors[0].messages, ["This field is required."])
         self.assertIn("age", fields_w_error)
         self.assertEqual(result.errors[1].messages, ["This field is required."])
+
+
+class ModelFormBulkMutationTests(TestCase):
+    def test_default_meta_fields(self):
+        class PetBulkMutation(DjangoModelFormBulkMutation):
+            class Meta:
+                form_class = PetForm
+
+        self.assertEqual(PetBulkMutation._meta.model, Pet)
+        self.assertEqual(PetBulkMutation._meta.return_field_name, "pets")
+        self.assertIn("pets", PetBulkMutation._meta.fields)
+        self.assertIn("items", PetBulkMutation.Input._meta.fields)
+        item_type = PetBulkMutation.Input._meta.fields["items"].type.of_type.of_type
+        item_fields = item_type.of_type._meta.fields
+        self.assertIn("name", item_fields)
+        self.assertIn("id", item_fields)
+
+    def test_bulk_mutation_mutate(self):
+        class PetBulkMutation(DjangoModelFormBulkMutation):
+            class Meta:
+                form_class = PetForm
+
+        axel = Pet.objects.create(name="Axel", age=10)
+        bo = Pet.objects.create(name="Bo", age=3)
+
+        items = [
+            {"id": str(axel.pk), "name": "Mia", "age": 11},
+            {"name": "Rex", "age": 1},
+            {"id": bo.pk, "name": "Bo", "age": 4},
+        ]
+        # Loading the pets, inserting one (or saving it when the database
+        # doesn't return the ids of the inserted rows) and updating the
+        # others, in a savepoint
+        with self.assertNumQueries(5):
+            result = PetBulkMutation.mutate_and_get_payload(None, None, items=items)
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual([pet.name for pet in result.pets], ["Mia", "Rex", "Bo"])
+        self.assertTrue(all(pet.pk for pet in result.pets))
+        self.assertEqual(
+            sorted(Pet.objects.values_list("name", "age")),
+            [("Bo", 4), ("Mia", 11), ("Rex", 1)],
+        )
+
+    def test_bulk_mutation_mutate_invalid_forms(self):
+        class PetBulkMutation(DjangoModelFormBulkMutation):
+            class Meta:
+                form_class = PetForm
+
+        axel = Pet.objects.create(name="Axel", age=10)
+
+        items = [
+            {"id": axel.pk, "name": "Mia", "age": 11},
+            {"name": "Rex"},
+            {"id": axel.pk + 1, "name": "Bo", "age": 4},
+        ]
+        result = PetBulkMutation.mutate_and_get_payload(None, None, items=items)
+
+        # Nothing is saved
+        axel.refresh_from_db()
+        self.assertEqual(axel.name, "Axel")
+        self.assertEqual(Pet.objects.count(), 1)
+
+        self.assertEqual(
+            [(e.field, e.messages) for e in result.errors],
+            [
+                ("items.1.age", ["This field is required."]),
+                ("items.2.id", ["Pet matching query does not exist."]),
+            ],
+        )
+
+    def test_bulk_mutation_mutate_invalid_ids(self):
+        class PetBulkMutation(DjangoModelFormBulkMutation):
+            class Meta:
+                form_class = PetForm
+
+        axel = Pet.objects.create(name="Axel", age=10)
+
+        items = [
+            {"id": "axel", "name": "Mia", "age": 11},
+            {"id": axel.pk, "name": "Mia", "age": 11},
+            {"id": str(axel.pk), "name": "Bo", "age": 4},
+        ]
+        result = PetBulkMutation.mutate_and_get_payload(None, None, items=items)
+
+        axel.refresh_from_db()
+        self.assertEqual(axel.name, "Axel")
+        self.assertEqual(
+            [e.field for e in result.errors], ["items.0.id", "items.2.id"]
+        )
+        self.assertIn("must be an integer", result.errors[0].messages[0])
+        self.assertEqual(result.errors[1].messages, ["The id is repeated in the items."])
+
+
+class ModelFormMutationPayloadTests(TestCase):
+    def test_model_form_mutation_loads_selected_relations(self):
+        class FilmForm(forms.ModelForm):
+            class Meta:
+                model = Film
+                fields = ("genre",)
+
+        class FilmType(DjangoObjectType):
+            class Meta:
+                model = Film
+                registry = Registry()
+                only_fields = ("id", "genre", "details", "reporters")
+
+        class FilmDetailsType(DjangoObjectType):
+            class Meta:
+                model = FilmDetails
+                registry = FilmType._meta.registry
+
+        class ReporterType(DjangoObjectType):
+            class Meta:
+                model = Reporter
+                registry = FilmType._meta.registry
+                only_fields = ("id", "first_name")
+
+        class FilmMutation(DjangoModelFormMutation):
+            film = Field(FilmType)
+
+            class Meta:
+                form_class = FilmForm
+
+        class Mutation(ObjectType):
+            film_mutation = FilmMutation.Field()
+
+        film = Film.objects.create(genre="ot")
+        FilmDetails.objects.create(film=film, location="Rome")
+        film.reporters.add(
+            Reporter.objects.create(first_name="Jane", last_name="Doe", a_choice=1),
+            Reporter.objects.create(first_name="John", last_name="Doe", a_choice=1),
+        )
+
+        query = """
+            mutation FilmMutation($input: FilmMutationInput!) {
+              filmMutation(input: $input) {
+                film {
+                  genre
+                  details { location }
+                  reporters { firstName }
+                }
+              }
+            }
+        """
+        schema = Schema(query=Mutation, mutation=Mutation)
+        # Loading and saving the film, and loading it again with its details
+        # and prefetching its reporters
+        with self.assertNumQueries(4):
+            result = schema.execute(
+                query, variable_values={"input": {"id": film.pk, "genre": "do"}}
+            )
+
+        self.assertFalse(result.errors)
+        self.assertEqual(
+            result.data["filmMutation"]["film"],
+            {
+                "genre": "DO",
+                "details": {"location": "Rome"},
+                "reporters": [{"firstName": "Jane"}, {"firstName": "John"}],
+            },
+        )
+
+    def test_model_form_mutation_only_updates_owned_objects(self):
+        from mock import Mock
+
+        from graphene_django.registry import get_global_registry
+
+        class FilmForm(forms.ModelForm):
+            class Meta:
+                model = Film
+                fields = ("genre",)
+
+        class FilmMutation(DjangoModelFormMutation):
+            class Meta:
+                form_class = FilmForm
+
+        registry = get_global_registry()
+        previous_type = registry.get_type_for_model(Film)
+
+        class FilmType(DjangoObjectType):
+            class Meta:
+                model = Film
+                owner_fields = ("reporters",)
+
+        try:
+            john = Reporter.objects.create(first_name="John", a_choice=1)
+            john.is_authenticated = True
+            jane = Reporter.objects.create(first_name="Jane", a_choice=1)
+            film = Film.objects.create(genre="ot")
+            film.reporters.add(john, jane)
+            other_film = Film.objects.create(genre="ot")
+            other_film.reporters.add(jane)
+
+            info = Mock(context=Mock(user=john), field_asts=[])
+            FilmMutation.mutate_and_get_payload(None, info, id=film.pk, genre="do")
+            with self.assertRaises(Film.DoesNotExist):
+                FilmMutation.mutate_and_get_payload(
+                    None, info, id=other_film.pk, genre="do"
+                )
+        finally:
+            if previous_type:
+                registry.register(previous_type)
+            else:
+                registry._registry.pop(Film)
+
+        self.assertEqual(
+            sorted(Film.objects.values_list("genre", flat=True)), ["do", "ot"]
+        )
@@ -0,0 +1,245 @@
+"""
+Idempotency keys for mutations.
+
+Clients that retry a mutation (as on flaky networks) send the same
+``idempotencyKey`` in each attempt. The payload of the first attempt is
+kept in a store, per mutation, user and key, and the retries get it back
+without running the mutation again.
+"""
+import hashlib
+import json
+import logging
+from collections import namedtuple
+
+from django.apps import apps
+from django.db import models
+
+from graphene import List, NonNull, ObjectType, String
+from graphene.types.mutation import MutationOptions
+from graphene.relay.mutation import ClientIDMutation
+from promise import Promise, is_thenable
+
+from .settings import graphene_settings
+
+
+logger = logging.getLogger(__name__)
+
+# The payloads are stored with the values of their fields, the model
+# instances as their model and field values, and the objects of the other
+# types as the values of their fields, so they are rebuilt with the types
+# of the mutation (that can be created dynamically, and not pickled)
+StoredModel = namedtuple("StoredModel", ["label", "db", "names", "values"])
+StoredObject = namedtuple("StoredObject", ["fields"])
+
+# Stored instead of the payload when it couldn't be kept
+PAYLOAD_UNAVAILABLE = "unavailable"
+
+
+class CacheIdempotencyStore(object):
+    """ Keep the payloads in the cache of the IDEMPOTENCY_CACHE setting """
+
+    def __init__(self):
+        from django.core.cache import caches
+
+        self.cache = caches[graphene_settings.IDEMPOTENCY_CACHE]
+
+    def add(self, key, value, timeout):
+        """ Set the value unless the key is already set, and return if set """
+        return self.cache.add(key, value, timeout)
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, value, timeout):
+        self.cache.set(key, value, timeout)
+
+    def delete(self, key):
+        self.cache.delete(key)
+
+
+def get_idempotency_store():
+    return graphene_settings.IDEMPOTENCY_STORE()
+
+
+def get_user_scope(context):
+    """ The user, or the session of anonymous users, whose keys are these """
+    user = getattr(context, "user", None)
+    if user is not None and user.is_authenticated:
+        return "user:{}".format(user.pk)
+    session_key = getattr(getattr(context, "session", None), "session_key", None)
+    if session_key:
+        return "session:{}".format(session_key)
+    return None
+
+
+def get_store_key(mutation, scope, idempotency_key):
+    name = "{}.{}".format(mutation.__module__, mutation.__name__)
+    digest = hashlib.sha256(
+        "\n".join([name, scope, idempotency_key]).encode("utf-8")
+    ).hexdigest()
+    return "graphene_django:idempotency:{}".format(digest)
+
+
+def get_input_hash(input):
+    # The input fields are also attributes of the input, so a field named
+    # "items" hides the method
+    data = json.dumps(
+        {
+            key: value
+            for key, value in dict.items(input)
+            if key != "client_mutation_id"
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def dump_value(value):
+    """ A form of the value of a payload field that can be stored """
+    if isinstance(value, models.Model):
+        names = [field.attname for field in value._meta.concrete_fields]
+        return StoredModel(
+            value._meta.label,
+            value._state.db,
+            names,
+            [getattr(value, name) for name in names],
+        )
+    if isinstance(value, ObjectType):
+        return StoredObject(
+            {name: dump_value(getattr(value, name, None)) for name in value._meta.fields}
+        )
+    if isinstance(value, (list, tuple)):
+        return [dump_value(item) for item in value]
+    return value
+
+
+def load_value(value, graphene_type):
+    """ The value of a payload field of the given type from its stored form """
+    if isinstance(graphene_type, NonNull):
+        graphene_type = graphene_type.of_type
+    if isinstance(value, list):
+        if isinstance(graphene_type, List):
+            graphene_type = graphene_type.of_type
+        return [load_value(item, graphene_type) for item in value]
+    if isinstance(value, StoredModel):
+        model = apps.get_model(value.label)
+        return model.from_db(value.db, value.names, value.values)
+    if isinstance(value, StoredObject):
+        return load_object(graphene_type, value)
+    return value
+
+
+def load_object(object_type, stored):
+    fields = object_type._meta.fields
+    return object_type(
+        **{
+            name: load_value(value, fields[name].type)
+            for name, value in stored.fields.items()
+            if name in fields
+        }
+    )
+
+
+def mark_unavailable(store, key, input_hash, timeout):
+    """ Mark the key as used by a mutation whose payload wasn't kept, or
+        remove it if not even that can be stored
+    """
+    try:
+        store.set(key, (input_hash, PAYLOAD_UNAVAILABLE), timeout)
+    except Exception:
+        logger.exception("Could not mark the idempotency key as used")
+        try:
+            store.delete(key)
+        except Exception:
+            logger.exception("Could not remove the idempotency key")
+
+
+class IdempotentMutation(ClientIDMutation):
+    """
+    A ClientIDMutation that, with the idempotent option, has an
+    idempotencyKey input. The payload of the first mutation with a key is
+    returned again by the next ones with the same key (of the same user)
+    for IDEMPOTENCY_KEY_TTL seconds, without running them.
+
+    Keys are only kept for authenticated users, or anonymous users with a
+    session, and retries must send the same input.
+    """
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def __init_subclass_with_meta__(
+        cls, idempotent=False, input_fields=None, _meta=None, **options
+    ):
+        if not _meta:
+            _meta = MutationOptions(cls)
+        _meta.idempotent = idempotent
+        if idempotent:
+            input_fields = dict(input_fields or {})
+            input_fields["idempotency_key"] = String(
+                description="Key that is the same in the retries of a mutation"
+            )
+        super(IdempotentMutation, cls).__init_subclass_with_meta__(
+            input_fields=input_fields, _meta=_meta, **options
+        )
+
+    @classmethod
+    def mutate(cls, root, info, input):
+        idempotency_key = input.pop("idempotency_key", None)
+        scope = get_user_scope(info.context)
+        if not cls._meta.idempotent or not idempotency_key or not scope:
+            return super(IdempotentMutation, cls).mutate(root, info, input)
+
+        store = get_idempotency_store()
+        key = get_store_key(cls, scope, idempotency_key)
+        input_hash = get_input_hash(input)
+        timeout = graphene_settings.IDEMPOTENCY_KEY_TTL
+
+        # Mark the key as in progress, unless another mutation used it
+        if not store.add(key, (input_hash, None), timeout):
+            stored = store.get(key)
+            if stored is not None:
+                stored_hash, payload = stored
+                if stored_hash != input_hash:
+                    raise Exception(
+                        "The idempotencyKey {} was used with a different "
+                        "input.".format(idempotency_key)
+                    )
+                if payload is None:
+                    raise Exception(
+                        "A mutation with the idempotencyKey {} is in "
+                        "progress.".format(idempotency_key)
+                    )
+                if payload == PAYLOAD_UNAVAILABLE:
+                    raise Exception(
+                        "The mutation with the idempotencyKey {} was already "
+                        "run, but its payload wasn't kept.".format(idempotency_key)
+                    )
+                payload = load_object(cls, payload)
+                payload.client_mutation_id = input.get("client_mutation_id")
+                return payload
+            store.set(key, (input_hash, None), timeout)
+
+        def on_resolve(payload):
+            try:
+                store.set(key, (input_hash, dump_value(payload)), timeout)
+            except Exception:
+                # The mutation was run, so the retries must not run it again
+                logger.exception("Could not store the payload of %s", cls.__name__)
+                mark_unavailable(store, key, input_hash, timeout)
+            return payload
+
+        def on_reject(error):
+            # The mutation can be retried with the same key
+            store.delete(key)
+            raise error
+
+        try:
+            result = super(IdempotentMutation, cls).mutate(root, info, input)
+        except Exception as e:
+            on_reject(e)
+        if is_thenable(result):
+            return Promise.resolve(result).then(on_resolve, on_reject)
+        return on_resolve(result)
@@ -0,0 +1,92 @@
+import re
+import weakref
+
+from graphql.language import ast
+
+INTROSPECTION_FIELDS = ("__schema", "__type")
+
+# Fields whose result only depends on the schema
+SCHEMA_META_FIELDS = INTROSPECTION_FIELDS + ("__typename",)
+
+# A cheap check to avoid parsing queries that can't be introspection ones
+# (notice that `__typename` doesn't match)
+INTROSPECTION_FIELD_RE = re.compile(r"\b__(schema|type)\b")
+
+# Max number of different introspection queries cached per schema
+MAX_CACHED_INTROSPECTION_QUERIES = 16
+
+_introspection_caches = weakref.WeakKeyDictionary()
+
+
+def get_introspection_cache(schema):
+    """
+    Return the dict where the introspection results for the given
+    schema instance are cached.
+    """
+    try:
+        return _introspection_caches.setdefault(schema, {})
+    except TypeError:
+        # The schema can't be weakly referenced, so we don't cache anything
+        return {}
+
+
+def introspect(schema):
+    """
+    Return the result of the standard introspection query for the
+    given schema, computing it only once per schema instance.
+    """
+    cache = get_introspection_cache(schema)
+    if None not in cache:
+        cache[None] = schema.introspect()
+    return cache[None]
+
+
+def iter_fields(selection_set):
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield selection
+        nested_selection_set = getattr(selection, "selection_set", None)
+        if nested_selection_set:
+            for field in iter_fields(nested_selection_set):
+                yield field
+
+
+def uses_introspection(document_ast):
+    """
+    Return True if any operation or fragment in the document queries
+    the schema (`__schema` or `__type`).
+    """
+    for definition in document_ast.definitions:
+        selection_set = getattr(definition, "selection_set", None)
+        if not selection_set:
+            continue
+        for field in iter_fields(selection_set):
+            if field.name.value in INTROSPECTION_FIELDS:
+                return True
+    return False
+
+
+def is_introspection_document(document_ast):
+    """
+    Return True if the document is a single query without variables that
+    only selects schema meta fields, so its result only depends on the
+    schema and can be cached.
+    """
+    operations = [
+        definition
+        for definition in document_ast.definitions
+        if isinstance(definition, ast.OperationDefinition)
+    ]
+    if len(operations) != 1:
+        return False
+
+    operation = operations[0]
+    if operation.operation != "query" or operation.variable_definitions:
+        return False
+
+    return all(
+        isinstance(selection, ast.Field)
+        and selection.name.value in SCHEMA_META_FIELDS
+        and not selection.directives
+        for selection in operation.selection_set.selections
+    )
@@ -0,0 +1 @@
+default_app_config = "graphene_django.jobs.apps.JobsConfig"
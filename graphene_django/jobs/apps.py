@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    name = "graphene_django.jobs"
+    label = "graphene_django_jobs"
+    verbose_name = "GraphQL jobs"
@@ -0,0 +1,275 @@
+"""
+Executors that run the mutations of DjangoFormJobMutation after they
+respond with the id of the job.
+
+The executor is set in the JOB_EXECUTOR setting, and it can be one of:
+
+* ThreadPoolJobExecutor: runs the jobs in threads of the process that
+  received them, and keeps their results in memory.
+* ProcessPoolJobExecutor: runs the jobs in worker processes (started
+  with ``spawn``, so they set up Django again), and keeps their results
+  in the memory of the process that received them.
+* DatabaseJobExecutor: saves the jobs in the table of the Job model, and
+  the ``graphql_jobs`` command runs them, so any process can poll them.
+
+The first two only give the status of the jobs to the process that
+received them, so they are meant for a single process deployment.
+"""
+import datetime
+import json
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+PENDING = "PENDING"
+RUNNING = "RUNNING"
+SUCCESS = "SUCCESS"
+FAILED = "FAILED"
+
+STATUSES = (
+    (PENDING, "Pending"),
+    (RUNNING, "Running"),
+    (SUCCESS, "Success"),
+    (FAILED, "Failed"),
+)
+
+
+class JobState(object):
+    """ The status of a job, and its result or errors once finished """
+
+    def __init__(self, id, status, result=None, errors=None, owner=None):
+        self.id = id
+        self.status = status
+        self.result = result
+        self.errors = errors
+        # The key of the user (or session) that submitted the job
+        self.owner = owner
+
+
+def get_import_path(mutation):
+    return "{}.{}".format(mutation.__module__, mutation.__name__)
+
+
+def encode(value):
+    return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def run_job(mutation_path, input, user_pk=None):
+    """
+    Run the mutation with the input, as the user of the given pk (that
+    submitted it), and return its result and errors as JSON compatible
+    values. Exceptions are logged and returned as errors.
+    """
+    try:
+        mutation = import_string(mutation_path)
+        result, errors = mutation.run_job(input, user_pk)
+        return json.loads(encode(result)), errors
+    except Exception as e:
+        logger.exception("Job of %s failed", mutation_path)
+        return None, {"__all__": [str(e)]}
+
+
+def run_pooled_job(mutation_path, input, user_pk=None):
+    """ Run the job in a worker, with database connections as a request """
+    close_old_connections()
+    try:
+        return run_job(mutation_path, input, user_pk)
+    finally:
+        close_old_connections()
+
+
+def setup_worker():
+    import django
+
+    django.setup()
+
+
+class JobExecutor(object):
+    def submit(self, mutation, input, owner=None, user_pk=None):
+        """
+        Queue the mutation with the input and return the id of the job. The
+        owner is the key of the user (or session) that can get the job, and
+        the mutation is run as the user of user_pk.
+        """
+        raise NotImplementedError
+
+    def get(self, job_id):
+        """ The JobState of the job, or None if there isn't such job """
+        raise NotImplementedError
+
+
+class PoolJobExecutor(JobExecutor):
+    """
+    Run the jobs in a concurrent.futures executor, and keep the futures of
+    the last max_jobs jobs to get their status
+    """
+
+    def __init__(self, max_workers=None, max_jobs=None):
+        from ..settings import graphene_settings
+
+        self.max_workers = max_workers or graphene_settings.JOB_EXECUTOR_MAX_WORKERS
+        self.max_jobs = max_jobs or graphene_settings.JOB_EXECUTOR_MAX_JOBS
+        self.futures = OrderedDict()
+        self.lock = threading.Lock()
+        self.pool = None
+
+    def get_pool(self):
+        raise NotImplementedError
+
+    def submit(self, mutation, input, owner=None, user_pk=None):
+        job_id = uuid.uuid4().hex
+        with self.lock:
+            if self.pool is None:
+                self.pool = self.get_pool()
+            future = self.pool.submit(
+                run_pooled_job, get_import_path(mutation), input, user_pk
+            )
+            self.futures[job_id] = (future, owner)
+            while len(self.futures) > self.max_jobs:
+                self.futures.popitem(last=False)
+        return job_id
+
+    def get(self, job_id):
+        job = self.futures.get(job_id)
+        if job is None:
+            return None
+        future, owner = job
+        if not future.done():
+            status = RUNNING if future.running() else PENDING
+            return JobState(job_id, status, owner=owner)
+        if future.exception() is not None:
+            # The worker died (as a process killed in a ProcessPoolExecutor)
+            errors = {"__all__": [str(future.exception())]}
+            return JobState(job_id, FAILED, None, errors, owner)
+        result, errors = future.result()
+        return JobState(job_id, FAILED if errors else SUCCESS, result, errors, owner)
+
+    def shutdown(self, wait=True):
+        with self.lock:
+            if self.pool is not None:
+                self.pool.shutdown(wait=wait)
+                self.pool = None
+
+
+class ThreadPoolJobExecutor(PoolJobExecutor):
+    def get_pool(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+
+class ProcessPoolJobExecutor(PoolJobExecutor):
+    def get_pool(self):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_worker,
+        )
+
+
+class DatabaseJobExecutor(JobExecutor):
+    """ Queue the jobs in the table of the Job model """
+
+    def submit(self, mutation, input, owner=None, user_pk=None):
+        from .models import Job
+
+        job = Job.objects.create(
+            mutation=get_import_path(mutation),
+            input=encode(input),
+            owner=owner,
+            user_pk=user_pk,
+        )
+        return job.pk.hex
+
+    def get(self, job_id):
+        from .models import Job
+
+        try:
+            job = Job.objects.filter(pk=job_id).first()
+        except ValidationError:
+            # Not a valid UUID
+            return None
+        if job is None:
+            return None
+        return JobState(
+            job.pk.hex,
+            job.status,
+            json.loads(job.result) if job.result is not None else None,
+            json.loads(job.errors) if job.errors is not None else None,
+            job.owner,
+        )
+
+    def fail_timed_out(self, timeout=None):
+        """
+        Mark as failed the jobs running for more than timeout seconds (the
+        JOB_TIMEOUT setting by default), as the ones of workers that died,
+        and return how many were. They aren't run again, as they could have
+        changed something already.
+        """
+        from ..settings import graphene_settings
+        from .models import Job
+
+        if timeout is None:
+            timeout = graphene_settings.JOB_TIMEOUT
+        if not timeout:
+            return 0
+        started_before = timezone.now() - datetime.timedelta(seconds=timeout)
+        return Job.objects.filter(status=RUNNING, updated__lt=started_before).update(
+            status=FAILED,
+            errors=encode({"__all__": ["The job timed out."]}),
+            updated=timezone.now(),
+        )
+
+    def run_pending(self, limit=None):
+        """
+        Run the pending jobs, oldest first, and return how many were run.
+        Each job is claimed by changing its status, so many workers can run
+        the queue at the same time.
+        """
+        from .models import Job
+
+        self.fail_timed_out()
+        pending = Job.objects.filter(status=PENDING).values_list("pk", flat=True)
+        count = 0
+        for pk in pending[:limit] if limit else pending:
+            claimed = Job.objects.filter(pk=pk, status=PENDING).update(
+                status=RUNNING, updated=timezone.now()
+            )
+            if not claimed:
+                continue
+            job = Job.objects.get(pk=pk)
+            result, errors = run_job(job.mutation, json.loads(job.input), job.user_pk)
+            Job.objects.filter(pk=pk).update(
+                status=FAILED if errors else SUCCESS,
+                result=encode(result),
+                errors=encode(errors) if errors else None,
+                updated=timezone.now(),
+            )
+            count += 1
+        return count
+
+
+executors = {}
+
+
+def get_job_executor():
+    """ The instance of the executor class of the JOB_EXECUTOR setting """
+    # Imported here to get the settings as reloaded by override_settings
+    from ..settings import graphene_settings
+
+    executor_class = graphene_settings.JOB_EXECUTOR
+    if executor_class not in executors:
+        executors[executor_class] = executor_class()
+    return executors[executor_class]
@@ -0,0 +1,36 @@
+# Generated by Django 2.2.28 on 2026-10-19 15:05
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('mutation', models.CharField(max_length=255)),
+                ('input', models.TextField()),
+                ('status', models.CharField(
+                    choices=[
+                        ('PENDING', 'Pending'), ('RUNNING', 'Running'), ('SUCCESS', 'Success'), ('FAILED', 'Failed'),
+                    ],
+                    db_index=True, default='PENDING', max_length=10,
+                )),
+                ('result', models.TextField(null=True)),
+                ('errors', models.TextField(null=True)),
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('updated', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ('created',),
+            },
+        ),
+    ]
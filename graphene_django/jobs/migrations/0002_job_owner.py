@@ -0,0 +1,23 @@
+# Generated by Django 2.2.28 on 2026-10-19 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('graphene_django_jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='owner',
+            field=models.CharField(db_index=True, max_length=255, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='user_pk',
+            field=models.CharField(max_length=255, null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+import uuid
+
+from django.db import models
+
+from .executors import PENDING, STATUSES
+
+
+class Job(models.Model):
+    """
+    A mutation queued by DatabaseJobExecutor, that is run by the
+    graphql_jobs command
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    mutation = models.CharField(max_length=255)
+    input = models.TextField()
+    status = models.CharField(
+        max_length=10, choices=STATUSES, default=PENDING, db_index=True
+    )
+    result = models.TextField(null=True)
+    errors = models.TextField(null=True)
+    # The key of the user (or session) that can get the job, and the pk of
+    # the user the mutation is run as
+    owner = models.CharField(max_length=255, null=True, db_index=True)
+    user_pk = models.CharField(max_length=255, null=True)
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("created",)
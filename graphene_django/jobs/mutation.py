@@ -0,0 +1,114 @@
+from collections import OrderedDict
+
+import graphene
+from graphene import InputField
+from graphene.types.utils import yank_fields_from_attrs
+
+from ..forms.mutation import (
+    BaseDjangoFormMutation,
+    DjangoFormMutationOptions,
+    fields_for_form,
+)
+from ..forms.types import ErrorType
+from ..idempotency import get_user_scope
+from .executors import get_job_executor
+
+
+class JobContext(object):
+    """ The context of a mutation run by a job, with the user that
+        submitted it
+    """
+
+    def __init__(self, user):
+        self.user = user
+
+
+class JobInfo(object):
+    """ The info of a mutation run by a job, that only has its context """
+
+    def __init__(self, context):
+        self.context = context
+
+
+class DjangoFormJobMutation(BaseDjangoFormMutation):
+    """
+    A form mutation that validates the input and responds with the id of a
+    job that runs perform_mutate later, in the executor of the
+    JOB_EXECUTOR setting.
+
+    The job validates the form again with the same input, and the value
+    returned by perform_mutate (that must be serializable as JSON) is the
+    result of the job.
+    """
+
+    class Meta:
+        abstract = True
+
+    errors = graphene.List(ErrorType)
+    job_id = graphene.ID()
+
+    @classmethod
+    def __init_subclass_with_meta__(
+        cls, form_class=None, only_fields=(), exclude_fields=(), **options
+    ):
+
+        if not form_class:
+            raise Exception("form_class is required for DjangoFormJobMutation")
+
+        form = form_class()
+        input_fields = fields_for_form(form, only_fields, exclude_fields)
+
+        _meta = DjangoFormMutationOptions(cls)
+        _meta.form_class = form_class
+
+        input_fields = yank_fields_from_attrs(input_fields, _as=InputField)
+        super(DjangoFormJobMutation, cls).__init_subclass_with_meta__(
+            _meta=_meta, input_fields=input_fields, **options
+        )
+
+    @classmethod
+    def mutate_and_get_payload(cls, root, info, **input):
+        form = cls.get_form(root, info, **dict(input))
+
+        if form.is_valid():
+            user = getattr(info.context, "user", None)
+            authenticated = user is not None and user.is_authenticated
+            job_id = get_job_executor().submit(
+                cls,
+                input,
+                owner=get_user_scope(info.context),
+                user_pk=str(user.pk) if authenticated else None,
+            )
+            return cls(errors=[], job_id=job_id)
+        else:
+            errors = [
+                ErrorType(field=key, messages=value)
+                for key, value in form.errors.items()
+            ]
+
+            return cls(errors=errors)
+
+    @classmethod
+    def get_job_user(cls, user_pk):
+        """ The user that submitted the job, or None if it was anonymous """
+        if user_pk is None:
+            return None
+        from django.contrib.auth import get_user_model
+
+        User = get_user_model()
+        return User._default_manager.filter(pk=user_pk).first()
+
+    @classmethod
+    def run_job(cls, input, user_pk=None):
+        """ Return the result of the mutation and its errors """
+        info = JobInfo(JobContext(cls.get_job_user(user_pk)))
+        form = cls.get_form(None, info, **dict(input))
+        if not form.is_valid():
+            return None, OrderedDict(
+                (key, list(value)) for key, value in form.errors.items()
+            )
+        return cls.perform_mutate(form, info), None
+
+    @classmethod
+    def perform_mutate(cls, form, info):
+        return form.save()
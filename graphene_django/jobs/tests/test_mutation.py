@@ -0,0 +1,247 @@
+import datetime
+
+import graphene
+import pytest
+from django import forms
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+from django.utils.six import StringIO
+
+from ..executors import get_job_executor
+from ..models import Job
+from ..mutation import DjangoFormJobMutation
+from ..types import JobField
+
+
+class ReportForm(forms.Form):
+    name = forms.CharField()
+    copies = forms.IntegerField(min_value=1)
+
+    def save(self):
+        if self.cleaned_data["name"] == "fail":
+            raise ValueError("Report failed")
+        return {
+            "name": self.cleaned_data["name"],
+            "pages": self.cleaned_data["copies"] * 2,
+        }
+
+
+class ReportMutation(DjangoFormJobMutation):
+    class Meta:
+        form_class = ReportForm
+
+
+class User(object):
+    is_authenticated = True
+
+    def __init__(self, pk):
+        self.pk = pk
+
+
+class Context(object):
+    def __init__(self, user):
+        self.user = user
+
+
+class UserReportMutation(DjangoFormJobMutation):
+    class Meta:
+        form_class = ReportForm
+
+    @classmethod
+    def get_job_user(cls, user_pk):
+        return User(int(user_pk)) if user_pk is not None else None
+
+    @classmethod
+    def perform_mutate(cls, form, info):
+        return {"user": info.context.user.pk}
+
+
+class Query(graphene.ObjectType):
+    job = JobField()
+
+
+class Mutation(graphene.ObjectType):
+    report = ReportMutation.Field()
+    user_report = UserReportMutation.Field()
+
+
+schema = graphene.Schema(query=Query, mutation=Mutation)
+
+MUTATION = """
+    mutation Report($input: ReportMutationInput!) {
+      report(input: $input) {
+        jobId
+        errors { field messages }
+      }
+    }
+"""
+
+QUERY = """
+    query Job($id: ID!) {
+      job(id: $id) {
+        id
+        status
+        result
+        errors { field messages }
+      }
+    }
+"""
+
+
+USER_MUTATION = """
+    mutation UserReport($input: UserReportMutationInput!) {
+      userReport(input: $input) {
+        jobId
+      }
+    }
+"""
+
+
+def submit(name, copies):
+    result = schema.execute(
+        MUTATION, variable_values={"input": {"name": name, "copies": copies}}
+    )
+    assert not result.errors
+    return result.data["report"]
+
+
+def submit_as(user):
+    result = schema.execute(
+        USER_MUTATION,
+        variable_values={"input": {"name": "Sales", "copies": 1}},
+        context_value=Context(user),
+    )
+    assert not result.errors
+    return result.data["userReport"]["jobId"]
+
+
+def get_job(job_id, user=None):
+    result = schema.execute(
+        QUERY, variable_values={"id": job_id}, context_value=Context(user)
+    )
+    assert not result.errors
+    return result.data["job"]
+
+
+def test_job_mutation_has_job_id_output():
+    assert list(ReportMutation._meta.fields) == [
+        "errors",
+        "job_id",
+        "client_mutation_id",
+    ]
+    assert "name" in ReportMutation.Input._meta.fields
+
+
+def test_job_mutation_validates_input():
+    payload = submit("Sales", 0)
+    assert payload["jobId"] is None
+    assert payload["errors"] == [
+        {
+            "field": "copies",
+            "messages": ["Ensure this value is greater than or equal to 1."],
+        }
+    ]
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        "graphene_django.jobs.executors.ThreadPoolJobExecutor",
+        "graphene_django.jobs.executors.ProcessPoolJobExecutor",
+    ],
+)
+def test_job_mutation_in_pool(executor):
+    with override_settings(GRAPHENE={"JOB_EXECUTOR": executor}):
+        payload = submit("Sales", 3)
+        fail_payload = submit("fail", 1)
+        get_job_executor().shutdown()
+
+        assert payload["errors"] == []
+        assert get_job(payload["jobId"]) == {
+            "id": payload["jobId"],
+            "status": "SUCCESS",
+            "result": '{"name": "Sales", "pages": 6}',
+            "errors": [],
+        }
+        assert get_job(fail_payload["jobId"])["errors"] == [
+            {"field": "__all__", "messages": ["Report failed"]}
+        ]
+        assert get_job("unknown") is None
+
+
+@pytest.mark.django_db
+@override_settings(
+    GRAPHENE={"JOB_EXECUTOR": "graphene_django.jobs.executors.DatabaseJobExecutor"}
+)
+def test_job_mutation_in_database():
+    payload = submit("Sales", 3)
+    fail_payload = submit("fail", 1)
+
+    assert Job.objects.count() == 2
+    assert get_job(payload["jobId"])["status"] == "PENDING"
+
+    out = StringIO()
+    call_command("graphql_jobs", once=True, stdout=out)
+    assert out.getvalue() == "Ran 2 jobs\n"
+
+    assert get_job(payload["jobId"]) == {
+        "id": payload["jobId"],
+        "status": "SUCCESS",
+        "result": '{"name": "Sales", "pages": 6}',
+        "errors": [],
+    }
+    assert get_job(fail_payload["jobId"])["status"] == "FAILED"
+    assert get_job("unknown") is None
+    # Jobs already run aren't run again
+    assert get_job_executor().run_pending() == 0
+
+
+def test_job_mutation_runs_as_its_user():
+    with override_settings(
+        GRAPHENE={
+            "JOB_EXECUTOR": "graphene_django.jobs.executors.ThreadPoolJobExecutor"
+        }
+    ):
+        job_id = submit_as(User(1))
+        get_job_executor().shutdown()
+
+        assert get_job(job_id, User(1))["result"] == '{"user": 1}'
+        # Only the user that submitted the job can get it
+        assert get_job(job_id, User(2)) is None
+        assert get_job(job_id) is None
+
+
+@pytest.mark.django_db
+@override_settings(
+    GRAPHENE={"JOB_EXECUTOR": "graphene_django.jobs.executors.DatabaseJobExecutor"}
+)
+def test_job_mutation_in_database_runs_as_its_user():
+    job_id = submit_as(User(1))
+    assert Job.objects.get().owner == "user:1"
+    assert get_job(job_id, User(2)) is None
+
+    get_job_executor().run_pending()
+    assert get_job(job_id, User(1))["result"] == '{"user": 1}'
+
+
+@pytest.mark.django_db
+@override_settings(
+    GRAPHENE={"JOB_EXECUTOR": "graphene_django.jobs.executors.DatabaseJobExecutor"}
+)
+def test_job_mutation_in_database_fails_timed_out_jobs():
+    payload = submit("Sales", 3)
+    running_payload = submit("Sales", 1)
+    Job.objects.update(status="RUNNING")
+    Job.objects.filter(pk=payload["jobId"]).update(
+        updated=timezone.now() - datetime.timedelta(hours=2)
+    )
+
+    assert get_job_executor().run_pending() == 0
+    assert get_job(payload["jobId"]) == {
+        "id": payload["jobId"],
+        "status": "FAILED",
+        "result": None,
+        "errors": [{"field": "__all__", "messages": ["The job timed out."]}],
+    }
+    assert get_job(running_payload["jobId"])["status"] == "RUNNING"
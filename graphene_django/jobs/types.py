@@ -0,0 +1,40 @@
+import graphene
+from graphene.types.json import JSONString
+
+from ..forms.types import ErrorType
+from ..idempotency import get_user_scope
+from .executors import STATUSES, get_job_executor
+
+JobStatus = graphene.Enum("JobStatus", [(status, status) for status, _ in STATUSES])
+
+
+class Job(graphene.ObjectType):
+    id = graphene.ID(required=True)
+    status = JobStatus(required=True)
+    result = JSONString(description="The result of the mutation, once it succeeded")
+    errors = graphene.List(ErrorType)
+
+    def resolve_errors(self, info):
+        if not self.errors:
+            return []
+        return [
+            ErrorType(field=field, messages=messages)
+            for field, messages in self.errors.items()
+        ]
+
+
+def resolve_job(root, info, id):
+    """ The job of the id, if it was submitted by the same user (or session) """
+    job = get_job_executor().get(id)
+    if job is None or job.owner != get_user_scope(info.context):
+        return None
+    return job
+
+
+class JobField(graphene.Field):
+    """ A field with the status of the job of the given id, for polling """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("id", graphene.ID(required=True))
+        kwargs.setdefault("resolver", resolve_job)
+        super(JobField, self).__init__(Job, *args, **kwargs)
@@ -0,0 +1,313 @@
+import importlib
+import json
+import math
+import re
+from collections import OrderedDict
+from timeit import default_timer
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+
+from graphql import validate
+from graphql.execution import ExecutionResult
+
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView
+
+PHASES = ("parse", "validate", "execute", "serialize", "total")
+PERCENTILES = (50, 95, 99)
+
+OPERATION_NAME_RE = re.compile(r"\b(?:query|mutation|subscription)\s+(\w+)")
+
+
+def load_operations(path):
+    """
+    Load the operations to run from a JSON file (a list of operations, or
+    an object with an "operations" list) or a JSON lines file (one
+    operation per line). Each operation is an object with a "query" and
+    optionally "variables", "operationName" and "name".
+    """
+    with open(path) as f:
+        content = f.read()
+
+    try:
+        operations = json.loads(content)
+    except ValueError:
+        operations = [json.loads(line) for line in content.splitlines() if line.strip()]
+
+    if isinstance(operations, dict):
+        operations = operations.get("operations", [operations])
+
+    for i, operation in enumerate(operations):
+        if not isinstance(operation, dict) or not operation.get("query"):
+            raise CommandError("Operation #{} in {} has no query".format(i, path))
+        operation.setdefault("variables", None)
+        operation.setdefault("operationName", None)
+        if not operation.get("name"):
+            match = OPERATION_NAME_RE.search(operation["query"])
+            operation["name"] = (
+                operation["operationName"]
+                or (match and match.group(1))
+                or "operation_{}".format(i)
+            )
+    return operations
+
+
+def get_request():
+    """A request like the ones GraphQLView receives, to use as context."""
+    request = RequestFactory().post("/graphql")
+    if apps.is_installed("django.contrib.auth"):
+        from django.contrib.auth.models import AnonymousUser
+
+        request.user = AnonymousUser()
+    return request
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile of the given values."""
+    values = sorted(values)
+    index = int(math.ceil(percent / 100.0 * len(values))) - 1
+    return values[max(index, 0)]
+
+
+def summarize(values):
+    summary = OrderedDict()
+    for percent in PERCENTILES:
+        summary["p{}".format(percent)] = percentile(values, percent)
+    summary["mean"] = float(sum(values)) / len(values)
+    return summary
+
+
+class CommandArguments(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "operations",
+            type=str,
+            help="JSON (or JSON lines) file with the operations to run",
+        )
+
+        parser.add_argument(
+            "--schema",
+            type=str,
+            dest="schema",
+            default=graphene_settings.SCHEMA,
+            help="Django app containing schema to benchmark, e.g. myproject.core.schema.schema",
+        )
+
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            dest="iterations",
+            default=10,
+            help="Number of times each operation is run (default: 10)",
+        )
+
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            dest="warmup",
+            default=1,
+            help="Number of untimed runs of each operation before measuring (default: 1)",
+        )
+
+        parser.add_argument(
+            "--format",
+            type=str,
+            dest="format",
+            choices=("table", "json"),
+            default="table",
+            help="Report format (default: table)",
+        )
+
+
+class Command(CommandArguments):
+    help = (
+        "Run the given GraphQL operations several times and report their timings. "
+        "Every run is done in a transaction that is rolled back."
+    )
+    can_import_settings = True
+
+    def get_schema(self, options_schema):
+        if options_schema and type(options_schema) is str:
+            module_str, schema_name = options_schema.rsplit(".", 1)
+            mod = importlib.import_module(module_str)
+            return getattr(mod, schema_name)
+        return options_schema or graphene_settings.SCHEMA
+
+    def get_view(self, schema):
+        return GraphQLView(schema=schema)
+
+    def get_request(self, operation):
+        return get_request()
+
+    def run_operation(self, view, operation):
+        """
+        Run the operation as GraphQLView.execute_graphql_request does,
+        returning the time spent (in seconds) in each phase, the executed
+        SQL queries and the execution errors.
+        """
+        # Imported here so the debug integration is only loaded when used
+        from graphene_django.debug.middleware import DjangoDebugContext
+
+        request = self.get_request(operation)
+        timings = OrderedDict()
+
+        sql_recorder = DjangoDebugContext()
+        try:
+            start = default_timer()
+            try:
+                document = view.get_backend(request).document_from_string(
+                    view.schema, operation["query"]
+                )
+            except Exception as e:
+                document = None
+                execution_result = ExecutionResult(errors=[e], invalid=True)
+            timings["parse"] = default_timer() - start
+
+            start = default_timer()
+            if document is not None:
+                validation_errors = validate(view.schema, document.document_ast)
+                if validation_errors:
+                    execution_result = ExecutionResult(
+                        errors=validation_errors, invalid=True
+                    )
+                    document = None
+            timings["validate"] = default_timer() - start
+
+            start = default_timer()
+            if document is not None:
+                extra_options = {}
+                if view.executor:
+                    extra_options["executor"] = view.executor
+                execution_result = document.execute(
+                    root=view.get_root_value(request),
+                    variables=operation["variables"],
+                    operation_name=operation["operationName"],
+                    context=view.get_context(request),
+                    middleware=view.get_middleware(request),
+                    validate=False,
+                    **extra_options
+                )
+            timings["execute"] = default_timer() - start
+        finally:
+            sql_recorder.disable_instrumentation()
+
+        start = default_timer()
+        response = {}
+        if execution_result.errors:
+            response["errors"] = [view.format_error(e) for e in execution_result.errors]
+        if not execution_result.invalid:
+            response["data"] = execution_result.data
+        view.json_encode(request, response)
+        timings["serialize"] = default_timer() - start
+
+        timings["total"] = sum(timings.values())
+        return timings, sql_recorder.object.sql, response.get("errors")
+
+    def run_in_transaction(self, view, operation):
+        with transaction.atomic():
+            result = self.run_operation(view, operation)
+            transaction.set_rollback(True)
+        return result
+
+    def benchmark_operation(self, view, operation, iterations, warmup):
+        for _ in range(warmup):
+            self.run_in_transaction(view, operation)
+
+        timings = OrderedDict((phase, []) for phase in PHASES)
+        sql_counts = []
+        sql_times = []
+        errors = None
+        for _ in range(iterations):
+            run_timings, sql, errors = self.run_in_transaction(view, operation)
+            for phase, duration in run_timings.items():
+                # Reported in milliseconds
+                timings[phase].append(duration * 1000)
+            sql_counts.append(len(sql))
+            sql_times.append(sum(query.duration for query in sql) * 1000)
+
+        return OrderedDict(
+            [
+                ("name", operation["name"]),
+                ("iterations", iterations),
+                ("errors", errors),
+                (
+                    "timings",
+                    OrderedDict(
+                        (phase, summarize(values)) for phase, values in timings.items()
+                    ),
+                ),
+                (
+                    "sql",
+                    OrderedDict(
+                        [
+                            ("queries", summarize(sql_counts)["mean"]),
+                            ("time", summarize(sql_times)),
+                        ]
+                    ),
+                ),
+            ]
+        )
+
+    def format_table(self, report):
+        header = "{:<30} {:<10} " + " ".join("{:>10}" for _ in PERCENTILES)
+        row = "{:<30} {:<10} " + " ".join("{:>10.3f}" for _ in PERCENTILES)
+        lines = [
+            header.format(
+                "Operation", "Phase", *["p{} (ms)".format(p) for p in PERCENTILES]
+            )
+        ]
+        for result in report["operations"]:
+            name = result["name"]
+            for phase, summary in result["timings"].items():
+                values = [summary["p{}".format(p)] for p in PERCENTILES]
+                lines.append(row.format(name[:30], phase, *values))
+                name = ""
+            sql = result["sql"]
+            values = [sql["time"]["p{}".format(p)] for p in PERCENTILES]
+            lines.append(row.format("", "sql", *values))
+            lines.append(
+                "{:<30} {:.1f} SQL queries per run".format("", sql["queries"])
+            )
+            if result["errors"]:
+                lines.append(
+                    "{:<30} errors: {}".format(
+                        "", "; ".join(e.get("message", "") for e in result["errors"])
+                    )
+                )
+        return "\n".join(lines)
+
+    def handle(self, *args, **options):
+        schema = self.get_schema(options.get("schema"))
+        if not schema:
+            raise CommandError(
+                "Specify schema on GRAPHENE.SCHEMA setting or by using --schema"
+            )
+
+        iterations = options.get("iterations")
+        if iterations < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        operations = load_operations(options["operations"])
+        view = self.get_view(schema)
+
+        report = OrderedDict(
+            [
+                (
+                    "operations",
+                    [
+                        self.benchmark_operation(
+                            view, operation, iterations, options.get("warmup")
+                        )
+                        for operation in operations
+                    ],
+                )
+            ]
+        )
+
+        if options.get("format") == "json":
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(self.format_table(report))
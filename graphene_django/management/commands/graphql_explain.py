@@ -0,0 +1,175 @@
+import importlib
+import json
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from graphene_django.settings import graphene_settings
+from graphene_django.views import GraphQLView
+
+from .graphql_benchmark import get_request, load_operations
+
+
+class CommandArguments(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "operations",
+            type=str,
+            help="JSON (or JSON lines) file with the operations to explain",
+        )
+
+        parser.add_argument(
+            "--schema",
+            type=str,
+            dest="schema",
+            default=graphene_settings.SCHEMA,
+            help="Django app containing schema to use, e.g. myproject.core.schema.schema",
+        )
+
+        parser.add_argument(
+            "--format",
+            type=str,
+            dest="format",
+            choices=("table", "json"),
+            default="table",
+            help="Report format (default: table)",
+        )
+
+
+class Command(CommandArguments):
+    help = (
+        "Run the given GraphQL operations and report the query plan of every "
+        "SELECT they make, with its sequential scans and probably missing indexes. "
+        "Every operation is run in a transaction that is rolled back."
+    )
+    can_import_settings = True
+
+    def get_schema(self, options_schema):
+        if options_schema and type(options_schema) is str:
+            module_str, schema_name = options_schema.rsplit(".", 1)
+            mod = importlib.import_module(module_str)
+            return getattr(mod, schema_name)
+        return options_schema or graphene_settings.SCHEMA
+
+    def get_view(self, schema):
+        from graphene_django.debug import DjangoDebugMiddleware
+
+        # The debug middleware keeps track of the field being resolved
+        middleware = [
+            middleware
+            for middleware in graphene_settings.MIDDLEWARE
+            if middleware is not DjangoDebugMiddleware
+        ]
+        middleware.append(DjangoDebugMiddleware)
+        return GraphQLView(schema=schema, middleware=middleware)
+
+    def get_request(self, operation):
+        return get_request()
+
+    def explain_operation(self, view, operation):
+        from graphene_django.debug.middleware import DjangoDebugContext
+        from graphene_django.debug.sql.explain import explain_recorded_query
+
+        request = self.get_request(operation)
+        with transaction.atomic():
+            request.django_debug = DjangoDebugContext()
+            try:
+                execution_result = view.execute_graphql_request(
+                    request,
+                    operation,
+                    operation["query"],
+                    operation["variables"],
+                    operation["operationName"],
+                )
+            finally:
+                request.django_debug.disable_instrumentation()
+
+            queries = []
+            for sql in request.django_debug.object.sql:
+                if not sql.is_select:
+                    continue
+                query = OrderedDict(
+                    [
+                        ("path", sql.path),
+                        ("sql", sql.sql),
+                        ("duration", sql.duration * 1000),
+                    ]
+                )
+                query.update(
+                    explain_recorded_query(
+                        connections[sql.alias], sql.raw_sql, sql.raw_params
+                    )
+                )
+                queries.append(query)
+
+            transaction.set_rollback(True)
+
+        errors = None
+        if execution_result and execution_result.errors:
+            errors = [view.format_error(e) for e in execution_result.errors]
+
+        return OrderedDict(
+            [
+                ("name", operation["name"]),
+                ("errors", errors),
+                ("queries", queries),
+                (
+                    "sequential_scans",
+                    sum(len(query["sequential_scans"]) for query in queries),
+                ),
+                (
+                    "missing_indexes",
+                    sum(len(query["missing_indexes"]) for query in queries),
+                ),
+            ]
+        )
+
+    def format_table(self, report):
+        lines = []
+        for result in report["operations"]:
+            lines.append(
+                "{}: {} SELECTs, {} sequential scans, {} probably missing indexes".format(
+                    result["name"],
+                    len(result["queries"]),
+                    result["sequential_scans"],
+                    result["missing_indexes"],
+                )
+            )
+            for error in result["errors"] or ():
+                lines.append("  error: {}".format(error.get("message")))
+            for query in result["queries"]:
+                lines.append(
+                    "  [{}] {:.3f} ms".format(query["path"] or "-", query["duration"])
+                )
+                lines.append("    {}".format(query["sql"]))
+                for line in query["plan"]:
+                    lines.append("      {}".format(line))
+                for table in query["sequential_scans"]:
+                    lines.append("    ! sequential scan on {}".format(table))
+                for missing_index in query["missing_indexes"]:
+                    lines.append("    ! missing index: {}".format(missing_index))
+        return "\n".join(lines)
+
+    def handle(self, *args, **options):
+        schema = self.get_schema(options.get("schema"))
+        if not schema:
+            raise CommandError(
+                "Specify schema on GRAPHENE.SCHEMA setting or by using --schema"
+            )
+
+        operations = load_operations(options["operations"])
+        view = self.get_view(schema)
+        report = OrderedDict(
+            [
+                (
+                    "operations",
+                    [self.explain_operation(view, operation) for operation in operations],
+                )
+            ]
+        )
+
+        if options.get("format") == "json":
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(self.format_table(report))
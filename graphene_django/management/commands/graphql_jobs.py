@@ -0,0 +1,57 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+
+class CommandArguments(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            dest="once",
+            default=False,
+            help="Run the pending jobs and exit, instead of waiting for more",
+        )
+
+        parser.add_argument(
+            "--interval",
+            type=float,
+            dest="interval",
+            default=1.0,
+            help="Seconds between checks for pending jobs (default: 1)",
+        )
+
+        parser.add_argument(
+            "--limit",
+            type=int,
+            dest="limit",
+            default=None,
+            help="Run at most LIMIT jobs at each check",
+        )
+
+
+class Command(CommandArguments):
+    help = "Run the jobs of the mutations queued by DatabaseJobExecutor"
+
+    def handle(self, *args, **options):
+        from graphene_django.jobs.executors import (
+            DatabaseJobExecutor,
+            get_job_executor,
+        )
+
+        executor = get_job_executor()
+        if not isinstance(executor, DatabaseJobExecutor):
+            raise CommandError(
+                "The JOB_EXECUTOR setting must be a DatabaseJobExecutor to run "
+                "the jobs with this command"
+            )
+
+        while True:
+            count = executor.run_pending(limit=options.get("limit"))
+            if count:
+                self.stdout.write("Ran {} jobs".format(count))
+            if options.get("once"):
+                break
+            close_old_connections()
+            time.sleep(options.get("interval"))
@@ -0,0 +1,246 @@
+import importlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from six.moves import queue
+
+from graphene_django.settings import graphene_settings
+from graphene_django.traffic import get_query_hash
+from graphene_django.views import GraphQLView, HttpError
+
+from .graphql_benchmark import get_request, load_operations, summarize
+
+
+class CommandArguments(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "files",
+            type=str,
+            nargs="+",
+            help="JSON lines files recorded with GraphQLTrafficRecorderMiddleware",
+        )
+
+        parser.add_argument(
+            "--schema",
+            type=str,
+            dest="schema",
+            default=graphene_settings.SCHEMA,
+            help="Django app containing schema to use, e.g. myproject.core.schema.schema",
+        )
+
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            dest="concurrency",
+            default=1,
+            help="Number of threads replaying operations at the same time (default: 1)",
+        )
+
+        parser.add_argument(
+            "--limit",
+            type=int,
+            dest="limit",
+            default=None,
+            help="Replay only the first LIMIT operations",
+        )
+
+        parser.add_argument(
+            "--rollback",
+            action="store_true",
+            dest="rollback",
+            default=False,
+            help="Run every operation in a transaction that is rolled back",
+        )
+
+        parser.add_argument(
+            "--format",
+            type=str,
+            dest="format",
+            choices=("table", "json"),
+            default="table",
+            help="Report format (default: table)",
+        )
+
+
+class Command(CommandArguments):
+    help = "Replay recorded GraphQL traffic and report the latencies"
+    can_import_settings = True
+
+    def get_schema(self, options_schema):
+        if options_schema and type(options_schema) is str:
+            module_str, schema_name = options_schema.rsplit(".", 1)
+            mod = importlib.import_module(module_str)
+            return getattr(mod, schema_name)
+        return options_schema or graphene_settings.SCHEMA
+
+    def get_view(self, schema):
+        return GraphQLView(schema=schema)
+
+    def get_request(self, operation):
+        return get_request()
+
+    def execute_operation(self, view, operation):
+        """Return True if the operation failed."""
+        request = self.get_request(operation)
+        try:
+            execution_result = view.execute_graphql_request(
+                request,
+                operation,
+                operation["query"],
+                operation["variables"],
+                operation["operationName"],
+            )
+        except HttpError:
+            return True
+        return bool(execution_result and execution_result.errors)
+
+    def replay_operation(self, view, operation, rollback):
+        start = time.time()
+        if rollback:
+            with transaction.atomic():
+                failed = self.execute_operation(view, operation)
+                transaction.set_rollback(True)
+        else:
+            failed = self.execute_operation(view, operation)
+        latency = (time.time() - start) * 1000
+        return operation, latency, failed
+
+    def replay(self, view, operations, concurrency, rollback):
+        results = []
+        if concurrency == 1:
+            for operation in operations:
+                results.append(self.replay_operation(view, operation, rollback))
+            return results
+
+        pending = queue.Queue()
+        for operation in operations:
+            pending.put(operation)
+
+        def worker():
+            try:
+                while True:
+                    try:
+                        operation = pending.get_nowait()
+                    except queue.Empty:
+                        return
+                    # list.append is thread-safe
+                    results.append(self.replay_operation(view, operation, rollback))
+            finally:
+                # Every thread has its own database connections
+                connections.close_all()
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def get_report(self, results, duration):
+        by_query = OrderedDict()
+        for operation, latency, failed in results:
+            query_hash = operation.get("query_hash") or get_query_hash(
+                operation["query"]
+            )
+            stats = by_query.setdefault(
+                query_hash,
+                {"name": operation["name"], "latencies": [], "recorded": [], "errors": 0},
+            )
+            stats["latencies"].append(latency)
+            if operation.get("latency") is not None:
+                stats["recorded"].append(operation["latency"])
+            stats["errors"] += failed
+
+        operations = []
+        for query_hash, stats in by_query.items():
+            operations.append(
+                OrderedDict(
+                    [
+                        ("query_hash", query_hash),
+                        ("name", stats["name"]),
+                        ("count", len(stats["latencies"])),
+                        ("errors", stats["errors"]),
+                        ("latency", summarize(stats["latencies"])),
+                        (
+                            "recorded_latency",
+                            summarize(stats["recorded"]) if stats["recorded"] else None,
+                        ),
+                    ]
+                )
+            )
+        operations.sort(key=lambda operation: -operation["count"])
+
+        return OrderedDict(
+            [
+                ("count", len(results)),
+                ("errors", sum(failed for _, _, failed in results)),
+                ("duration", duration),
+                ("throughput", len(results) / duration if duration else None),
+                ("latency", summarize([latency for _, latency, _ in results])),
+                ("operations", operations),
+            ]
+        )
+
+    def format_table(self, report):
+        lines = [
+            "{} operations in {:.2f} s ({:.1f} operations/s), {} errors".format(
+                report["count"],
+                report["duration"],
+                report["throughput"] or 0,
+                report["errors"],
+            ),
+            "Latency (ms): p50 {p50:.3f}, p95 {p95:.3f}, p99 {p99:.3f}".format(
+                **report["latency"]
+            ),
+            "",
+            "{:<30} {:>7} {:>7} {:>10} {:>10} {:>14}".format(
+                "Operation", "Count", "Errors", "p50 (ms)", "p95 (ms)", "recorded p50"
+            ),
+        ]
+        for operation in report["operations"]:
+            recorded = operation["recorded_latency"]
+            lines.append(
+                "{:<30} {:>7} {:>7} {:>10.3f} {:>10.3f} {:>14}".format(
+                    operation["name"][:30],
+                    operation["count"],
+                    operation["errors"],
+                    operation["latency"]["p50"],
+                    operation["latency"]["p95"],
+                    "{:.3f}".format(recorded["p50"]) if recorded else "-",
+                )
+            )
+        return "\n".join(lines)
+
+    def handle(self, *args, **options):
+        schema = self.get_schema(options.get("schema"))
+        if not schema:
+            raise CommandError(
+                "Specify schema on GRAPHENE.SCHEMA setting or by using --schema"
+            )
+
+        concurrency = options.get("concurrency")
+        if concurrency < 1:
+            raise CommandError("--concurrency must be at least 1")
+
+        operations = []
+        for path in options["files"]:
+            operations.extend(load_operations(path))
+        if options.get("limit") is not None:
+            operations = operations[: options["limit"]]
+        if not operations:
+            raise CommandError("There are no operations to replay")
+
+        view = self.get_view(schema)
+        start = time.time()
+        results = self.replay(view, operations, concurrency, options.get("rollback"))
+        report = self.get_report(results, time.time() - start)
+
+        if options.get("format") == "json":
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            self.stdout.write(self.format_table(report))
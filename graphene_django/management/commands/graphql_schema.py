@@ -1,10 +1,40 @@
+import hashlib
 import importlib
 import json
+import os
 
 from django.core.management.base import BaseCommand, CommandError
 
+from graphql.utils.schema_printer import print_schema
+
+from graphene_django.introspection import introspect
 from graphene_django.settings import graphene_settings
 
+# Output files with these extensions are written in the schema
+# definition language instead of as an introspection JSON
+SDL_EXTENSIONS = (".graphql", ".graphqls")
+
+
+def is_sdl_output(out):
+    return os.path.splitext(out)[1] in SDL_EXTENSIONS
+
+
+def iter_schema_parts(schema):
+    # The printed schema doesn't include the descriptions, which are
+    # part of the introspection output
+    yield print_schema(schema)
+    for name, graphql_type in sorted(schema.get_type_map().items()):
+        yield "{}: {}".format(name, getattr(graphql_type, "description", None))
+        fields = getattr(graphql_type, "fields", None) or {}
+        for field_name, field in sorted(fields.items()):
+            yield "{}.{}: {}".format(name, field_name, field.description)
+            for arg_name, arg in sorted((getattr(field, "args", None) or {}).items()):
+                yield "{}.{}({}): {}".format(name, field_name, arg_name, arg.description)
+        for value in getattr(graphql_type, "values", None) or ():
+            yield "{}.{}: {}".format(name, value.name, value.description)
+    for directive in schema.get_directives():
+        yield "@{}: {}".format(directive.name, directive.description)
+
 
 class CommandArguments(BaseCommand):
     def add_arguments(self, parser):
@@ -12,16 +42,20 @@ class CommandArguments(BaseCommand):
             "--schema",
             type=str,
             dest="schema",
+            nargs="+",
             default=graphene_settings.SCHEMA,
-            help="Django app containing schema to dump, e.g. myproject.core.schema.schema",
+            help="Django app containing schema to dump, e.g. myproject.core.schema.schema "
+            "(several schemas can be given, with the same number of --out files)",
         )
 
         parser.add_argument(
             "--out",
             type=str,
             dest="out",
+            nargs="+",
             default=graphene_settings.SCHEMA_OUTPUT,
-            help="Output file, --out=- prints to stdout (default: schema.json)",
+            help="Output file, --out=- prints to stdout (default: schema.json). "
+            "Files ending in .graphql are written in the schema definition language",
         )
 
         parser.add_argument(
@@ -32,18 +66,29 @@ class CommandArguments(BaseCommand):
             help="Output file indent (default: None)",
         )
 
+        parser.add_argument(
+            "--skip-unchanged",
+            action="store_true",
+            dest="skip_unchanged",
+            default=False,
+            help="Store a hash of the schema next to the output file "
+            "and don't dump the schema again if it didn't change",
+        )
+
 
 class Command(CommandArguments):
-    help = "Dump Graphene schema JSON to file"
+    help = "Dump Graphene schema JSON (or SDL) to file"
     can_import_settings = True
 
     def save_file(self, out, schema_dict, indent):
         with open(out, "w") as outfile:
             json.dump(schema_dict, outfile, indent=indent)
 
-    def handle(self, *args, **options):
-        options_schema = options.get("schema")
+    def save_graphql_file(self, out, schema):
+        with open(out, "w") as outfile:
+            outfile.write(print_schema(schema))
 
+    def get_schema(self, options_schema):
         if options_schema and type(options_schema) is str:
             module_str, schema_name = options_schema.rsplit(".", 1)
             mod = importlib.import_module(module_str)
@@ -55,21 +100,78 @@ class Command(CommandArguments):
         else:
             schema = graphene_settings.SCHEMA
 
-        out = options.get("out") or graphene_settings.SCHEMA_OUTPUT
-
         if not schema:
             raise CommandError(
                 "Specify schema on GRAPHENE.SCHEMA setting or by using --schema"
             )
 
-        indent = options.get("indent")
-        schema_dict = {"data": schema.introspect()}
-        if out == '-':
+        return schema
+
+    def get_schema_hash(self, schema, out, indent):
+        digest = hashlib.sha256()
+        digest.update("{}\n{}\n".format(is_sdl_output(out), indent).encode("utf-8"))
+        for part in iter_schema_parts(schema):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def get_hash_file(self, out):
+        return "{}.sha256".format(out)
+
+    def is_unchanged(self, out, schema_hash):
+        hash_file = self.get_hash_file(out)
+        if not os.path.exists(out) or not os.path.exists(hash_file):
+            return False
+        with open(hash_file) as f:
+            return f.read().strip() == schema_hash
+
+    def dump_schema(self, schema, out, indent, skip_unchanged=False):
+        style = getattr(self, "style", None)
+        success = getattr(style, "SUCCESS", lambda x: x)
+
+        if out == "-":
+            schema_dict = {"data": introspect(schema)}
             self.stdout.write(json.dumps(schema_dict, indent=indent))
+            return
+
+        if skip_unchanged:
+            schema_hash = self.get_schema_hash(schema, out, indent)
+            if self.is_unchanged(out, schema_hash):
+                self.stdout.write("GraphQL schema in %s is up to date" % out)
+                return
+
+        if is_sdl_output(out):
+            self.save_graphql_file(out, schema)
         else:
-            self.save_file(out, schema_dict, indent)
+            self.save_file(out, {"data": introspect(schema)}, indent)
+
+        if skip_unchanged:
+            with open(self.get_hash_file(out), "w") as f:
+                f.write(schema_hash)
+
+        self.stdout.write(success("Successfully dumped GraphQL schema to %s" % out))
 
-            style = getattr(self, "style", None)
-            success = getattr(style, "SUCCESS", lambda x: x)
+    def handle(self, *args, **options):
+        options_schemas = options.get("schema")
+        if not isinstance(options_schemas, (list, tuple)):
+            options_schemas = [options_schemas]
+
+        outs = options.get("out") or graphene_settings.SCHEMA_OUTPUT
+        if not isinstance(outs, (list, tuple)):
+            outs = [outs]
 
-            self.stdout.write(success("Successfully dumped GraphQL schema to %s" % out))
+        if len(outs) != len(options_schemas):
+            raise CommandError(
+                "Received {} schemas but {} output files, use one --out file per schema".format(
+                    len(options_schemas), len(outs)
+                )
+            )
+
+        # All the schemas are imported before dumping any of them,
+        # so errors are reported before writing files.
+        schemas = [self.get_schema(options_schema) for options_schema in options_schemas]
+
+        indent = options.get("indent")
+        skip_unchanged = options.get("skip_unchanged")
+        for schema, out in zip(schemas, outs):
+            self.dump_schema(schema, out, indent, skip_unchanged)
@@ -0,0 +1,126 @@
+import importlib
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from graphene_django.settings import graphene_settings
+from graphene_django.types import DjangoObjectType
+
+
+class CommandArguments(BaseCommand):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "types",
+            type=str,
+            nargs="+",
+            help="DjangoObjectTypes with search_fields, by name in the schema "
+            "or by import path (e.g. myproject.core.schema.ArticleNode)",
+        )
+
+        parser.add_argument(
+            "--schema",
+            type=str,
+            dest="schema",
+            default=graphene_settings.SCHEMA,
+            help="Django app containing schema to use, e.g. myproject.core.schema.schema",
+        )
+
+        parser.add_argument(
+            "--database",
+            type=str,
+            dest="database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database where the index is created (default: default)",
+        )
+
+        parser.add_argument(
+            "--refresh",
+            action="store_true",
+            dest="refresh",
+            default=False,
+            help="Only rebuild the contents of the existing indexes",
+        )
+
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            dest="drop",
+            default=False,
+            help="Drop the indexes, for example to create them again after "
+            "changing the search_fields",
+        )
+
+
+class Command(CommandArguments):
+    help = (
+        "Create and fill the full-text search index of the search_fields of "
+        "the given DjangoObjectTypes"
+    )
+    can_import_settings = True
+
+    def get_schema(self, options_schema):
+        if options_schema and type(options_schema) is str:
+            module_str, schema_name = options_schema.rsplit(".", 1)
+            mod = importlib.import_module(module_str)
+            return getattr(mod, schema_name)
+        return options_schema or graphene_settings.SCHEMA
+
+    def get_type(self, name, options_schema):
+        if "." in name:
+            module_str, type_name = name.rsplit(".", 1)
+            graphene_type = getattr(importlib.import_module(module_str), type_name)
+        else:
+            schema = self.get_schema(options_schema)
+            if not schema:
+                raise CommandError(
+                    "Specify schema on GRAPHENE.SCHEMA setting or by using --schema"
+                )
+            graphql_type = schema.get_type(name)
+            graphene_type = getattr(graphql_type, "graphene_type", None)
+
+        if not (
+            isinstance(graphene_type, type)
+            and issubclass(graphene_type, DjangoObjectType)
+        ):
+            raise CommandError("{} is not a DjangoObjectType".format(name))
+        if not graphene_type._meta.search_fields:
+            raise CommandError("{} has no search_fields".format(name))
+        return graphene_type
+
+    def handle(self, *args, **options):
+        from graphene_django.filter.search import (
+            create_search_index,
+            drop_search_index,
+            refresh_search_index,
+        )
+
+        using = options.get("database")
+        vendor = connections[using].vendor
+        if vendor not in ("postgresql", "sqlite"):
+            raise CommandError(
+                "Full-text search indexes are not supported in {}".format(vendor)
+            )
+
+        graphene_types = [
+            self.get_type(name, options.get("schema")) for name in options["types"]
+        ]
+        for graphene_type in graphene_types:
+            model = graphene_type._meta.model
+            fields = graphene_type._meta.search_fields
+            if options.get("drop"):
+                drop_search_index(model, using)
+                self.stdout.write(
+                    "Dropped the search index of {}".format(graphene_type.__name__)
+                )
+            elif options.get("refresh"):
+                refresh_search_index(model, using)
+                self.stdout.write(
+                    "Refreshed the search index of {}".format(graphene_type.__name__)
+                )
+            else:
+                create_search_index(model, fields, using=using)
+                self.stdout.write(
+                    "Created the search index of {} ({})".format(
+                        graphene_type.__name__, ", ".join(fields)
+                    )
+                )
@@ -0,0 +1,114 @@
+from collections import OrderedDict
+
+from graphene.utils.str_converters import to_camel_case, to_snake_case
+
+from .utils import get_selections
+
+
+def get_relations(model):
+    """ The relations of the model by the name of their attribute (the
+        accessor name for reverse relations), as they are named in the
+        fields of a DjangoObjectType
+    """
+    relations = OrderedDict()
+    for field in model._meta.get_fields():
+        if not field.is_relation:
+            continue
+        if field.auto_created and not field.concrete:
+            if field.related_name and field.related_name.endswith("+"):
+                continue
+            relations[field.get_accessor_name()] = field
+        else:
+            relations[field.name] = field
+    return relations
+
+
+def is_single_relation(field):
+    return field.many_to_one or field.one_to_one
+
+
+def get_related_lookups(model, info, field_asts, prefix="", prefetch=False):
+    """ The select_related and prefetch_related lookups needed to resolve
+        the relations of the model selected in the given field ASTs without
+        a query for each object.
+
+        Relations to one object are selected with a join, unless they are
+        under a prefetched relation, and relations to many objects are
+        prefetched, unless they are paginated with a connection (that
+        makes its own queries).
+    """
+    select_related = []
+    prefetch_related = []
+    relations = get_relations(model)
+
+    for name, selected_asts in get_selections(info, field_asts).items():
+        field = relations.get(to_snake_case(name)) or relations.get(name)
+        if field is None or field.related_model is None:
+            continue
+        # Reverse relations are prefetched by their accessor name, that is
+        # also the query name of reverse one to one relations
+        path = prefix + (field.name if field.concrete else field.get_accessor_name())
+        if is_single_relation(field):
+            nested_prefetch = prefetch
+        else:
+            if "edges" in get_selections(info, selected_asts):
+                continue
+            nested_prefetch = True
+
+        (prefetch_related if nested_prefetch else select_related).append(path)
+        nested_select, nested_prefetch_related = get_related_lookups(
+            field.related_model,
+            info,
+            selected_asts,
+            prefix=path + "__",
+            prefetch=nested_prefetch,
+        )
+        select_related.extend(nested_select)
+        prefetch_related.extend(nested_prefetch_related)
+
+    # A lookup already included by a longer one isn't needed
+    select_related = [
+        lookup
+        for lookup in select_related
+        if not any(other.startswith(lookup + "__") for other in select_related)
+    ]
+    prefetch_related = [
+        lookup
+        for lookup in prefetch_related
+        if not any(other.startswith(lookup + "__") for other in prefetch_related)
+    ]
+    return select_related, prefetch_related
+
+
+def get_payload_field_asts(info, name):
+    """ The ASTs of the given field of the payload being resolved """
+    selections = get_selections(info)
+    return selections.get(name) or selections.get(to_camel_case(name)) or []
+
+
+def reload_with_related(model, objs, select_related, prefetch_related):
+    """ Load again the objects with the related objects of the lookups, in
+        the same order
+    """
+    if not select_related and not prefetch_related:
+        return objs
+    queryset = model._default_manager.all()
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    loaded = queryset.in_bulk([obj.pk for obj in objs])
+    return [loaded.get(obj.pk, obj) for obj in objs]
+
+
+def reload_payload_objects(model, objs, info, field_name):
+    """ Load again the objects returned in the given field of a mutation
+        payload, with the relations selected in it
+    """
+    if info is None or not objs:
+        return objs
+    field_asts = get_payload_field_asts(info, field_name)
+    if not field_asts:
+        return objs
+    select_related, prefetch_related = get_related_lookups(model, info, field_asts)
+    return reload_with_related(model, objs, select_related, prefetch_related)
@@ -2,6 +2,7 @@ class Registry(object):
     def __init__(self):
         self._registry = {}
         self._field_registry = {}
+        self._choices_enum_registry = {}
 
     def register(self, cls):
         from .types import DjangoObjectType
@@ -27,6 +28,12 @@ class Registry(object):
     def get_converted_field(self, field):
         return self._field_registry.get(field)
 
+    def register_choices_enum(self, key, enum):
+        self._choices_enum_registry[key] = enum
+
+    def get_choices_enum(self, key):
+        return self._choices_enum_registry.get(key)
+
 
 registry = None
 
@@ -1,14 +1,23 @@
 from collections import OrderedDict
 
+from django.core.exceptions import ValidationError
+from django.db import models
 from django.shortcuts import get_object_or_404
 
 import graphene
 from graphene.types import Field, InputField
 from graphene.types.mutation import MutationOptions
-from graphene.relay.mutation import ClientIDMutation
 from graphene.types.objecttype import yank_fields_from_attrs
 
+from ..idempotency import IdempotentMutation
+from ..optimization import reload_with_related
+from ..utils import get_model_queryset, get_selections
 from .serializer_converter import convert_serializer_field
+from .serializers import (
+    BulkListSerializer,
+    get_serializer_lookups,
+    set_serializer_fields,
+)
 from .types import ErrorType
 
 
@@ -17,6 +26,12 @@ class SerializerMutationOptions(MutationOptions):
     model_class = None
     model_operations = ["create", "update"]
     serializer_class = None
+    many = False
+    reuse_fields = False
+    serializer_fields = None
+
+
+converted_fields = {}
 
 
 def fields_for_serializer(serializer, only_fields, exclude_fields, is_input=False):
@@ -36,7 +51,28 @@ def fields_for_serializer(serializer, only_fields, exclude_fields, is_input=Fals
     return fields
 
 
-class SerializerMutation(ClientIDMutation):
+def get_converted_fields(serializer_class):
+    """ The input and output fields of all the fields of the serializer
+        class, that are converted once for each class
+    """
+    if serializer_class not in converted_fields:
+        serializer = serializer_class()
+        converted_fields[serializer_class] = (
+            fields_for_serializer(serializer, (), (), is_input=True),
+            fields_for_serializer(serializer, (), (), is_input=False),
+        )
+    return converted_fields[serializer_class]
+
+
+def select_fields(fields, only_fields, exclude_fields):
+    return OrderedDict(
+        (name, field)
+        for name, field in fields.items()
+        if not (only_fields and name not in only_fields) and name not in exclude_fields
+    )
+
+
+class SerializerMutation(IdempotentMutation):
     class Meta:
         abstract = True
 
@@ -53,6 +89,8 @@ class SerializerMutation(ClientIDMutation):
         model_operations=["create", "update"],
         only_fields=(),
         exclude_fields=(),
+        many=False,
+        reuse_fields=False,
         **options
     ):
 
@@ -62,7 +100,6 @@ class SerializerMutation(ClientIDMutation):
         if "update" not in model_operations and "create" not in model_operations:
             raise Exception('model_operations must contain "create" and/or "update"')
 
-        serializer = serializer_class()
         if model_class is None:
             serializer_meta = getattr(serializer_class, "Meta", None)
             if serializer_meta:
@@ -71,18 +108,39 @@ class SerializerMutation(ClientIDMutation):
         if lookup_field is None and model_class:
             lookup_field = model_class._meta.pk.name
 
-        input_fields = fields_for_serializer(
-            serializer, only_fields, exclude_fields, is_input=True
-        )
-        output_fields = fields_for_serializer(
-            serializer, only_fields, exclude_fields, is_input=False
-        )
+        input_fields, output_fields = get_converted_fields(serializer_class)
+        input_fields = select_fields(input_fields, only_fields, exclude_fields)
+        output_fields = select_fields(output_fields, only_fields, exclude_fields)
+
+        if many:
+            # A list of items with the fields of the serializer as input,
+            # and a list of results with them as output
+            item_type = type(
+                str("{}Item".format(cls.__name__)),
+                (graphene.InputObjectType,),
+                yank_fields_from_attrs(input_fields, _as=InputField),
+            )
+            result_type = type(
+                str("{}Result".format(cls.__name__)),
+                (graphene.ObjectType,),
+                yank_fields_from_attrs(output_fields, _as=Field),
+            )
+            input_fields = OrderedDict(
+                [("items", graphene.List(graphene.NonNull(item_type), required=True))]
+            )
+            output_fields = OrderedDict([("results", graphene.List(result_type))])
 
         _meta = SerializerMutationOptions(cls)
         _meta.lookup_field = lookup_field
         _meta.model_operations = model_operations
         _meta.serializer_class = serializer_class
         _meta.model_class = model_class
+        _meta.many = many
+        _meta.reuse_fields = reuse_fields
+        if reuse_fields:
+            # The fields of the serializers of the requests are copied from
+            # the ones of this serializer, instead of built for each one
+            _meta.serializer_fields = serializer_class().fields
         _meta.fields = yank_fields_from_attrs(output_fields, _as=Field)
 
         input_fields = yank_fields_from_attrs(input_fields, _as=InputField)
@@ -90,6 +148,13 @@ class SerializerMutation(ClientIDMutation):
             _meta=_meta, input_fields=input_fields, **options
         )
 
+    @classmethod
+    def get_serializer(cls, **kwargs):
+        serializer = cls._meta.serializer_class(**kwargs)
+        if cls._meta.reuse_fields:
+            set_serializer_fields(serializer, cls._meta.serializer_fields)
+        return serializer
+
     @classmethod
     def get_serializer_kwargs(cls, root, info, **input):
         lookup_field = cls._meta.lookup_field
@@ -98,7 +163,8 @@ class SerializerMutation(ClientIDMutation):
         if model_class:
             if "update" in cls._meta.model_operations and lookup_field in input:
                 instance = get_object_or_404(
-                    model_class, **{lookup_field: input[lookup_field]}
+                    get_model_queryset(model_class, info),
+                    **{lookup_field: input[lookup_field]}
                 )
             elif "create" in cls._meta.model_operations:
                 instance = None
@@ -117,10 +183,110 @@ class SerializerMutation(ClientIDMutation):
 
         return {"data": input, "context": {"request": info.context}}
 
+    @classmethod
+    def get_list_serializer_kwargs(cls, root, info, items):
+        """ The kwargs of the BulkListSerializer of the items, with the
+            existing objects loaded in one query, and the errors of the items
+            whose object doesn't exist
+        """
+        lookup_field = cls._meta.lookup_field
+        model_class = cls._meta.model_class
+        context = {"request": info.context}
+        if not model_class:
+            return {"data": items, "context": context}, []
+
+        if "create" not in cls._meta.model_operations and any(
+            lookup_field not in item for item in items
+        ):
+            raise Exception(
+                'Invalid update operation. Input parameter "{}" required.'.format(
+                    lookup_field
+                )
+            )
+
+        instances = [None] * len(items)
+        messages = {}
+        if "update" in cls._meta.model_operations:
+            lookups, messages = cls.get_item_lookups(items)
+            field = model_class._meta.get_field(lookup_field)
+            objects = {}
+            if lookups:
+                queryset = get_model_queryset(model_class, info).filter(
+                    **{"{}__in".format(lookup_field): list(lookups.values())}
+                )
+                objects = {field.value_from_object(obj): obj for obj in queryset}
+
+            for index, lookup in lookups.items():
+                instances[index] = objects.get(lookup)
+                if instances[index] is None:
+                    messages[index] = [
+                        "No {} matches the given query.".format(
+                            model_class._meta.object_name
+                        )
+                    ]
+
+        errors = [
+            ErrorType(
+                field="items.{}.{}".format(index, lookup_field),
+                messages=messages[index],
+            )
+            for index in sorted(messages)
+        ]
+        return {"instance": instances, "data": items, "context": context}, errors
+
+    @classmethod
+    def get_item_lookups(cls, items):
+        """ The lookup value of each item with one, and the errors of the
+            items whose value is invalid or repeated, by their index
+        """
+        lookup_field = cls._meta.lookup_field
+        field = cls._meta.model_class._meta.get_field(lookup_field)
+        lookups = OrderedDict()
+        seen = set()
+        errors = {}
+        for index, item in enumerate(items):
+            if lookup_field not in item:
+                continue
+            try:
+                lookup = field.to_python(item[lookup_field])
+            except ValidationError as e:
+                errors[index] = list(e.messages)
+                continue
+            if lookup in seen:
+                errors[index] = [
+                    "The {} is repeated in the items.".format(lookup_field)
+                ]
+                continue
+            seen.add(lookup)
+            lookups[index] = lookup
+        return lookups, errors
+
+    @classmethod
+    def mutate_many(cls, root, info, items):
+        kwargs, errors = cls.get_list_serializer_kwargs(root, info, items)
+        if errors:
+            return cls(errors=errors)
+
+        serializer = BulkListSerializer(
+            child=cls.get_serializer(context=kwargs["context"]), **kwargs
+        )
+        if serializer.is_valid():
+            return cls.perform_mutate(serializer, info)
+
+        errors = [
+            ErrorType(field="items.{}.{}".format(index, key), messages=value)
+            for index, item_errors in enumerate(serializer.errors)
+            for key, value in item_errors.items()
+        ]
+        return cls(errors=errors)
+
     @classmethod
     def mutate_and_get_payload(cls, root, info, **input):
+        if cls._meta.many:
+            return cls.mutate_many(root, info, input["items"])
+
         kwargs = cls.get_serializer_kwargs(root, info, **input)
-        serializer = cls._meta.serializer_class(**kwargs)
+        serializer = cls.get_serializer(**kwargs)
 
         if serializer.is_valid():
             return cls.perform_mutate(serializer, info)
@@ -132,10 +298,43 @@ class SerializerMutation(ClientIDMutation):
 
             return cls(errors=errors)
 
+    @classmethod
+    def reload_objects(cls, serializer, objs, info):
+        """ Load again the saved objects with the relations of the fields
+            selected in the payload, so they don't make a query each
+        """
+        model_class = cls._meta.model_class
+        if info is None or model_class is None or not objs:
+            return objs
+        field_asts = info.field_asts
+        if cls._meta.many:
+            field_asts = get_selections(info).get("results")
+        if not field_asts:
+            return objs
+        select_related, prefetch_related = get_serializer_lookups(
+            serializer, info, field_asts
+        )
+        return reload_with_related(
+            model_class, objs, select_related, prefetch_related
+        )
+
     @classmethod
     def perform_mutate(cls, serializer, info):
         obj = serializer.save()
 
+        if cls._meta.many:
+            objs = cls.reload_objects(serializer.child, obj, info)
+            result_type = cls._meta.fields["results"].type.of_type
+            fields = serializer.child.fields.items()
+            results = [
+                result_type(**{f: field.get_attribute(o) for f, field in fields})
+                for o in objs
+            ]
+            return cls(errors=None, results=results)
+
+        if isinstance(obj, models.Model):
+            (obj,) = cls.reload_objects(serializer, [obj], info)
+
         kwargs = {}
         for f, field in serializer.fields.items():
             kwargs[f] = field.get_attribute(obj)
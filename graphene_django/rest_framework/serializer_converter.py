@@ -9,6 +9,8 @@ from .types import DictType
 
 singledispatch = import_single_dispatch()
 
+input_types = {}
+
 
 @singledispatch
 def get_graphene_type_from_serializer_field(field):
@@ -18,6 +20,18 @@ def get_graphene_type_from_serializer_field(field):
     )
 
 
+def get_model_type(model):
+    """
+    The type of the model, looked up in the registry when the schema is
+    built (as the converted fields are reused by later mutations)
+    """
+
+    def model_type():
+        return get_global_registry().get_type_for_model(model)
+
+    return model_type
+
+
 def convert_serializer_field(field, is_input=True):
     """
     Converts a django rest frameworks field to a graphql field
@@ -40,23 +54,26 @@ def convert_serializer_field(field, is_input=True):
         if is_input:
             graphql_type = convert_serializer_to_input_type(field.__class__)
         else:
-            global_registry = get_global_registry()
-            field_model = field.Meta.model
-            args = [global_registry.get_type_for_model(field_model)]
+            args = [get_model_type(field.Meta.model)]
     elif isinstance(field, serializers.ListSerializer):
         field = field.child
         if is_input:
             kwargs["of_type"] = convert_serializer_to_input_type(field.__class__)
         else:
             del kwargs["of_type"]
-            global_registry = get_global_registry()
-            field_model = field.Meta.model
-            args = [global_registry.get_type_for_model(field_model)]
+            args = [get_model_type(field.Meta.model)]
 
     return graphql_type(*args, **kwargs)
 
 
 def convert_serializer_to_input_type(serializer_class):
+    """
+    The input type of a nested serializer, that is created once for each
+    serializer class (and reused by every mutation that nests it)
+    """
+    if serializer_class in input_types:
+        return input_types[serializer_class]
+
     serializer = serializer_class()
 
     items = {
@@ -64,11 +81,12 @@ def convert_serializer_to_input_type(serializer_class):
         for name, field in serializer.fields.items()
     }
 
-    return type(
+    input_types[serializer_class] = type(
         "{}Input".format(serializer.__class__.__name__),
         (graphene.InputObjectType,),
         items,
     )
+    return input_types[serializer_class]
 
 
 @get_graphene_type_from_serializer_field.register(serializers.Field)
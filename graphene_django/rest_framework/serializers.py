@@ -0,0 +1,185 @@
+import copy
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import router, transaction
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from graphene.utils.str_converters import to_camel_case
+
+from ..optimization import get_relations
+from ..utils import bulk_save, get_selections
+
+
+def get_model_field_names(model, names):
+    """ The model fields of the given names, or None if any of them isn't
+        a concrete field that can be set as an attribute
+    """
+    fields = []
+    for name in names:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete or field.many_to_many:
+            return None
+        fields.append(field.name)
+    return fields
+
+
+def get_serializer_lookups(serializer, info, field_asts, prefix="", prefetch=False):
+    """ The select_related and prefetch_related lookups of the model of the
+        serializer needed to get the attributes of the selected fields,
+        including the ones of the nested serializers
+    """
+    model = getattr(getattr(serializer, "Meta", None), "model", None)
+    if model is None:
+        return [], []
+
+    select_related = []
+    prefetch_related = []
+    relations = get_relations(model)
+    selections = get_selections(info, field_asts)
+    for name, field in serializer.fields.items():
+        selected_asts = selections.get(name) or selections.get(to_camel_case(name))
+        if not selected_asts or len(field.source_attrs) != 1:
+            continue
+        relation = relations.get(field.source_attrs[0])
+        if relation is None or relation.related_model is None:
+            continue
+
+        path = prefix + relation.name if relation.concrete else prefix + (
+            relation.get_accessor_name()
+        )
+        if isinstance(field, serializers.ListSerializer):
+            nested = field.child
+        elif isinstance(field, serializers.BaseSerializer):
+            nested = field
+        elif isinstance(field, serializers.ManyRelatedField):
+            prefetch_related.append(path)
+            continue
+        elif isinstance(field, serializers.RelatedField):
+            if field.use_pk_only_optimization():
+                # The related id is read from the object
+                continue
+            (prefetch_related if prefetch else select_related).append(path)
+            continue
+        else:
+            continue
+
+        nested_prefetch = prefetch or not (
+            relation.many_to_one or relation.one_to_one
+        )
+        (prefetch_related if nested_prefetch else select_related).append(path)
+        nested_select, nested_prefetch_related = get_serializer_lookups(
+            nested, info, selected_asts, path + "__", nested_prefetch
+        )
+        select_related.extend(nested_select)
+        prefetch_related.extend(nested_prefetch_related)
+    return select_related, prefetch_related
+
+
+def copy_field(field, parent):
+    """ A shallow copy of a bound field for another parent, with copies of
+        its children, instead of the deep copy of the declared field that
+        a new serializer makes
+    """
+    field = copy.copy(field)
+    field.parent = parent
+    if "fields" in field.__dict__:
+        field.__dict__["fields"] = copy_fields(field.__dict__["fields"], field)
+    for name in ("child", "child_relation"):
+        child = field.__dict__.get(name)
+        if child is not None:
+            setattr(field, name, copy_field(child, field))
+    return field
+
+
+def copy_fields(fields, serializer):
+    """ The given fields of a serializer, bound to another one of its class """
+    copies = serializers.BindingDict(serializer)
+    for name, field in fields.items():
+        # The copies keep their name and source, so they aren't bound again
+        copies.fields[name] = copy_field(field, serializer)
+    return copies
+
+
+def set_serializer_fields(serializer, fields):
+    """ Use copies of the fields of another serializer of the same class
+        as the fields of the serializer
+    """
+    serializer.__dict__["fields"] = copy_fields(fields, serializer)
+    return serializer
+
+
+class BulkListSerializer(serializers.ListSerializer):
+    """ A ListSerializer for a list of new and existing objects, whose
+        instance is the list with the object of each item (or None).
+
+        Every item is validated with its object, and when the child is a
+        ModelSerializer without custom create and update methods, the
+        objects are saved with bulk_create and bulk_update. All the objects
+        are saved in one transaction.
+    """
+
+    def get_instances(self, data):
+        return self.instance if self.instance is not None else [None] * len(data)
+
+    def to_internal_value(self, data):
+        validated_data = []
+        errors = []
+        for item, instance in zip(data, self.get_instances(data)):
+            self.child.instance = instance
+            try:
+                validated_data.append(self.child.run_validation(item))
+            except ValidationError as exc:
+                errors.append(exc.detail)
+            else:
+                errors.append({})
+        self.child.instance = None
+
+        if any(errors):
+            raise ValidationError(errors)
+        return validated_data
+
+    def is_bulk_saveable(self, model, validated_data):
+        child_class = type(self.child)
+        if not isinstance(self.child, serializers.ModelSerializer) or (
+            child_class.create is not serializers.ModelSerializer.create
+            or child_class.update is not serializers.ModelSerializer.update
+        ):
+            return False
+        names = set(name for attrs in validated_data for name in attrs)
+        return get_model_field_names(model, names) is not None
+
+    def save(self, **kwargs):
+        validated_data = [dict(attrs, **kwargs) for attrs in self.validated_data]
+        instances = self.get_instances(validated_data)
+        model = getattr(getattr(self.child, "Meta", None), "model", None)
+
+        using = router.db_for_write(model) if model else None
+        with transaction.atomic(using=using):
+            if model and self.is_bulk_saveable(model, validated_data):
+                self.instance = self.bulk_save(model, instances, validated_data, using)
+            else:
+                self.instance = [
+                    self.child.update(instance, attrs)
+                    if instance is not None
+                    else self.child.create(attrs)
+                    for instance, attrs in zip(instances, validated_data)
+                ]
+        return self.instance
+
+    def bulk_save(self, model, instances, validated_data, using):
+        objs = []
+        update_fields = set()
+        for instance, attrs in zip(instances, validated_data):
+            if instance is None:
+                objs.append(model(**attrs))
+                continue
+            for name, value in attrs.items():
+                setattr(instance, name, value)
+            update_fields.update(attrs)
+            objs.append(instance)
+        update_fields = get_model_field_names(model, sorted(update_fields))
+        return bulk_save(model, objs, update_fields, using)
@@ -8,7 +8,7 @@ from rest_framework import serializers
 
 from ...types import DjangoObjectType
 from ..models import MyFakeModel
-from ..mutation import SerializerMutation
+from ..mutation import SerializerMutation, get_converted_fields
 
 
 def mock_info():
@@ -106,6 +106,56 @@ def test_nested_model():
     assert "created" in model_input_type._meta.fields
 
 
+def test_converts_serializer_fields_once():
+    class MyMutation(SerializerMutation):
+        class Meta:
+            serializer_class = MySerializer
+
+    class MyOtherMutation(SerializerMutation):
+        class Meta:
+            serializer_class = MySerializer
+            only_fields = ("model",)
+
+    assert get_converted_fields(MySerializer) is get_converted_fields(MySerializer)
+    # The input type of the nested serializer is shared
+    model_input = MyMutation.Input._meta.fields["model"]
+    other_model_input = MyOtherMutation.Input._meta.fields["model"]
+    assert model_input._type.of_type is other_model_input._type.of_type
+    assert "text" not in MyOtherMutation.Input._meta.fields
+
+
+def test_reuse_fields_mutate_and_get_payload_success():
+    class CountingSerializer(MySerializer):
+        built = []
+
+        def get_fields(self):
+            self.built.append(self)
+            return super(CountingSerializer, self).get_fields()
+
+    class MyMutation(SerializerMutation):
+        class Meta:
+            serializer_class = CountingSerializer
+            reuse_fields = True
+
+    built = len(CountingSerializer.built)
+    for cool_name in ("Narf", "Zort"):
+        result = MyMutation.mutate_and_get_payload(
+            None, mock_info(), **{"text": "value", "model": {"cool_name": cool_name}}
+        )
+        assert result.errors is None
+        assert result.model == {"cool_name": cool_name}
+    # The fields of the serializers of the mutations are copied
+    assert len(CountingSerializer.built) == built
+
+    serializer = MyMutation.get_serializer(data={}, context={"request": "request"})
+    nested_field = serializer.fields["model"].fields["cool_name"]
+    assert nested_field is not MyMutation._meta.serializer_fields["model"].fields[
+        "cool_name"
+    ]
+    assert nested_field.root is serializer
+    assert nested_field.context == {"request": "request"}
+
+
 def test_mutate_and_get_payload_success():
     class MyMutation(SerializerMutation):
         class Meta:
@@ -177,3 +227,115 @@ def test_invalid_serializer_operations():
                 model_operations = ["Add"]
 
     assert "model_operations" in str(exc.value)
+
+
+class MyModelBulkMutation(SerializerMutation):
+    class Meta:
+        serializer_class = MyModelSerializer
+        many = True
+
+
+def test_many_has_list_input_and_output():
+    assert "items" in MyModelBulkMutation.Input._meta.fields
+    assert "results" in MyModelBulkMutation._meta.fields
+    assert "errors" in MyModelBulkMutation._meta.fields
+
+    item_type = MyModelBulkMutation.Input._meta.fields["items"].type.of_type.of_type
+    assert "cool_name" in item_type.of_type._meta.fields
+
+
+@mark.django_db
+def test_many_mutate_and_get_payload_success(django_assert_num_queries):
+    narf = MyFakeModel.objects.create(cool_name="Narf")
+    zort = MyFakeModel.objects.create(cool_name="Zort")
+
+    items = [
+        {"id": str(narf.pk), "cool_name": "New Narf"},
+        {"cool_name": "Poit"},
+        {"id": zort.pk, "cool_name": "New Zort"},
+    ]
+    # The lookup, the insert (one by one where the database doesn't return
+    # the ids of the inserted rows) and the update, in a savepoint
+    with django_assert_num_queries(5):
+        result = MyModelBulkMutation.mutate_and_get_payload(
+            None, mock_info(), items=items
+        )
+
+    assert result.errors is None
+    assert [r.cool_name for r in result.results] == ["New Narf", "Poit", "New Zort"]
+    assert all(r.id for r in result.results)
+    assert sorted(MyFakeModel.objects.values_list("cool_name", flat=True)) == [
+        "New Narf",
+        "New Zort",
+        "Poit",
+    ]
+
+
+@mark.django_db
+def test_many_mutate_and_get_payload_error():
+    narf = MyFakeModel.objects.create(cool_name="Narf")
+
+    result = MyModelBulkMutation.mutate_and_get_payload(
+        None,
+        mock_info(),
+        items=[{"id": narf.pk, "cool_name": "New Narf"}, {"cool_name": "x" * 51}],
+    )
+    assert [(e.field, len(e.messages)) for e in result.errors] == [
+        ("items.1.cool_name", 1)
+    ]
+    narf.refresh_from_db()
+    assert narf.cool_name == "Narf"
+
+    result = MyModelBulkMutation.mutate_and_get_payload(
+        None, mock_info(), items=[{"id": narf.pk + 1, "cool_name": "Zort"}]
+    )
+    assert [(e.field, e.messages) for e in result.errors] == [
+        ("items.0.id", ["No MyFakeModel matches the given query."])
+    ]
+    assert MyFakeModel.objects.count() == 1
+
+
+@mark.django_db
+def test_many_mutate_invalid_and_repeated_ids():
+    narf = MyFakeModel.objects.create(cool_name="Narf")
+
+    result = MyModelBulkMutation.mutate_and_get_payload(
+        None,
+        mock_info(),
+        items=[
+            {"id": "abc", "cool_name": "A"},
+            {"id": narf.pk, "cool_name": "A"},
+            {"id": str(narf.pk), "cool_name": "B"},
+        ],
+    )
+    assert [e.field for e in result.errors] == ["items.0.id", "items.2.id"]
+    assert "must be an integer" in result.errors[0].messages[0]
+    assert result.errors[1].messages == ["The id is repeated in the items."]
+    narf.refresh_from_db()
+    assert narf.cool_name == "Narf"
+
+
+@mark.django_db
+def test_many_mutate_with_custom_create():
+    class CreateCountingSerializer(MyModelSerializer):
+        created = []
+
+        def create(self, validated_data):
+            obj = super(CreateCountingSerializer, self).create(validated_data)
+            self.created.append(obj)
+            return obj
+
+    class MyMutation(SerializerMutation):
+        class Meta:
+            serializer_class = CreateCountingSerializer
+            many = True
+
+    result = MyMutation.mutate_and_get_payload(
+        None, mock_info(), items=[{"cool_name": "Narf"}, {"cool_name": "Zort"}]
+    )
+    assert result.errors is None
+    # Serializers with their own create and update methods are saved with them
+    assert [obj.cool_name for obj in CreateCountingSerializer.created] == [
+        "Narf",
+        "Zort",
+    ]
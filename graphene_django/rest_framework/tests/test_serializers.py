@@ -0,0 +1,42 @@
+from graphql import parse
+from mock import Mock
+from rest_framework import serializers
+
+from ...tests.models import Article, Reporter
+from ..serializers import get_serializer_lookups
+
+
+class ReporterSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Reporter
+        fields = ("id", "first_name", "films")
+
+
+class ArticleSerializer(serializers.ModelSerializer):
+    reporter = ReporterSerializer()
+
+    class Meta:
+        model = Article
+        fields = ("id", "headline", "reporter", "editor")
+
+
+def get_info(query):
+    document = parse(query)
+    (operation,) = document.definitions
+    return Mock(field_asts=operation.selection_set.selections, fragments={})
+
+
+def test_get_serializer_lookups_of_nested_serializers():
+    info = get_info("{ article { headline editor reporter { firstName films } } }")
+    assert get_serializer_lookups(ArticleSerializer(), info, info.field_asts) == (
+        ["reporter"],
+        ["reporter__films"],
+    )
+
+
+def test_get_serializer_lookups_of_unselected_fields():
+    info = get_info("{ article { headline editor } }")
+    assert get_serializer_lookups(ArticleSerializer(), info, info.field_asts) == (
+        [],
+        [],
+    )
@@ -35,13 +35,63 @@ DEFAULTS = {
     "RELAY_CONNECTION_ENFORCE_FIRST_OR_LAST": False,
     # Max items returned in ConnectionFields / FilterConnectionFields
     "RELAY_CONNECTION_MAX_LIMIT": 100,
+    # Set to False to reject the operations that query the schema
+    # (__schema, __type), for example in production
+    "INTROSPECTION_ENABLED": True,
+    # Cache, per schema, the JSON response of the operations that only
+    # query the schema (like the one sent by GraphiQL and other tools)
+    "INTROSPECTION_CACHE": True,
+    # JSON lines file where graphene_django.traffic.GraphQLTrafficRecorderMiddleware
+    # records a sample of the served operations
+    "TRAFFIC_RECORDING_FILE": None,
+    # Fraction of the operations that are recorded
+    "TRAFFIC_RECORDING_SAMPLE_RATE": 0.01,
+    # Size at which the file is rotated, and number of old files kept
+    "TRAFFIC_RECORDING_MAX_BYTES": 10 * 1024 * 1024,
+    "TRAFFIC_RECORDING_BACKUP_COUNT": 5,
+    # Set to True to reuse one GraphQL enum for all the model fields
+    # that have exactly the same choices
+    "DJANGO_CHOICE_FIELD_ENUM_SHARED": False,
+    # Function (or import string) that receives a model field with choices
+    # and returns the name of its GraphQL enum (or None for the default).
+    # Fields with the same enum name share the same GraphQL enum
+    "DJANGO_CHOICE_FIELD_ENUM_CUSTOM_NAME": None,
+    # PostgreSQL text search configuration used by the full-text
+    # search filters and their indexes
+    "SEARCH_CONFIG": "english",
+    # Executor of the jobs of graphene_django.jobs.DjangoFormJobMutation
+    "JOB_EXECUTOR": "graphene_django.jobs.executors.ThreadPoolJobExecutor",
+    # Workers of the thread and process pool executors, and number of jobs
+    # whose status they keep
+    "JOB_EXECUTOR_MAX_WORKERS": 4,
+    "JOB_EXECUTOR_MAX_JOBS": 1000,
+    # Seconds after which the running jobs of DatabaseJobExecutor are
+    # marked as failed (as when their worker died), or None to keep them
+    "JOB_TIMEOUT": 60 * 60,
+    # Store of the payloads of the mutations with an idempotencyKey, the
+    # cache it uses (for the default store) and seconds they are kept
+    "IDEMPOTENCY_STORE": "graphene_django.idempotency.CacheIdempotencyStore",
+    "IDEMPOTENCY_CACHE": "default",
+    "IDEMPOTENCY_KEY_TTL": 24 * 60 * 60,
+    # Fraction of the operations whose SQL queries are recorded by
+    # graphene_django.debug.DjangoDebugMiddleware, and HTTP header that
+    # turns the recording on (or off, with "0") for a request. Any client
+    # can send the header, so it's disabled unless it's set
+    "DEBUG_SAMPLE_RATE": 1.0,
+    "DEBUG_SAMPLE_HEADER": None,
 }
 
 if settings.DEBUG:
     DEFAULTS["MIDDLEWARE"] += ("graphene_django.debug.DjangoDebugMiddleware",)
 
 # List of settings that may be in string import notation.
-IMPORT_STRINGS = ("MIDDLEWARE", "SCHEMA")
+IMPORT_STRINGS = (
+    "MIDDLEWARE",
+    "SCHEMA",
+    "DJANGO_CHOICE_FIELD_ENUM_CUSTOM_NAME",
+    "JOB_EXECUTOR",
+    "IDEMPOTENCY_STORE",
+)
 
 
 def perform_import(val, setting_name):
@@ -17,7 +17,7 @@ from ..types import DjangoObjectType
 from ..settings import graphene_settings
 from .models import Article, Reporter
 from ..auth.decorators import node_require_permission, mutation_require_permission, connection_require_permission
-from ..auth.utils import is_related_to_user, is_authorized_to_mutate_object
+from ..auth.utils import is_related_to_user, is_authorized_to_mutate_object, has_perm
 from ..rest_framework.mutation import SerializerMutation
 
 pytestmark = pytest.mark.django_db
@@ -459,3 +459,85 @@ def test_auth_connection():
     request = Mock(context=context, user=user_anonymous)
     result = schema.execute(query, context_value=request)
     assert result.errors
+
+
+class CountingUser(MockUserContext):
+
+    def __init__(self, **kwargs):
+        super(CountingUser, self).__init__(**kwargs)
+        self.checked = []
+        self.loaded = 0
+
+    def get_all_permissions(self):
+        self.loaded += 1
+        return set(self.perms)
+
+    def has_perm(self, check_perms):
+        self.checked.append(check_perms)
+        return super(CountingUser, self).has_perm(check_perms)
+
+
+def test_has_perm_loads_the_permissions_once():
+    user = CountingUser(perms=('can_view_foo', ))
+    context = Context(user=user)
+
+    assert has_perm(('can_view_foo', ), context)
+    assert has_perm(('can_view_foo', ), context)
+    assert not has_perm(('can_view_foo', 'can_view_bar'), context)
+    assert not has_perm(('can_view_bar', ), context)
+
+    assert user.loaded == 1
+    # Only the permissions that aren't in the loaded ones are checked, once
+    assert user.checked == ['can_view_bar']
+
+
+def test_has_perm_is_authenticated_attribute():
+    class User(object):
+        # As in Django 1.10 and later
+        is_authenticated = False
+
+    assert not has_perm(('can_view_foo', ), Context(user=User()))
+
+
+def test_node_permissions_are_checked_once_per_field():
+    class ReporterType(DjangoObjectType):
+
+        class Meta:
+            model = Reporter
+            interfaces = (Node, )
+
+        @classmethod
+        @node_require_permission(permissions=('can_view_foo', ))
+        def get_node(cls, info, id):
+            return super(ReporterType, cls).get_node(info, id)
+
+    Reporter.objects.create(first_name='John', last_name='Doe', email='johndoe@example.com', a_choice=1)
+    Reporter.objects.create(first_name='Jane', last_name='Doe', email='janedoe@example.com', a_choice=1)
+
+    class Query(graphene.ObjectType):
+        reporter = Node.Field(ReporterType)
+
+    schema = graphene.Schema(query=Query)
+    query = '''
+        query {
+          john: reporter(id: "UmVwb3J0ZXJUeXBlOjE="){
+            firstName
+          }
+          jane: reporter(id: "UmVwb3J0ZXJUeXBlOjI="){
+            firstName
+          }
+        }
+    '''
+    user = CountingUser(perms=())
+    user.has_perm = Mock(return_value=True)
+    context = Context(user=user)
+    result = schema.execute(query, context_value=context)
+    assert not result.errors
+    assert result.data == {'john': {'firstName': 'John'}, 'jane': {'firstName': 'Jane'}}
+    assert user.has_perm.call_count == 1
+
+    # Other operations with the same context reuse the loaded permissions
+    result = schema.execute(query, context_value=context)
+    assert not result.errors
+    assert user.has_perm.call_count == 1
+    assert user.loaded == 1
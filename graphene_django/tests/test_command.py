@@ -1,10 +1,312 @@
+import datetime
+import json
+
+import pytest
 from django.core import management
+from django.core.management import CommandError
 from mock import patch
+from py.test import raises
 from six import StringIO
 
+import graphene
+
+from ..types import DjangoObjectType
+from .models import Article, Reporter
+
 
 @patch("graphene_django.management.commands.graphql_schema.Command.save_file")
 def test_generate_file_on_call_graphql_schema(savefile_mock, settings):
     out = StringIO()
     management.call_command("graphql_schema", schema="", stdout=out)
     assert "Successfully dumped GraphQL schema to schema.json" in out.getvalue()
+
+
+def test_generate_graphql_file_on_call_graphql_schema(tmpdir):
+    out_file = str(tmpdir.join("schema.graphql"))
+    management.call_command(
+        "graphql_schema",
+        schema="graphene_django.tests.schema_view.schema",
+        out=out_file,
+        stdout=StringIO(),
+    )
+    with open(out_file) as f:
+        sdl = f.read()
+    assert "type QueryRoot {" in sdl
+    assert "test(who: String): String" in sdl
+
+
+def test_dump_several_schemas_on_call_graphql_schema(tmpdir):
+    json_file = str(tmpdir.join("schema.json"))
+    sdl_file = str(tmpdir.join("schema.graphql"))
+    out = StringIO()
+    management.call_command(
+        "graphql_schema",
+        schema=[
+            "graphene_django.tests.schema_view.schema",
+            "graphene_django.tests.schema.schema",
+        ],
+        out=[json_file, sdl_file],
+        stdout=out,
+    )
+    assert "Successfully dumped GraphQL schema to %s" % json_file in out.getvalue()
+    assert "Successfully dumped GraphQL schema to %s" % sdl_file in out.getvalue()
+
+    with open(json_file) as f:
+        assert json.load(f)["data"]["__schema"]["queryType"] == {"name": "QueryRoot"}
+    with open(sdl_file) as f:
+        assert "type Query {" in f.read()
+
+
+def test_several_schemas_need_one_out_file_each():
+    with raises(CommandError):
+        management.call_command(
+            "graphql_schema",
+            schema=[
+                "graphene_django.tests.schema_view.schema",
+                "graphene_django.tests.schema.schema",
+            ],
+            out="schema.json",
+            stdout=StringIO(),
+        )
+
+
+def test_skip_unchanged_schema_on_call_graphql_schema(tmpdir):
+    out_file = str(tmpdir.join("schema.json"))
+    options = dict(
+        schema="graphene_django.tests.schema_view.schema",
+        out=out_file,
+        skip_unchanged=True,
+    )
+
+    out = StringIO()
+    management.call_command("graphql_schema", stdout=out, **options)
+    assert "Successfully dumped GraphQL schema to %s" % out_file in out.getvalue()
+    assert tmpdir.join("schema.json.sha256").check()
+
+    out = StringIO()
+    with patch(
+        "graphene_django.management.commands.graphql_schema.Command.save_file"
+    ) as savefile_mock:
+        management.call_command("graphql_schema", stdout=out, **options)
+    assert not savefile_mock.called
+    assert "GraphQL schema in %s is up to date" % out_file in out.getvalue()
+
+    # A different indent changes the output, so the schema is dumped again
+    out = StringIO()
+    management.call_command("graphql_schema", stdout=out, indent=2, **options)
+    assert "Successfully dumped GraphQL schema to %s" % out_file in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_benchmark_graphql_operations(tmpdir):
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            only_fields = ("first_name",)
+
+    class Query(graphene.ObjectType):
+        reporters = graphene.List(ReporterType)
+
+        def resolve_reporters(self, info):
+            return Reporter.objects.all()
+
+    schema = graphene.Schema(query=Query)
+    Reporter.objects.create(first_name="John", last_name="Doe", email="j@doe.com", a_choice=1)
+
+    operations_file = tmpdir.join("operations.jsonl")
+    operations_file.write(
+        "\n".join(
+            [
+                json.dumps({"query": "query AllReporters { reporters { firstName } }"}),
+                json.dumps({"query": "{ unknownField }", "name": "invalid"}),
+            ]
+        )
+    )
+
+    out = StringIO()
+    management.call_command(
+        "graphql_benchmark",
+        str(operations_file),
+        schema=schema,
+        iterations=5,
+        format="json",
+        stdout=out,
+    )
+    report = json.loads(out.getvalue())
+
+    valid, invalid = report["operations"]
+    assert valid["name"] == "AllReporters"
+    assert valid["iterations"] == 5
+    assert valid["errors"] is None
+    assert list(valid["timings"]) == ["parse", "validate", "execute", "serialize", "total"]
+    assert list(valid["timings"]["total"]) == ["p50", "p95", "p99", "mean"]
+    assert valid["sql"]["queries"] == 1
+    assert valid["sql"]["time"]["p99"] >= valid["sql"]["time"]["p50"]
+
+    assert invalid["name"] == "invalid"
+    assert invalid["sql"]["queries"] == 0
+    assert "unknownField" in invalid["errors"][0]["message"]
+
+    out = StringIO()
+    management.call_command(
+        "graphql_benchmark", str(operations_file), schema=schema, iterations=2, stdout=out
+    )
+    table = out.getvalue()
+    assert "AllReporters" in table
+    assert "1.0 SQL queries per run" in table
+
+
+@pytest.mark.django_db
+def test_explain_graphql_operations(tmpdir):
+    class ArticleType(DjangoObjectType):
+        class Meta:
+            model = Article
+            only_fields = ("headline", "reporter")
+
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            only_fields = ("first_name",)
+
+    class Query(graphene.ObjectType):
+        articles = graphene.List(ArticleType, headline=graphene.String())
+
+        def resolve_articles(self, info, headline):
+            return Article.objects.filter(headline=headline)
+
+    schema = graphene.Schema(query=Query)
+    reporter = Reporter.objects.create(
+        first_name="John", last_name="Doe", email="j@doe.com", a_choice=1
+    )
+    Article.objects.create(
+        headline="Hi",
+        pub_date=datetime.date.today(),
+        pub_date_time=datetime.datetime.now(),
+        reporter=reporter,
+        editor=reporter,
+    )
+
+    operations_file = tmpdir.join("operations.json")
+    operations_file.write(
+        json.dumps(
+            [
+                {
+                    "query": "query Articles($headline: String) "
+                    "{ articles(headline: $headline) { headline reporter { firstName } } }",
+                    "variables": {"headline": "Hi"},
+                }
+            ]
+        )
+    )
+
+    out = StringIO()
+    management.call_command(
+        "graphql_explain", str(operations_file), schema=schema, format="json", stdout=out
+    )
+    report = json.loads(out.getvalue())
+
+    (operation,) = report["operations"]
+    assert operation["name"] == "Articles"
+    assert operation["errors"] is None
+    articles_query, reporter_query = operation["queries"]
+
+    assert articles_query["path"] == "articles"
+    assert articles_query["sequential_scans"] == ["tests_article"]
+    assert articles_query["missing_indexes"]
+
+    # The reporter is fetched by primary key
+    assert reporter_query["path"] == "articles.0.reporter"
+    assert reporter_query["sequential_scans"] == []
+    assert reporter_query["plan"]
+
+    out = StringIO()
+    management.call_command(
+        "graphql_explain", str(operations_file), schema=schema, stdout=out
+    )
+    assert "! sequential scan on tests_article" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_replay_recorded_graphql_traffic(tmpdir):
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            only_fields = ("first_name",)
+
+    class Query(graphene.ObjectType):
+        reporters = graphene.List(ReporterType)
+
+        def resolve_reporters(self, info):
+            return Reporter.objects.all()
+
+    schema = graphene.Schema(query=Query)
+    Reporter.objects.create(first_name="John", last_name="Doe", email="j@doe.com", a_choice=1)
+
+    query = "query AllReporters { reporters { firstName } }"
+    traffic_file = tmpdir.join("traffic.jsonl")
+    traffic_file.write(
+        "\n".join(
+            json.dumps(entry)
+            for entry in [
+                {"query": query, "query_hash": "abc", "latency": 2.0},
+                {"query": query, "query_hash": "abc", "latency": 4.0},
+                {"query": "{ unknownField }", "query_hash": "def", "latency": 1.0},
+            ]
+        )
+    )
+
+    out = StringIO()
+    management.call_command(
+        "graphql_replay",
+        str(traffic_file),
+        schema=schema,
+        rollback=True,
+        format="json",
+        stdout=out,
+    )
+    report = json.loads(out.getvalue())
+
+    assert report["count"] == 3
+    assert report["errors"] == 1
+    all_reporters, invalid = report["operations"]
+    assert all_reporters["query_hash"] == "abc"
+    assert all_reporters["name"] == "AllReporters"
+    assert all_reporters["count"] == 2
+    assert all_reporters["errors"] == 0
+    assert all_reporters["recorded_latency"]["p50"] == 2.0
+    assert invalid["errors"] == 1
+
+    out = StringIO()
+    management.call_command(
+        "graphql_replay", str(traffic_file), schema=schema, limit=1, stdout=out
+    )
+    assert "1 operations in" in out.getvalue()
+    assert "AllReporters" in out.getvalue()
+
+
+def test_replay_recorded_graphql_traffic_concurrently(tmpdir):
+    traffic_file = tmpdir.join("traffic.jsonl")
+    traffic_file.write(
+        "\n".join(json.dumps({"query": "{ test }"}) for _ in range(10))
+    )
+
+    out = StringIO()
+    management.call_command(
+        "graphql_replay",
+        str(traffic_file),
+        schema="graphene_django.tests.schema_view.schema",
+        concurrency=3,
+        format="json",
+        stdout=out,
+    )
+    report = json.loads(out.getvalue())
+    assert report["count"] == 10
+    assert report["errors"] == 0
+    (operation,) = report["operations"]
+    assert operation["count"] == 10
+    assert operation["recorded_latency"] is None
+
+    with raises(CommandError):
+        management.call_command(
+            "graphql_replay", str(traffic_file), concurrency=0, stdout=StringIO()
+        )
@@ -11,6 +11,7 @@ from graphene.types.json import JSONString
 from ..compat import JSONField, ArrayField, HStoreField, RangeField, MissingType
 from ..converter import convert_django_field, convert_django_field_with_choices
 from ..registry import Registry
+from ..settings import graphene_settings
 from ..types import DjangoObjectType
 from .models import Article, Film, FilmDetails, Reporter
 
@@ -196,6 +197,140 @@ def test_field_with_choices_collision():
     convert_django_field_with_choices(field)
 
 
+def test_field_with_same_choices_shared_enum():
+    choices = (("draft", "Draft"), ("published", "Published"))
+
+    class FirstSharedChoicesModel(models.Model):
+        status = models.CharField(choices=choices)
+
+        class Meta:
+            app_label = "test"
+
+    class SecondSharedChoicesModel(models.Model):
+        state = models.CharField(choices=list(choices))
+
+        class Meta:
+            app_label = "test"
+
+    first = FirstSharedChoicesModel._meta.get_field("status")
+    second = SecondSharedChoicesModel._meta.get_field("state")
+
+    registry = Registry()
+    graphene_settings.DJANGO_CHOICE_FIELD_ENUM_SHARED = True
+    try:
+        first_type = convert_django_field_with_choices(first, registry)
+        second_type = convert_django_field_with_choices(second, registry)
+    finally:
+        del graphene_settings.DJANGO_CHOICE_FIELD_ENUM_SHARED
+
+    assert type(first_type) is type(second_type)
+    assert type(first_type)._meta.name == "FirstSharedChoicesModelStatus"
+
+    # Without the setting every field gets its own enum
+    registry = Registry()
+    first_type = convert_django_field_with_choices(first, registry)
+    second_type = convert_django_field_with_choices(second, registry)
+    assert type(first_type) is not type(second_type)
+
+
+def test_field_with_choices_without_shared_enums_skips_choices_key(monkeypatch):
+    from .. import converter
+
+    def get_choices_key(choices):
+        raise AssertionError("The choices key isn't needed")
+
+    monkeypatch.setattr(converter, "get_choices_key", get_choices_key)
+    field = Reporter._meta.get_field("a_choice")
+    converted = convert_django_field_with_choices(field, Registry())
+    assert type(converted)._meta.name == "ReporterAChoice"
+
+
+def test_field_with_choices_custom_enum_name():
+    class CustomNameChoicesModel(models.Model):
+        status = models.CharField(choices=(("on", "On"), ("off", "Off")))
+        other_status = models.CharField(choices=(("on", "On"), ("off", "Off")))
+        mode = models.CharField(choices=(("on", "On"), ("auto", "Auto")))
+
+        class Meta:
+            app_label = "test"
+
+    def enum_name(field):
+        if field.name in ("status", "other_status"):
+            return "Status"
+        if field.name == "mode":
+            return "Status"
+
+    get_field = CustomNameChoicesModel._meta.get_field
+    registry = Registry()
+    graphene_settings.DJANGO_CHOICE_FIELD_ENUM_CUSTOM_NAME = enum_name
+    try:
+        status = convert_django_field_with_choices(get_field("status"), registry)
+        other_status = convert_django_field_with_choices(
+            get_field("other_status"), registry
+        )
+        assert type(status) is type(other_status)
+        assert type(status)._meta.name == "Status"
+
+        with raises(AssertionError) as excinfo:
+            convert_django_field_with_choices(get_field("mode"), registry)
+        assert "is already defined with different choices" in str(excinfo.value)
+    finally:
+        del graphene_settings.DJANGO_CHOICE_FIELD_ENUM_CUSTOM_NAME
+
+
+def test_shared_choices_enum_in_schema():
+    choices = ((1, "Low"), (2, "High"))
+
+    class SchemaSharedChoicesTicket(models.Model):
+        priority = models.IntegerField(choices=choices)
+
+        class Meta:
+            app_label = "test"
+
+    class SchemaSharedChoicesBug(models.Model):
+        severity = models.IntegerField(choices=choices)
+
+        class Meta:
+            app_label = "test"
+
+    shared_registry = Registry()
+    graphene_settings.DJANGO_CHOICE_FIELD_ENUM_SHARED = True
+    try:
+
+        class TicketType(DjangoObjectType):
+            class Meta:
+                model = SchemaSharedChoicesTicket
+                registry = shared_registry
+
+        class BugType(DjangoObjectType):
+            class Meta:
+                model = SchemaSharedChoicesBug
+                registry = shared_registry
+
+    finally:
+        del graphene_settings.DJANGO_CHOICE_FIELD_ENUM_SHARED
+
+    class Query(graphene.ObjectType):
+        ticket = graphene.Field(TicketType)
+        bug = graphene.Field(BugType)
+
+        def resolve_ticket(self, info):
+            return SchemaSharedChoicesTicket(priority=2)
+
+        def resolve_bug(self, info):
+            return SchemaSharedChoicesBug(severity=1)
+
+    schema = graphene.Schema(query=Query)
+    enum_types = [
+        name for name in schema.get_type_map() if name.startswith("SchemaShared")
+    ]
+    assert enum_types == ["SchemaSharedChoicesTicketPriority"]
+
+    result = schema.execute("{ ticket { priority } bug { severity } }")
+    assert not result.errors
+    assert result.data == {"ticket": {"priority": "A_2"}, "bug": {"severity": "A_1"}}
+
+
 def test_should_float_convert_float():
     assert_conversion(models.FloatField, graphene.Float)
 
@@ -302,3 +437,33 @@ def test_should_postgres_range_convert_list():
     assert isinstance(field.type, graphene.NonNull)
     assert isinstance(field.type.of_type, graphene.List)
     assert field.type.of_type.of_type == graphene.Int
+
+
+@pytest.mark.skipif(JSONField is MissingType, reason="JSONField should exist")
+def test_should_postgres_keep_registered_converters(monkeypatch):
+    from graphene.types.generic import GenericScalar
+
+    from .. import converter
+
+    def convert_json_to_generic(field, registry=None):
+        return GenericScalar(description=field.help_text, required=not field.null)
+
+    # Registered before the postgres converters
+    monkeypatch.setattr(converter, "_postgres_converters_registered", False)
+    convert_django_field.register(JSONField, convert_json_to_generic)
+    try:
+        converter.register_postgres_converters()
+        assert_conversion(ArrayField, graphene.List, models.CharField(max_length=100))
+        assert_conversion(JSONField, GenericScalar)
+
+        # And after them
+        convert_django_field.register(
+            JSONField, converter.convert_posgres_field_to_string
+        )
+        convert_django_field.register(JSONField, convert_json_to_generic)
+        assert_conversion(ArrayField, graphene.List, models.CharField(max_length=100))
+        assert_conversion(JSONField, GenericScalar)
+    finally:
+        convert_django_field.register(
+            JSONField, converter.convert_posgres_field_to_string
+        )
@@ -0,0 +1,237 @@
+import threading
+
+import graphene
+from django import forms
+from django.core.cache import cache
+from django.test import TestCase
+
+from ..forms.mutation import DjangoModelFormBulkMutation, DjangoModelFormMutation
+from ..idempotency import IdempotentMutation, get_input_hash
+from ..rest_framework.models import MyFakeModel
+from ..rest_framework.mutation import SerializerMutation
+from ..rest_framework.tests.test_mutation import MyModelSerializer
+from ..types import DjangoObjectType
+from .models import Pet
+
+
+class PetType(DjangoObjectType):
+    class Meta:
+        model = Pet
+
+
+class PetForm(forms.ModelForm):
+    class Meta:
+        model = Pet
+        fields = ("name", "age")
+
+
+class PetMutation(DjangoModelFormMutation):
+    class Meta:
+        form_class = PetForm
+        idempotent = True
+
+
+class PetBulkMutation(DjangoModelFormBulkMutation):
+    class Meta:
+        form_class = PetForm
+        idempotent = True
+
+
+class MyModelBulkMutation(SerializerMutation):
+    class Meta:
+        serializer_class = MyModelSerializer
+        many = True
+        idempotent = True
+
+
+class LockMutation(IdempotentMutation):
+    """ A mutation whose payload can't be pickled """
+
+    class Meta:
+        idempotent = True
+
+    lock = graphene.String()
+    runs = []
+
+    @classmethod
+    def mutate_and_get_payload(cls, root, info, **input):
+        cls.runs.append(input)
+        return cls(lock=threading.Lock())
+
+
+class Query(graphene.ObjectType):
+    pet = graphene.Field(PetType)
+
+
+class Mutation(graphene.ObjectType):
+    pet_mutation = PetMutation.Field()
+    pet_bulk_mutation = PetBulkMutation.Field()
+    lock_mutation = LockMutation.Field()
+
+
+class SerializerMutations(graphene.ObjectType):
+    my_model_bulk_mutation = MyModelBulkMutation.Field()
+
+
+schema = graphene.Schema(query=Query, mutation=Mutation)
+# The form and serializer mutations have different ErrorType types
+serializer_schema = graphene.Schema(query=Query, mutation=SerializerMutations)
+
+MUTATION = """
+    mutation PetMutation($input: PetMutationInput!) {
+      petMutation(input: $input) {
+        pet { id name }
+        errors { field messages }
+        clientMutationId
+      }
+    }
+"""
+
+BULK_MUTATION = """
+    mutation PetBulkMutation($input: PetBulkMutationInput!) {
+      petBulkMutation(input: $input) {
+        pets { id name }
+        errors { field messages }
+      }
+    }
+"""
+
+SERIALIZER_BULK_MUTATION = """
+    mutation MyModelBulkMutation($input: MyModelBulkMutationInput!) {
+      myModelBulkMutation(input: $input) {
+        results { id coolName }
+        errors { field messages }
+      }
+    }
+"""
+
+LOCK_MUTATION = """
+    mutation LockMutation($input: LockMutationInput!) {
+      lockMutation(input: $input) {
+        lock
+      }
+    }
+"""
+
+
+class User(object):
+    is_authenticated = True
+
+    def __init__(self, pk):
+        self.pk = pk
+
+
+class Context(object):
+    def __init__(self, user=None):
+        self.user = user
+
+
+class IdempotentMutationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def execute(self, input, user=User(1), mutation=MUTATION, schema=schema):
+        return schema.execute(
+            mutation, variable_values={"input": input}, context_value=Context(user)
+        )
+
+    def test_idempotency_key_input(self):
+        self.assertIn("idempotency_key", PetMutation.Input._meta.fields)
+
+        class MySerializerMutation(SerializerMutation):
+            class Meta:
+                serializer_class = MyModelSerializer
+                idempotent = True
+
+        self.assertIn("idempotency_key", MySerializerMutation.Input._meta.fields)
+
+    def test_retries_return_the_stored_payload(self):
+        input = {"name": "Mia", "age": 3, "idempotencyKey": "abc"}
+        result = self.execute(dict(input, clientMutationId="1"))
+        self.assertFalse(result.errors)
+
+        with self.assertNumQueries(0):
+            retry = self.execute(dict(input, clientMutationId="2"))
+
+        self.assertFalse(retry.errors)
+        self.assertEqual(Pet.objects.count(), 1)
+        self.assertEqual(
+            retry.data["petMutation"]["pet"], result.data["petMutation"]["pet"]
+        )
+        self.assertEqual(retry.data["petMutation"]["clientMutationId"], "2")
+
+    def test_retries_with_another_input_fail(self):
+        self.execute({"name": "Mia", "age": 3, "idempotencyKey": "abc"})
+        result = self.execute({"name": "Rex", "age": 3, "idempotencyKey": "abc"})
+
+        self.assertEqual(
+            result.errors[0].message,
+            "The idempotencyKey abc was used with a different input.",
+        )
+        self.assertEqual(Pet.objects.count(), 1)
+
+    def test_keys_are_per_user(self):
+        input = {"name": "Mia", "age": 3, "idempotencyKey": "abc"}
+        self.execute(input, user=User(1))
+        self.execute(input, user=User(2))
+        # Anonymous users without a session don't keep their keys
+        self.execute(input, user=None)
+        self.execute(input, user=None)
+
+        self.assertEqual(Pet.objects.count(), 4)
+
+    def test_mutations_without_key_are_run(self):
+        self.execute({"name": "Mia", "age": 3})
+        self.execute({"name": "Mia", "age": 3})
+
+        self.assertEqual(Pet.objects.count(), 2)
+
+    def test_bulk_mutations_with_items(self):
+        input = {
+            "items": [{"name": "Mia", "age": 3}, {"name": "Rex", "age": 5}],
+            "idempotencyKey": "abc",
+        }
+        result = self.execute(input, mutation=BULK_MUTATION)
+        self.assertFalse(result.errors)
+        retry = self.execute(input, mutation=BULK_MUTATION)
+        self.assertFalse(retry.errors)
+
+        self.assertEqual(Pet.objects.count(), 2)
+        self.assertEqual(retry.data, result.data)
+
+    def test_input_hash_of_items(self):
+        items = [{"cool_name": "Narf"}]
+        input = MyModelBulkMutation.Input._meta.container({"items": items})
+        self.assertEqual(get_input_hash(input), get_input_hash({"items": items}))
+
+    def test_payloads_of_dynamic_types(self):
+        # The results of the many mode are of a type created by the mutation
+        input = {"items": [{"coolName": "Narf"}], "idempotencyKey": "abc"}
+        result = self.execute(
+            input, mutation=SERIALIZER_BULK_MUTATION, schema=serializer_schema
+        )
+        self.assertFalse(result.errors)
+
+        with self.assertNumQueries(0):
+            retry = self.execute(
+                input, mutation=SERIALIZER_BULK_MUTATION, schema=serializer_schema
+            )
+        self.assertFalse(retry.errors)
+        self.assertEqual(retry.data, result.data)
+        self.assertEqual(MyFakeModel.objects.count(), 1)
+
+    def test_payloads_that_cant_be_stored(self):
+        del LockMutation.runs[:]
+        input = {"idempotencyKey": "abc"}
+        result = self.execute(input, mutation=LOCK_MUTATION)
+        self.assertFalse(result.errors)
+        self.assertTrue(result.data["lockMutation"]["lock"])
+
+        # The mutation isn't run again, nor reported as in progress
+        retry = self.execute(input, mutation=LOCK_MUTATION)
+        self.assertEqual(
+            retry.errors[0].message,
+            "The mutation with the idempotencyKey abc was already run, "
+            "but its payload wasn't kept.",
+        )
+        self.assertEqual(len(LockMutation.runs), 1)
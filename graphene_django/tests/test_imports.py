@@ -0,0 +1,98 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT_PATH = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+# Integrations that must only be imported when they are used.
+LAZY_MODULES = (
+    "django_filters",
+    "rest_framework",
+    "django.contrib.postgres",
+    "graphene_django.filter",
+    "graphene_django.forms",
+    "graphene_django.rest_framework",
+    "graphene_django.debug",
+    "graphene_django.jobs",
+    "graphene_django.compat",
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="-X importtime requires Python 3.7+"
+)
+
+
+def import_time_report(statement):
+    """
+    Run `statement` in a fresh interpreter with `-X importtime` and
+    return a dict of {module: cumulative import time in microseconds}.
+    """
+    env = dict(os.environ)
+    env["DJANGO_SETTINGS_MODULE"] = "django_test_settings"
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [ROOT_PATH, env.get("PYTHONPATH")])
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT_PATH,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    _, stderr = process.communicate()
+    assert process.returncode == 0, stderr
+
+    report = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        try:
+            report[module.strip()] = int(cumulative)
+        except ValueError:
+            # Header line
+            continue
+    return report
+
+
+def imported_lazy_modules(report):
+    return sorted(
+        module
+        for module in report
+        for lazy in LAZY_MODULES
+        if module == lazy or module.startswith(lazy + ".")
+    )
+
+
+def test_import_does_not_load_optional_integrations():
+    report = import_time_report("import graphene_django")
+    assert "graphene_django" in report
+    assert imported_lazy_modules(report) == []
+
+
+def test_building_a_schema_does_not_load_optional_integrations():
+    report = import_time_report(
+        "import django; django.setup(); "
+        "import graphene; "
+        "from graphene_django.tests.models import Reporter; "
+        "from graphene_django import DjangoObjectType; "
+        "ReporterType = type('ReporterType', (DjangoObjectType,), "
+        "{'Meta': type('Meta', (), {'model': Reporter})}); "
+        "graphene.Schema(query=type('Query', (graphene.ObjectType,), "
+        "{'reporter': graphene.Field(ReporterType)}))"
+    )
+    # django.setup() imports the installed apps, so only look at what
+    # graphene_django itself pulls in.
+    lazy = [
+        module
+        for module in imported_lazy_modules(report)
+        if not module.startswith(
+            ("rest_framework", "graphene_django.rest_framework", "graphene_django.jobs")
+        )
+    ]
+    assert lazy == []
@@ -0,0 +1,36 @@
+from graphql import parse
+from mock import Mock
+
+from ..optimization import get_related_lookups
+from .models import Article, Reporter
+
+
+def get_info(query):
+    document = parse(query)
+    (operation,) = document.definitions
+    return Mock(field_asts=operation.selection_set.selections, fragments={})
+
+
+def test_get_related_lookups_selects_single_relations():
+    info = get_info("{ article { headline reporter { firstName } } }")
+    assert get_related_lookups(Article, info, info.field_asts) == (["reporter"], [])
+
+
+def test_get_related_lookups_prefetches_many_relations():
+    info = get_info(
+        """{
+          reporter {
+            articles { headline reporter { firstName } }
+            films { details { location } }
+          }
+        }"""
+    )
+    assert get_related_lookups(Reporter, info, info.field_asts) == (
+        [],
+        ["articles__reporter", "films__details"],
+    )
+
+
+def test_get_related_lookups_skips_connections():
+    info = get_info("{ reporter { articles { edges { node { headline } } } } }")
+    assert get_related_lookups(Reporter, info, info.field_asts) == ([], [])
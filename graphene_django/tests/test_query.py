@@ -1007,3 +1007,546 @@ def test_proxy_model_fails():
 
     result = schema.execute(query)
     assert result.errors
+
+
+@pytest.mark.skipif(
+    not DJANGO_FILTER_INSTALLED, reason="django-filter should be installed"
+)
+def test_should_query_connection_aggregates():
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from ..filter import DjangoFilterConnectionField
+
+    class ArticleType(DjangoObjectType):
+        class Meta:
+            model = Article
+            interfaces = (Node,)
+            filter_fields = ("lang",)
+            aggregate_fields = {"importance": ["sum", "avg", "max"], "pub_date": None}
+
+    class Query(graphene.ObjectType):
+        articles = DjangoConnectionField(ArticleType)
+        filtered_articles = DjangoFilterConnectionField(ArticleType)
+
+    reporter = Reporter.objects.create(
+        first_name="John", last_name="Doe", email="johndoe@example.com", a_choice=1
+    )
+    for day, lang, importance in [(1, "es", 1), (2, "es", 2), (3, "en", 2)]:
+        Article.objects.create(
+            headline="Article {}".format(day),
+            pub_date=datetime.date(2019, 1, day),
+            pub_date_time=datetime.datetime.now(),
+            reporter=reporter,
+            editor=reporter,
+            lang=lang,
+            importance=importance,
+        )
+
+    schema = graphene.Schema(query=Query)
+    query = """
+        query {
+          filteredArticles(lang: "es", first: 1) {
+            edges {
+              node {
+                headline
+              }
+            }
+            aggregates {
+              count
+              importanceSum
+              ...Dates
+            }
+          }
+          articles {
+            aggregates {
+              importanceAvg
+              importanceMax
+            }
+          }
+        }
+
+        fragment Dates on ArticleTypeAggregates {
+          pubDateMin
+          pubDateMax
+        }
+    """
+    with CaptureQueriesContext(connection) as captured:
+        result = schema.execute(query)
+    assert not result.errors
+    assert result.data == {
+        "filteredArticles": {
+            "edges": [{"node": {"headline": "Article 1"}}],
+            "aggregates": {
+                "count": 2,
+                "importanceSum": 3,
+                "pubDateMin": "2019-01-01",
+                "pubDateMax": "2019-01-02",
+            },
+        },
+        "articles": {"aggregates": {"importanceAvg": 5 / 3.0, "importanceMax": 2}},
+    }
+    # A count, a page and the aggregates for each connection (no page
+    # for articles, as no edges are selected)
+    aggregate_queries = [
+        query["sql"] for query in captured.captured_queries if "MAX" in query["sql"]
+    ]
+    assert len(aggregate_queries) == 2
+    assert "LIMIT" not in aggregate_queries[0]
+
+
+def test_should_not_aggregate_text_fields():
+    with raises(AssertionError):
+
+        class ArticleType(DjangoObjectType):
+            class Meta:
+                model = Article
+                interfaces = (Node,)
+                aggregate_fields = ("headline",)
+
+
+def get_where(queryset):
+    sql = str(queryset.query)
+    return sql[sql.index(" WHERE ") :] if " WHERE " in sql else ""
+
+
+def test_merge_querysets_applies_the_manager_conditions_once():
+    queryset = Reporter.doe_objects.filter(first_name="John")
+    assert DjangoConnectionField.merge_querysets(queryset, queryset) is queryset
+
+    queryset = Reporter.objects.filter(first_name="John")
+    merged = DjangoConnectionField.merge_querysets(
+        Reporter.doe_objects.get_queryset(), queryset
+    )
+    where = get_where(merged)
+    assert where.count('"last_name" = Doe') == 1
+    assert where.count('"first_name" = John') == 1
+
+    sliced = DjangoConnectionField.merge_querysets(
+        Reporter.doe_objects.get_queryset(), queryset.order_by("pk")[:2]
+    )
+    assert sliced.query.high_mark == 2
+    assert get_where(sliced).count('"last_name" = Doe') == 1
+
+
+def test_merge_querysets_with_relations_to_the_same_model():
+    john = Reporter.objects.create(
+        first_name="John", last_name="Doe", email="john@doe.com", a_choice=1
+    )
+    jane = Reporter.objects.create(
+        first_name="Jane", last_name="Doe", email="jane@doe.com", a_choice=1
+    )
+    article = Article.objects.create(
+        headline="Hi",
+        pub_date=datetime.date.today(),
+        pub_date_time=datetime.datetime.now(),
+        reporter=jane,
+        editor=john,
+    )
+    # Both conditions compile to the same SQL on the reporter table
+    default_queryset = Article.objects.filter(reporter__email="john@doe.com")
+    queryset = Article.objects.filter(editor__email="john@doe.com")
+    assert list(queryset) == [article]
+
+    merged = DjangoConnectionField.merge_querysets(default_queryset, queryset)
+    assert list(merged) == []
+    assert list(merged) == list(queryset & default_queryset)
+
+
+def test_merge_querysets_is_distinct_only_with_multiplying_joins():
+    merged = DjangoConnectionField.merge_querysets(
+        Reporter.objects.all(), Reporter.objects.filter(first_name="John").distinct()
+    )
+    assert not merged.query.distinct
+
+    # The forward foreign key joins one row for each article
+    merged = DjangoConnectionField.merge_querysets(
+        Article.objects.all(),
+        Article.objects.filter(reporter__first_name="John").distinct(),
+    )
+    assert not merged.query.distinct
+    assert "DISTINCT" not in str(merged.query)
+
+    # The reverse foreign key and many to many relations can repeat rows
+    merged = DjangoConnectionField.merge_querysets(
+        Reporter.objects.all().distinct(),
+        Reporter.objects.filter(articles__headline="Hi"),
+    )
+    assert merged.query.distinct
+    merged = DjangoConnectionField.merge_querysets(
+        Reporter.objects.all(), Reporter.objects.filter(films__genre="do").distinct()
+    )
+    assert merged.query.distinct
+
+    # Distinct querysets with a join are still distinct when merged
+    Reporter.objects.create(first_name="John", last_name="Doe", a_choice=1)
+    reporter = Reporter.objects.get()
+    for _ in range(2):
+        Article.objects.create(
+            headline="Hi",
+            pub_date=datetime.date.today(),
+            pub_date_time=datetime.datetime.now(),
+            reporter=reporter,
+            editor=reporter,
+        )
+    merged = DjangoConnectionField.merge_querysets(
+        Reporter.doe_objects.get_queryset(),
+        Reporter.objects.filter(articles__headline="Hi").distinct(),
+    )
+    assert list(merged) == [reporter]
+
+
+def test_should_query_count_fields(django_assert_num_queries):
+    class ArticleType(DjangoObjectType):
+        class Meta:
+            model = Article
+            interfaces = (Node,)
+
+    class FilmType(DjangoObjectType):
+        class Meta:
+            model = Film
+            interfaces = (Node,)
+
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+            count_fields = ("articles", "films", "pets")
+
+    class Query(graphene.ObjectType):
+        node = Node.Field()
+        all_reporters = DjangoConnectionField(ReporterType)
+
+        def resolve_all_reporters(self, info, **args):
+            # Filtering by a relation doesn't change its count
+            return Reporter.objects.filter(articles__headline="a").order_by("pk")
+
+    r1 = Reporter.objects.create(first_name="r1", last_name="r1", a_choice=1)
+    r2 = Reporter.objects.create(first_name="r2", last_name="r2", a_choice=1)
+    r3 = Reporter.objects.create(first_name="r3", last_name="r3", a_choice=1)
+    for reporter, headline in [(r1, "a"), (r1, "b"), (r1, "c"), (r2, "a")]:
+        Article.objects.create(
+            headline=headline,
+            pub_date=datetime.date.today(),
+            pub_date_time=datetime.datetime.now(),
+            reporter=reporter,
+            editor=reporter,
+        )
+    Film.objects.create().reporters.add(r1, r2)
+    Film.objects.create().reporters.add(r1)
+    r1.pets.add(r2, r3)
+
+    schema = graphene.Schema(query=Query)
+    query = """
+        query {
+            allReporters {
+                edges {
+                    node {
+                        firstName
+                        articlesCount
+                        ... on ReporterType { filmsCount petsCount }
+                    }
+                }
+            }
+        }
+    """
+    # The count of the connection and the page of reporters with the counts
+    with django_assert_num_queries(2):
+        result = schema.execute(query)
+    assert not result.errors
+    assert result.data == {
+        "allReporters": {
+            "edges": [
+                {
+                    "node": {
+                        "firstName": "r1",
+                        "articlesCount": 3,
+                        "filmsCount": 2,
+                        "petsCount": 2,
+                    }
+                },
+                {
+                    "node": {
+                        "firstName": "r2",
+                        "articlesCount": 1,
+                        "filmsCount": 1,
+                        "petsCount": 1,
+                    }
+                },
+            ]
+        }
+    }
+
+    # Without the annotation the relation is counted
+    query = """
+        query {
+            node(id: "%s") { ... on ReporterType { articlesCount } }
+        }
+    """ % Node.to_global_id(
+        "ReporterType", r1.pk
+    )
+    result = schema.execute(query)
+    assert not result.errors
+    assert result.data == {"node": {"articlesCount": 3}}
+
+
+def test_count_fields_are_only_annotated_when_selected():
+    from ..annotations import annotate_queryset
+
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            count_fields = ("articles",)
+
+    queryset = Reporter.objects.all()
+    assert annotate_queryset(queryset, ReporterType, {"firstName": []}) is queryset
+
+    sql = str(annotate_queryset(queryset, ReporterType, {"articlesCount": []}).query)
+    # A correlated subquery, without joining the articles
+    assert "JOIN" not in sql
+    assert "COALESCE((SELECT COUNT(*)" in sql
+
+    with raises(AssertionError) as excinfo:
+
+        class ArticleCountType(DjangoObjectType):
+            class Meta:
+                model = Article
+                count_fields = ("reporter",)
+
+    assert "Can only count" in str(excinfo.value)
+
+
+def test_should_query_annotated_fields(django_assert_num_queries):
+    from django.db.models import Case, Max, OuterRef, Subquery, When
+    from django.db.models.functions import Concat
+
+    from ..fields import AnnotatedField, DjangoListField
+
+    class ArticleType(DjangoObjectType):
+        class Meta:
+            model = Article
+
+    class ReporterType(DjangoObjectType):
+        full_name = AnnotatedField(
+            graphene.String,
+            Concat("first_name", models.Value(" "), "last_name"),
+        )
+        latest_headline = AnnotatedField(
+            graphene.String,
+            Subquery(
+                Article.objects.filter(reporter=OuterRef("pk"))
+                .order_by("-pub_date")
+                .values("headline")[:1]
+            ),
+        )
+        latest_article = AnnotatedField(graphene.Date, Max("articles__pub_date"))
+        is_regular = AnnotatedField(
+            graphene.Boolean,
+            Case(
+                When(reporter_type=1, then=True),
+                default=False,
+                output_field=models.BooleanField(),
+            ),
+        )
+
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+
+    class Query(graphene.ObjectType):
+        node = Node.Field()
+        all_reporters = DjangoConnectionField(ReporterType)
+        reporters = DjangoListField(ReporterType)
+
+        def resolve_reporters(self, info, **args):
+            return Reporter.objects.order_by("pk")
+
+    r1 = Reporter.objects.create(
+        first_name="John", last_name="Doe", a_choice=1, reporter_type=1
+    )
+    Reporter.objects.create(first_name="Jane", last_name="Roe", a_choice=1)
+    for day, headline in [(1, "first"), (2, "second")]:
+        Article.objects.create(
+            headline=headline,
+            pub_date=datetime.date(2019, 1, day),
+            pub_date_time=datetime.datetime.now(),
+            reporter=r1,
+            editor=r1,
+        )
+
+    expected = [
+        {
+            "fullName": "John Doe",
+            "latestHeadline": "second",
+            "latestArticle": "2019-01-02",
+            "isRegular": True,
+        },
+        {
+            "fullName": "Jane Roe",
+            "latestHeadline": None,
+            "latestArticle": None,
+            "isRegular": False,
+        },
+    ]
+    schema = graphene.Schema(query=Query)
+    fields = "fullName latestHeadline latestArticle isRegular"
+    with django_assert_num_queries(2):
+        result = schema.execute(
+            "query { allReporters { edges { node { %s } } } }" % fields
+        )
+    assert not result.errors
+    assert [
+        edge["node"] for edge in result.data["allReporters"]["edges"]
+    ] == expected
+
+    with django_assert_num_queries(1):
+        result = schema.execute("query { reporters { %s } }" % fields)
+    assert not result.errors
+    assert result.data["reporters"] == expected
+
+    # Objects loaded without the annotation compute it with a query
+    result = schema.execute(
+        'query { node(id: "%s") { ... on ReporterType { fullName } } }'
+        % Node.to_global_id("ReporterType", r1.pk)
+    )
+    assert not result.errors
+    assert result.data == {"node": {"fullName": "John Doe"}}
+
+
+def test_should_only_query_owned_objects():
+    from ..fields import DjangoListField
+
+    class Context(object):
+        def __init__(self, user):
+            self.user = user
+
+    class ArticleType(DjangoObjectType):
+        class Meta:
+            model = Article
+            interfaces = (Node,)
+            owner_fields = ("reporter",)
+
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+            interfaces = (Node,)
+
+    class Query(graphene.ObjectType):
+        node = Node.Field()
+        all_articles = DjangoConnectionField(ArticleType)
+        all_reporters = DjangoConnectionField(ReporterType)
+        articles = DjangoListField(ArticleType)
+
+        def resolve_articles(self, info, **args):
+            return Article.objects.order_by("-headline")[:2]
+
+    john = Reporter.objects.create(first_name="John", last_name="Doe", a_choice=1)
+    jane = Reporter.objects.create(first_name="Jane", last_name="Roe", a_choice=1)
+    for reporter, headline in [(john, "a"), (jane, "b"), (john, "c"), (jane, "d")]:
+        Article.objects.create(
+            headline=headline,
+            pub_date=datetime.date.today(),
+            pub_date_time=datetime.datetime.now(),
+            reporter=reporter,
+            editor=reporter,
+        )
+    john.is_authenticated = True
+
+    query = """
+        query Articles($id: ID!) {
+          allArticles { edges { node { headline } } }
+          articles { headline }
+          node(id: $id) { ... on ArticleType { headline } }
+          allReporters {
+            edges { node { firstName articles { edges { node { headline } } } } }
+          }
+        }
+    """
+    jane_article = Article.objects.get(headline="d")
+    variables = {"id": Node.to_global_id("ArticleType", jane_article.pk)}
+    schema = graphene.Schema(query=Query)
+    result = schema.execute(
+        query, variable_values=variables, context_value=Context(user=john)
+    )
+    assert not result.errors
+    assert result.data["allArticles"] == {
+        "edges": [{"node": {"headline": "a"}}, {"node": {"headline": "c"}}]
+    }
+    # The slice of the resolver is taken from the owned objects
+    assert result.data["articles"] == [{"headline": "c"}, {"headline": "a"}]
+    assert result.data["node"] is None
+    assert [
+        [edge["node"]["headline"] for edge in reporter["node"]["articles"]["edges"]]
+        for reporter in result.data["allReporters"]["edges"]
+    ] == [["a", "c"], []]
+
+    # Anonymous users don't own anything
+    result = schema.execute(
+        query, variable_values=variables, context_value=Context(user=None)
+    )
+    assert not result.errors
+    assert result.data["allArticles"] == {"edges": []}
+    assert result.data["articles"] == []
+
+
+@pytest.mark.skipif(
+    not DJANGO_FILTER_INSTALLED, reason="django-filter should be installed"
+)
+def test_should_only_query_owned_objects_filtered_by_another_relation():
+    from ..filter import DjangoFilterConnectionField
+
+    class EmailUser(str):
+        # A user that is compared with the email of the reporters
+        is_authenticated = True
+
+    class Context(object):
+        def __init__(self, user):
+            self.user = user
+
+    class ArticleType(DjangoObjectType):
+        class Meta:
+            model = Article
+            interfaces = (Node,)
+            filter_fields = ("lang",)
+            owner_fields = ("reporter__email",)
+
+    def resolve_edited_articles(self, info, **args):
+        # The same condition as the owner one, on another relation to the
+        # reporters
+        return Article.objects.filter(editor__email=info.context.user)
+
+    class Query(graphene.ObjectType):
+        edited_articles = DjangoConnectionField(
+            ArticleType, resolver=resolve_edited_articles
+        )
+        filtered_edited_articles = DjangoFilterConnectionField(
+            ArticleType, resolver=resolve_edited_articles
+        )
+
+    john = Reporter.objects.create(
+        first_name="John", last_name="Doe", email="john@doe.com", a_choice=1
+    )
+    jane = Reporter.objects.create(
+        first_name="Jane", last_name="Roe", email="jane@roe.com", a_choice=1
+    )
+    for reporter, headline in [(john, "a"), (jane, "b")]:
+        Article.objects.create(
+            headline=headline,
+            pub_date=datetime.date.today(),
+            pub_date_time=datetime.datetime.now(),
+            reporter=reporter,
+            editor=john,
+        )
+
+    query = """
+        query {
+          editedArticles { edges { node { headline } } }
+          filteredEditedArticles(lang: "es") { edges { node { headline } } }
+        }
+    """
+    schema = graphene.Schema(query=Query)
+    result = schema.execute(query, context_value=Context(EmailUser("john@doe.com")))
+    assert not result.errors
+    expected = {"edges": [{"node": {"headline": "a"}}]}
+    assert result.data["editedArticles"] == expected
+    assert result.data["filteredEditedArticles"] == expected
@@ -0,0 +1,117 @@
+import json
+import os
+
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import Client
+from py.test import raises
+
+from ..settings import graphene_settings
+from ..traffic import GraphQLTrafficRecorderMiddleware, get_query_hash, get_recorder
+
+MIDDLEWARE = ["graphene_django.traffic.GraphQLTrafficRecorderMiddleware"]
+
+
+@pytest.fixture
+def traffic_file(tmpdir, settings):
+    filename = str(tmpdir.join("traffic.jsonl"))
+    settings.MIDDLEWARE = MIDDLEWARE
+    graphene_settings.TRAFFIC_RECORDING_FILE = filename
+    graphene_settings.TRAFFIC_RECORDING_SAMPLE_RATE = 1.0
+    yield filename
+    get_recorder(filename, 0, 0).close()
+    del graphene_settings.TRAFFIC_RECORDING_FILE
+    del graphene_settings.TRAFFIC_RECORDING_SAMPLE_RATE
+
+
+def read_entries(filename):
+    with open(filename) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_recorder_middleware_is_not_used_without_file():
+    with raises(MiddlewareNotUsed):
+        GraphQLTrafficRecorderMiddleware()
+
+
+def test_records_graphql_operations(traffic_file):
+    client = Client()
+    query = "query helloWho($who: String) { test(who: $who) }"
+    response = client.post(
+        "/graphql",
+        json.dumps({"query": query, "variables": {"who": "Dolly"}}),
+        content_type="application/json",
+    )
+    assert response.status_code == 200
+    client.get("/graphql", {"query": "{ test }"})
+
+    first, second = read_entries(traffic_file)
+    assert first["query"] == query
+    assert first["query_hash"] == get_query_hash(query)
+    assert first["variables"] == {"who": "Dolly"}
+    assert first["operationName"] is None
+    assert first["status"] == 200
+    assert first["sql_count"] == 0
+    assert first["batch_size"] == 1
+    assert first["latency"] >= 0
+    assert second["query"] == "{ test }"
+
+
+def test_records_batched_operations(traffic_file):
+    Client().post(
+        "/graphql/batch",
+        json.dumps([{"query": "{ test }"}, {"query": "{ thrower }"}]),
+        content_type="application/json",
+    )
+
+    entries = read_entries(traffic_file)
+    assert [entry["query"] for entry in entries] == ["{ test }", "{ thrower }"]
+    assert [entry["batch_size"] for entry in entries] == [2, 2]
+
+
+def test_does_not_record_unsampled_operations(traffic_file):
+    graphene_settings.TRAFFIC_RECORDING_SAMPLE_RATE = 0
+    Client().get("/graphql", {"query": "{ test }"})
+
+    # The file is only created when something is recorded
+    assert not os.path.exists(traffic_file)
+
+
+@pytest.mark.django_db
+def test_records_sql_along_with_django_debug(traffic_file):
+    import graphene
+    from django.test import RequestFactory
+
+    from ..debug import DjangoDebug, DjangoDebugMiddleware
+    from ..types import DjangoObjectType
+    from ..views import GraphQLView
+    from .models import Reporter
+
+    class ReporterType(DjangoObjectType):
+        class Meta:
+            model = Reporter
+
+    class Query(graphene.ObjectType):
+        reporters = graphene.List(ReporterType)
+        debug = graphene.Field(DjangoDebug, name="__debug")
+
+        def resolve_reporters(self, info):
+            return Reporter.objects.all()
+
+    Reporter.objects.create(first_name="John", last_name="Doe", a_choice=1)
+    view = GraphQLView.as_view(
+        schema=graphene.Schema(query=Query), middleware=[DjangoDebugMiddleware()]
+    )
+    query = "{ reporters { firstName } __debug { sql { rawSql } } }"
+    request = RequestFactory().get("/graphql", {"query": query})
+    middleware = GraphQLTrafficRecorderMiddleware()
+
+    middleware.process_view(request, view, (), {})
+    response = view(request)
+    middleware.process_response(request, response)
+
+    data = json.loads(response.content.decode("utf-8"))["data"]
+    assert data["reporters"] == [{"firstName": "John"}]
+    assert len(data["__debug"]["sql"]) == 1
+    (entry,) = read_entries(traffic_file)
+    assert entry["sql_count"] == 1
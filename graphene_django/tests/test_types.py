@@ -1,3 +1,4 @@
+from django.db.models import QuerySet
 from mock import patch
 
 from graphene import Interface, ObjectType, Schema, Connection, String
@@ -51,7 +52,7 @@ def test_django_interface():
     assert issubclass(Node, Node)
 
 
-@patch("graphene_django.tests.models.Article.objects.get", return_value=Article(id=1))
+@patch("django.db.models.query.QuerySet.get", return_value=Article(id=1))
 def test_django_get_node(get):
     article = Article.get_node(None, 1)
     get.assert_called_with(pk=1)
@@ -224,3 +225,25 @@ def test_django_objecttype_exclude_fields():
 
     fields = list(Reporter._meta.fields.keys())
     assert "email" not in fields
+
+
+@with_local_registry
+@patch("django.db.models.query.QuerySet.get", return_value=ReporterModel(id=1))
+def test_django_get_node_restricts_default_manager_queryset(get):
+    querysets = []
+
+    class Reporter(DjangoObjectType):
+        class Meta:
+            model = ReporterModel
+            interfaces = (Node,)
+
+        @classmethod
+        def get_queryset(cls, queryset, info):
+            querysets.append(queryset)
+            return queryset
+
+    assert Reporter.get_node(None, 1).id == 1
+    (queryset,) = querysets
+    assert isinstance(queryset, QuerySet)
+    assert queryset.model is ReporterModel
+    get.assert_called_with(pk=1)
@@ -558,3 +558,75 @@ def test_passes_request_into_context_request(client):
 
     assert response.status_code == 200
     assert response_json(response) == {"data": {"request": "testing"}}
+
+
+@pytest.mark.urls("graphene_django.tests.urls_introspection")
+def test_caches_introspection_query_response(client):
+    from graphql.utils.introspection_query import introspection_query
+    from mock import patch
+
+    from ..introspection import get_introspection_cache
+    from ..views import GraphQLView
+    from .schema_view import schema
+
+    get_introspection_cache(schema).clear()
+
+    response = client.post(
+        url_string(), j(query=introspection_query), "application/json"
+    )
+    assert response.status_code == 200
+    assert response_json(response)["data"]["__schema"]["queryType"] == {
+        "name": "QueryRoot"
+    }
+    assert len(get_introspection_cache(schema)) == 1
+
+    with patch.object(GraphQLView, "execute_graphql_request") as execute_mock:
+        cached_response = client.post(
+            url_string(), j(query=introspection_query), "application/json"
+        )
+    assert not execute_mock.called
+    assert cached_response.status_code == 200
+    assert cached_response.content == response.content
+
+
+@pytest.mark.urls("graphene_django.tests.urls_introspection")
+def test_does_not_cache_queries_mixing_introspection_and_data(client):
+    from ..introspection import get_introspection_cache
+    from .schema_view import schema
+
+    get_introspection_cache(schema).clear()
+
+    response = client.get(
+        url_string(query='{ __type(name: "QueryRoot") { name } request }', q="a")
+    )
+    assert response_json(response) == {
+        "data": {"__type": {"name": "QueryRoot"}, "request": "a"}
+    }
+    assert len(get_introspection_cache(schema)) == 0
+
+
+@pytest.mark.urls("graphene_django.tests.urls_introspection")
+def test_introspection_can_be_disabled(client):
+    response = client.get(
+        url_string("/graphql/no-introspection", query="{ __schema { types { name } } }")
+    )
+    assert response.status_code == 400
+    assert response_json(response) == {
+        "errors": [{"message": "GraphQL introspection is not allowed."}]
+    }
+
+    # Introspection hidden inside a fragment is rejected too
+    response = client.get(
+        url_string(
+            "/graphql/no-introspection",
+            query="{ test ...F } fragment F on QueryRoot { __type(name: \"QueryRoot\") { name } }",
+        )
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        url_string("/graphql/no-introspection", query="{ test __typename }")
+    )
+    assert response_json(response) == {
+        "data": {"test": "Hello World", "__typename": "QueryRoot"}
+    }
@@ -0,0 +1,190 @@
+"""
+Sampling of the GraphQL operations served by GraphQLView into a rotating
+JSON lines file, that can be replayed later with the graphql_replay
+management command.
+
+Add the middleware to your Django MIDDLEWARE and set the file in the
+GRAPHENE settings:
+
+GRAPHENE = {
+    'TRAFFIC_RECORDING_FILE': '/var/log/app/graphql-traffic.jsonl',
+    'TRAFFIC_RECORDING_SAMPLE_RATE': 0.01,
+}
+"""
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from contextlib import ExitStack
+from logging.handlers import RotatingFileHandler
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from .settings import graphene_settings
+from .views import GraphQLView
+
+try:
+    from django.utils.deprecation import MiddlewareMixin
+except ImportError:  # Django < 1.10
+    MiddlewareMixin = object
+
+
+def get_query_hash(query):
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class TrafficRecorder(object):
+    """
+    Writes the recorded operations as JSON lines into a file, that is
+    rotated when it reaches max_bytes (keeping backup_count old files).
+    """
+
+    def __init__(self, filename, max_bytes=0, backup_count=0):
+        self.handler = RotatingFileHandler(
+            filename, maxBytes=max_bytes, backupCount=backup_count, delay=True
+        )
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def record(self, entry):
+        # The handler takes care of the locking and the rotation
+        record = logging.makeLogRecord(
+            {"msg": json.dumps(entry, sort_keys=True), "levelno": logging.INFO}
+        )
+        self.handler.handle(record)
+
+    def close(self):
+        self.handler.close()
+
+
+_recorders = {}
+_recorders_lock = threading.Lock()
+
+
+def get_recorder(filename, max_bytes, backup_count):
+    """Return the recorder for the given file, shared in the process."""
+    with _recorders_lock:
+        if filename not in _recorders:
+            _recorders[filename] = TrafficRecorder(filename, max_bytes, backup_count)
+        return _recorders[filename]
+
+
+def get_recorded_operations(request):
+    """
+    Return the (query, variables, operation name) of the operations
+    sent in the request to a GraphQLView.
+    """
+    content_type = GraphQLView.get_content_type(request)
+    data = {}
+    if request.method.lower() == "post":
+        if content_type == "application/graphql":
+            data = {"query": request.body.decode("utf-8")}
+        elif content_type == "application/json":
+            try:
+                data = json.loads(request.body.decode("utf-8"))
+            except (TypeError, ValueError):
+                return []
+        elif content_type in [
+            "application/x-www-form-urlencoded",
+            "multipart/form-data",
+        ]:
+            data = request.POST
+
+    entries = data if isinstance(data, list) else [data]
+    operations = []
+    for entry in entries:
+        if not hasattr(entry, "get"):
+            continue
+        try:
+            query, variables, operation_name, _ = GraphQLView.get_graphql_params(
+                request, entry
+            )
+        except Exception:
+            continue
+        if query:
+            operations.append((query, variables, operation_name))
+    return operations
+
+
+class QueryCounter(object):
+    """ Execute wrapper that counts the SQL queries """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class GraphQLTrafficRecorderMiddleware(MiddlewareMixin):
+    """
+    Django middleware that records a sample of the operations served by
+    the GraphQLView views (query hash, query, variables, operation name,
+    latency and number of SQL queries).
+    """
+
+    def __init__(self, get_response=None):
+        filename = graphene_settings.TRAFFIC_RECORDING_FILE
+        if not filename:
+            raise MiddlewareNotUsed("GRAPHENE['TRAFFIC_RECORDING_FILE'] is not set")
+        self.sample_rate = graphene_settings.TRAFFIC_RECORDING_SAMPLE_RATE
+        self.recorder = get_recorder(
+            filename,
+            graphene_settings.TRAFFIC_RECORDING_MAX_BYTES,
+            graphene_settings.TRAFFIC_RECORDING_BACKUP_COUNT,
+        )
+        super(GraphQLTrafficRecorderMiddleware, self).__init__(get_response)
+
+    def should_record(self, request):
+        return random.random() < self.sample_rate
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        if not (view_class and issubclass(view_class, GraphQLView)):
+            return None
+        if not self.should_record(request):
+            return None
+
+        # The counters are added to the execute wrappers of the connections,
+        # so they work along with other wrappers (as the ones of DjangoDebug)
+        counter = QueryCounter()
+        wrappers = ExitStack()
+        for connection in connections.all():
+            wrappers.enter_context(connection.execute_wrapper(counter))
+        request._graphene_traffic = (time.time(), counter, wrappers)
+        return None
+
+    def process_response(self, request, response):
+        traffic = getattr(request, "_graphene_traffic", None)
+        if not traffic:
+            return response
+        del request._graphene_traffic
+
+        start_time, counter, wrappers = traffic
+        latency = (time.time() - start_time) * 1000
+        wrappers.close()
+
+        try:
+            operations = get_recorded_operations(request)
+        except Exception:
+            # Never break a response because of the recording
+            operations = []
+
+        for query, variables, operation_name in operations:
+            self.recorder.record(
+                {
+                    "timestamp": start_time,
+                    "query_hash": get_query_hash(query),
+                    "query": query,
+                    "variables": variables,
+                    "operationName": operation_name,
+                    "latency": latency,
+                    "sql_count": counter.count,
+                    "status": response.status_code,
+                    "batch_size": len(operations),
+                }
+            )
+        return response
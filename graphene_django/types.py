@@ -6,7 +6,11 @@ from graphene.relay import Connection, Node
 from graphene.types.objecttype import ObjectType, ObjectTypeOptions
 from graphene.types.utils import yank_fields_from_attrs
 
+from .aggregates import get_aggregates_field
+from .annotations import get_annotated_fields, get_count_fields
+from .auth.utils import filter_owned
 from .converter import convert_django_field_with_choices
+from .facets import get_facets_field
 from .registry import Registry, get_global_registry
 from .utils import DJANGO_FILTER_INSTALLED, get_model_fields, is_valid_django_model
 
@@ -38,6 +42,16 @@ class DjangoObjectTypeOptions(ObjectTypeOptions):
     connection = None  # type: Type[Connection]
 
     filter_fields = ()
+    search_fields = ()
+    aggregate_fields = ()
+    facet_fields = ()
+    count_fields = ()
+    # Lookups to the user that owns the objects, that must be the user of
+    # the request (in any of them)
+    owner_fields = ()
+    # The annotations added to the querysets of the connections and lists
+    # of the type when their fields are selected
+    annotations = None  # type: Dict[str, Expression]
 
 
 class DjangoObjectType(ObjectType):
@@ -50,6 +64,11 @@ class DjangoObjectType(ObjectType):
         only_fields=(),
         exclude_fields=(),
         filter_fields=None,
+        search_fields=None,
+        aggregate_fields=None,
+        facet_fields=None,
+        count_fields=(),
+        owner_fields=(),
         connection=None,
         connection_class=None,
         use_connection=None,
@@ -72,10 +91,20 @@ class DjangoObjectType(ObjectType):
         if not DJANGO_FILTER_INSTALLED and filter_fields:
             raise Exception("Can only set filter_fields if Django-Filter is installed")
 
+        if not DJANGO_FILTER_INSTALLED and search_fields:
+            raise Exception("Can only set search_fields if Django-Filter is installed")
+
         django_fields = yank_fields_from_attrs(
             construct_fields(model, registry, only_fields, exclude_fields), _as=Field
         )
 
+        annotations = OrderedDict()
+        for name, (field, expression) in get_count_fields(model, count_fields).items():
+            django_fields[name] = field
+            annotations[name] = expression
+        for name, (_, expression) in get_annotated_fields(cls).items():
+            annotations[name] = expression
+
         if use_connection is None and interfaces:
             use_connection = any(
                 (issubclass(interface, Node) for interface in interfaces)
@@ -86,6 +115,25 @@ class DjangoObjectType(ObjectType):
             if not connection_class:
                 connection_class = Connection
 
+            connection_fields = OrderedDict()
+            if aggregate_fields:
+                connection_fields["aggregates"] = get_aggregates_field(
+                    cls.__name__, model, aggregate_fields
+                )
+            if facet_fields:
+                connection_fields["facets"] = get_facets_field(
+                    cls.__name__, model, registry, facet_fields
+                )
+            if connection_fields:
+                connection_fields["Meta"] = type(
+                    str("Meta"), (object,), {"abstract": True}
+                )
+                connection_class = type(
+                    str("{}ConnectionBase".format(cls.__name__)),
+                    (connection_class,),
+                    connection_fields,
+                )
+
             connection = connection_class.create_type(
                 "{}Connection".format(cls.__name__), node=cls
             )
@@ -101,6 +149,12 @@ class DjangoObjectType(ObjectType):
         _meta.model = model
         _meta.registry = registry
         _meta.filter_fields = filter_fields
+        _meta.search_fields = search_fields
+        _meta.aggregate_fields = aggregate_fields
+        _meta.facet_fields = facet_fields
+        _meta.count_fields = count_fields
+        _meta.owner_fields = owner_fields
+        _meta.annotations = annotations
         _meta.fields = django_fields
         _meta.connection = connection
 
@@ -127,9 +181,21 @@ class DjangoObjectType(ObjectType):
         model = root._meta.model._meta.concrete_model
         return model == cls._meta.model
 
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        """
+        Restrict the objects of the type that can be returned, in the
+        connections, lists, nodes and lookups of the model mutations. By
+        default only the ones owned by the user (with owner_fields) are.
+        """
+        if cls._meta.owner_fields:
+            return filter_owned(queryset, cls._meta.owner_fields, info.context)
+        return queryset
+
     @classmethod
     def get_node(cls, info, id):
+        queryset = cls._meta.model._default_manager.all()
         try:
-            return cls._meta.model.objects.get(pk=id)
+            return cls.get_queryset(queryset, info).get(pk=id)
         except cls._meta.model.DoesNotExist:
             return None
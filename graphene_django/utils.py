@@ -1,6 +1,7 @@
 import inspect
+from collections import OrderedDict
 
-from django.db import models
+from django.db import connections, models
 from django.db.models.manager import Manager
 
 
@@ -11,12 +12,24 @@ class LazyList(object):
     pass
 
 
-try:
-    import django_filters  # noqa
+def is_module_installed(name):
+    """
+    Check whether a top level module can be imported, without actually
+    importing it (importing django_filters, for example, is costly and
+    only needed when filtering is used).
+    """
+    try:
+        from importlib.util import find_spec
+    except ImportError:  # Python 2
+        from pkgutil import find_loader as find_spec
+
+    try:
+        return find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-    DJANGO_FILTER_INSTALLED = True
-except ImportError:
-    DJANGO_FILTER_INSTALLED = False
+
+DJANGO_FILTER_INSTALLED = is_module_installed("django_filters")
 
 
 def get_reverse_fields(model, local_field_names):
@@ -56,6 +69,73 @@ def get_model_fields(model):
     return all_fields
 
 
+def get_selections(info, field_asts=None):
+    """
+    The fields selected in the given field ASTs (the ones of the field
+    being resolved by default), including the fields in their fragments,
+    as an OrderedDict of field name to the list of its field ASTs.
+    """
+    from graphql.language import ast
+
+    selections = OrderedDict()
+
+    def collect(selection_set):
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                selections.setdefault(selection.name.value, []).append(selection)
+            elif isinstance(selection, ast.InlineFragment):
+                collect(selection.selection_set)
+            elif isinstance(selection, ast.FragmentSpread):
+                collect(info.fragments[selection.name.value].selection_set)
+
+    for field_ast in field_asts or info.field_asts or ():
+        if field_ast.selection_set:
+            collect(field_ast.selection_set)
+    return selections
+
+
+def get_model_queryset(model, info):
+    """
+    The queryset of the default manager of the model, restricted by the
+    get_queryset of its DjangoObjectType (when it's registered and there is
+    a request to resolve).
+    """
+    from .registry import get_global_registry
+
+    queryset = model._default_manager.all()
+    model_type = get_global_registry().get_type_for_model(model)
+    if model_type is None or info is None:
+        return queryset
+    return model_type.get_queryset(queryset, info)
+
+
+def bulk_save(model, objs, update_fields, using):
+    """ Save the new and existing objects of the model, with bulk_create
+        and bulk_update when the database and Django support them (or one
+        by one otherwise). The new objects get their primary keys, so they
+        are only created in bulk if the database returns them.
+    """
+    manager = model._default_manager.db_manager(using)
+    created = [obj for obj in objs if obj._state.adding]
+    updated = [obj for obj in objs if not obj._state.adding]
+
+    features = connections[using].features
+    if getattr(features, "can_return_rows_from_bulk_insert", False) or getattr(
+        features, "can_return_ids_from_bulk_insert", False
+    ):
+        manager.bulk_create(created)
+    else:
+        for obj in created:
+            obj.save(using=using)
+
+    if updated and update_fields and hasattr(manager, "bulk_update"):
+        manager.bulk_update(updated, update_fields)
+    else:
+        for obj in updated:
+            obj.save(using=using)
+    return objs
+
+
 def is_valid_django_model(model):
     return inspect.isclass(model) and issubclass(model, models.Model)
 
@@ -10,12 +10,19 @@ from django.utils.decorators import method_decorator
 from django.views.generic import View
 from django.views.decorators.csrf import ensure_csrf_cookie
 
-from graphql import get_default_backend
+from graphql import get_default_backend, parse
 from graphql.error import format_error as format_graphql_error
 from graphql.error import GraphQLError
 from graphql.execution import ExecutionResult
 from graphql.type.schema import GraphQLSchema
 
+from .introspection import (
+    INTROSPECTION_FIELD_RE,
+    MAX_CACHED_INTROSPECTION_QUERIES,
+    get_introspection_cache,
+    is_introspection_document,
+    uses_introspection,
+)
 from .settings import graphene_settings
 
 
@@ -62,6 +69,8 @@ class GraphQLView(View):
     root_value = None
     pretty = False
     batch = False
+    introspection = None
+    cache_introspection = None
 
     def __init__(
         self,
@@ -73,6 +82,8 @@ class GraphQLView(View):
         pretty=False,
         batch=False,
         backend=None,
+        introspection=None,
+        cache_introspection=None,
     ):
         if not schema:
             schema = graphene_settings.SCHEMA
@@ -93,6 +104,18 @@ class GraphQLView(View):
         self.batch = self.batch or batch
         self.backend = backend
 
+        if introspection is None:
+            introspection = self.introspection
+        if introspection is None:
+            introspection = graphene_settings.INTROSPECTION_ENABLED
+        self.introspection = introspection
+
+        if cache_introspection is None:
+            cache_introspection = self.cache_introspection
+        if cache_introspection is None:
+            cache_introspection = graphene_settings.INTROSPECTION_CACHE
+        self.cache_introspection = cache_introspection
+
         assert isinstance(
             self.schema, GraphQLSchema
         ), "A Schema is required to be provided to GraphQLView."
@@ -165,6 +188,16 @@ class GraphQLView(View):
     def get_response(self, request, data, show_graphiql=False):
         query, variables, operation_name, id = self.get_graphql_params(request, data)
 
+        introspection_cache_key = self.get_introspection_cache_key(
+            request, query, operation_name, show_graphiql
+        )
+        if introspection_cache_key:
+            cached_result = get_introspection_cache(self.schema).get(
+                introspection_cache_key
+            )
+            if cached_result is not None:
+                return cached_result, 200
+
         execution_result = self.execute_graphql_request(
             request, data, query, variables, operation_name, show_graphiql
         )
@@ -188,11 +221,45 @@ class GraphQLView(View):
                 response["status"] = status_code
 
             result = self.json_encode(request, response, pretty=show_graphiql)
+
+            if introspection_cache_key and not execution_result.errors:
+                self.cache_introspection_result(
+                    introspection_cache_key, query, result
+                )
         else:
             result = None
 
         return result, status_code
 
+    def get_introspection_cache_key(self, request, query, operation_name, show_graphiql):
+        """
+        Return the key used to cache the response of the given query, or
+        None if the query can't be an introspection one.
+        """
+        if (
+            not self.introspection
+            or not self.cache_introspection
+            or self.batch
+            or show_graphiql
+            or not query
+            or not INTROSPECTION_FIELD_RE.search(query)
+        ):
+            return None
+        pretty = bool(self.pretty or request.GET.get("pretty"))
+        return (self.__class__, query, operation_name, pretty)
+
+    def cache_introspection_result(self, key, query, result):
+        cache = get_introspection_cache(self.schema)
+        if len(cache) >= MAX_CACHED_INTROSPECTION_QUERIES:
+            return
+        try:
+            document_ast = parse(query)
+        except Exception:
+            return
+        if is_introspection_document(document_ast):
+            # We store the already encoded response
+            cache[key] = result.encode("utf-8")
+
     def render_graphiql(self, request, **data):
         return render(request, self.graphiql_template, data)
 
@@ -256,6 +323,14 @@ class GraphQLView(View):
         except Exception as e:
             return ExecutionResult(errors=[e], invalid=True)
 
+        if not self.introspection:
+            document_ast = getattr(document, "document_ast", None)
+            if document_ast and uses_introspection(document_ast):
+                return ExecutionResult(
+                    errors=[GraphQLError("GraphQL introspection is not allowed.")],
+                    invalid=True,
+                )
+
         if request.method.lower() == "get":
             operation_type = document.get_operation_type(operation_name)
             if operation_type and operation_type != "query":